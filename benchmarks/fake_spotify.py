@@ -0,0 +1,430 @@
+import json
+import random
+import re
+import threading
+import time
+
+from collections import Counter
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+from crate_digger.constants import BACKFILL_START_YEAR, MAX_OFFSET
+
+
+NEW_RELEASE_DAYS = 14
+MAX_SEARCH_LIMIT = 50
+MAX_PAGE_LIMIT = 50
+MAX_IDS = 20
+MAX_PLAYLIST_ADD = 100
+NAME_WORDS = (
+    "Acid Bass Cosmic Deep Echo Filter Groove Haze Infinite Jack Kick Loop Mono "
+    "Night Orbit Pulse Quartz Rave Signal Tape Utopia Vinyl Wave Xylo Yonder Zone"
+).split()
+
+
+class FakeCatalog:
+    """Deterministic catalog of labels, albums and tracks served by the fake API.
+
+    Every label gets `albums_per_label` albums spread from BACKFILL_START_YEAR
+    to today, `new_per_label` of them released within the last week. A share
+    of each label's albums (`decoy_ratio`) is released on a look-alike label,
+    so searches return candidates the exact-label filter has to drop. Every
+    third track is an extended mix of the one before it. Only full track
+    objects (`track`) carry an ISRC, as in the real API.
+    """
+
+    def __init__(
+        self,
+        labels: List[str],
+        albums_per_label: int = 100,
+        tracks_per_album: int = 6,
+        new_per_label: int = 3,
+        decoy_ratio: float = 0.1,
+        seed: int = 0,
+    ) -> None:
+        self.labels = list(labels)
+        self.albums: Dict[str, Dict] = {}
+        self.tracks: Dict[str, Dict] = {}
+
+        rng = random.Random(seed)
+        today = date.today()
+        first_day = date(BACKFILL_START_YEAR, 1, 1)
+        span = (today - first_day).days
+
+        for label_index, label in enumerate(self.labels):
+            for album_index in range(albums_per_label):
+                if album_index < new_per_label:
+                    release_date = today - timedelta(days=1 + album_index % 7)
+                else:
+                    release_date = first_day + timedelta(days=rng.randrange(span))
+
+                album_label = (
+                    f"{label} Digital" if rng.random() < decoy_ratio else label
+                )
+                album_id = f"al{label_index:03d}x{album_index:06d}"
+                album_name = " ".join(rng.sample(NAME_WORDS, 2))
+                self._add_album(
+                    album_id,
+                    f"{album_name} {album_index}",
+                    album_label,
+                    release_date.isoformat(),
+                    tracks_per_album,
+                )
+
+    def _add_album(
+        self, album_id: str, name: str, label: str, release_date: str, n_tracks: int
+    ) -> None:
+        artist = {"name": f"Artist {album_id[-3:]}"}
+        album = {
+            "id": album_id,
+            "uri": f"spotify:album:{album_id}",
+            "name": name,
+            "label": label,
+            "release_date": release_date,
+            "album_type": "single",
+            "artists": [artist],
+            "images": [],
+            "available_markets": ["PL"],
+            "external_urls": {"spotify": f"https://open.spotify.com/album/{album_id}"},
+            "track_ids": [],
+        }
+
+        for track_number in range(n_tracks):
+            track_id = f"{album_id}t{track_number:03d}"
+            name = (
+                f"Track {album_id} {track_number - 1} (Extended Mix)"
+                if track_number % 3 == 2
+                else f"Track {album_id} {track_number}"
+            )
+            self.tracks[track_id] = {
+                "id": track_id,
+                "uri": f"spotify:track:{track_id}",
+                "name": name,
+                "artists": [artist],
+                "track_number": track_number + 1,
+            }
+            album["track_ids"].append(track_id)
+
+        self.albums[album_id] = album
+
+    def simplified_album(self, album_id: str) -> Dict:
+        album = self.albums[album_id]
+        return {k: v for k, v in album.items() if k not in ("label", "track_ids")}
+
+    def track(self, track_id: str) -> Dict:
+        album_id = track_id.split("t")[0]
+        return {
+            **self.tracks[track_id],
+            "album": self.simplified_album(album_id),
+            "external_ids": {"isrc": f"ZZ{track_id.upper()}"},
+        }
+
+    def search_albums(self, query: str) -> List[str]:
+        """Return the IDs of albums matching a `label:` search, in catalog order."""
+
+        match = re.search(r"label:(?P<label>.+?)(?= (?:tag|year):|$)", query)
+        if match is None:
+            return []
+
+        label = match.group("label").strip().strip('"').lower()
+        year_match = re.search(r"year:(\d{4})(?:-(\d{4}))?", query)
+        hipster = "tag:hipster" in query
+        terms = [
+            t
+            for t in query[match.end() :].split()
+            if not t.startswith(("tag:", "year:"))
+        ]
+        new_since = (
+            (date.today() - timedelta(days=NEW_RELEASE_DAYS)).isoformat()
+            if "tag:new" in query
+            else None
+        )
+
+        album_ids = []
+        for album_id, album in self.albums.items():
+            if label not in album["label"].replace("'", "").lower():
+                continue
+            if new_since is not None and album["release_date"] < new_since:
+                continue
+            if year_match is not None:
+                first = int(year_match.group(1))
+                last = int(year_match.group(2) or first)
+                if not first <= int(album["release_date"][:4]) <= last:
+                    continue
+            if hipster and int(album_id[-1]) != 0:
+                continue
+            words = album["name"].lower().split()
+            if not all(any(w.startswith(t) for w in words) for t in terms):
+                continue
+            album_ids.append(album_id)
+
+        return album_ids
+
+
+class FakeSpotifyServer:
+    """Local HTTP stand-in of the Spotify Web API endpoints used by crate_digger.
+
+    Point a client at it with `prefix=server.prefix` and any static token.
+    Every request sleeps for `latency` seconds; `error_rate` and `throttle_rate`
+    are the shares of requests answered with a 503 and a 429 (with
+    `Retry-After: retry_after`) respectively. Served requests are counted per
+    endpoint in `stats()`.
+    """
+
+    def __init__(
+        self,
+        catalog: FakeCatalog,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: int = 0,
+        page_size: int = MAX_PAGE_LIMIT,
+        seed: int = 0,
+    ) -> None:
+        self.catalog = catalog
+        self.latency = latency
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.page_size = page_size
+        self.playlists: Dict[str, List[str]] = {}
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._counts: Counter = Counter()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def prefix(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1/"
+
+    def __enter__(self) -> "FakeSpotifyServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of requests served per endpoint (and injected errors)."""
+
+        with self._lock:
+            return dict(sorted(self._counts.items()))
+
+    def reset(self) -> None:
+        """Clear the request counters and every playlist created so far."""
+
+        with self._lock:
+            self._counts.clear()
+            self.playlists.clear()
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] += 1
+
+    def _injected_failure(self) -> int | None:
+        with self._lock:
+            roll = self._rng.random()
+
+        if roll < self.throttle_rate:
+            self._count("injected:429")
+            return 429
+        if roll < self.throttle_rate + self.error_rate:
+            self._count("injected:503")
+            return 503
+        return None
+
+    def handle(
+        self, method: str, path: str, query: Dict[str, str], body: object
+    ) -> Tuple[int, object]:
+        """Route one request to an endpoint and return (status, JSON body)."""
+
+        parts = path.strip("/").split("/")[1:]
+
+        match method, parts:
+            case "GET", ["search"]:
+                self._count("search")
+                return self._search(query)
+            case "GET", ["albums"]:
+                self._count("albums")
+                return self._albums(query)
+            case "GET", ["albums", album_id, "tracks"]:
+                self._count("album_tracks")
+                return self._album_tracks(album_id, query)
+            case "GET", ["tracks"]:
+                self._count("tracks")
+                ids = query.get("ids", "").split(",")
+                return 200, {"tracks": [self.catalog.track(i) for i in ids]}
+            case "GET", ["tracks", track_id]:
+                self._count("track")
+                return 200, self.catalog.track(track_id)
+            case "GET", ["me"]:
+                self._count("me")
+                return 200, {"id": "benchmark"}
+            case "POST", ["users", _, "playlists"]:
+                self._count("playlist_create")
+                return self._create_playlist(body)
+            case "GET", ["playlists", playlist_id, "items" | "tracks"]:
+                self._count("playlist_items")
+                return self._playlist_items(playlist_id, query)
+            case "POST", ["playlists", playlist_id, "items" | "tracks"]:
+                self._count("playlist_add_items")
+                return self._add_playlist_items(playlist_id, body)
+            case _:
+                self._count("unknown")
+                return 404, {"error": {"status": 404, "message": "Not found"}}
+
+    def _page(
+        self, path: str, query: Dict[str, str], items: List, limit_cap: int
+    ) -> Dict:
+        limit = min(int(query.get("limit", 20)), limit_cap)
+        offset = int(query.get("offset", 0))
+        next_offset = offset + limit
+        next_url = None
+        if next_offset < len(items):
+            params = {**query, "limit": limit, "offset": next_offset}
+            next_url = f"{self.prefix}{path}?{urlencode(params)}"
+
+        return {
+            "items": items[offset:next_offset],
+            "limit": limit,
+            "offset": offset,
+            "total": len(items),
+            "next": next_url,
+        }
+
+    def _search(self, query: Dict[str, str]) -> Tuple[int, object]:
+        if int(query.get("offset", 0)) + int(query.get("limit", 10)) > MAX_OFFSET:
+            return 400, {"error": {"status": 400, "message": "Invalid offset"}}
+
+        album_ids = self.catalog.search_albums(query.get("q", ""))
+        albums = [self.catalog.simplified_album(i) for i in album_ids]
+        page = self._page("search", query, albums, MAX_SEARCH_LIMIT)
+        page["total"] = min(page["total"], MAX_OFFSET)
+        return 200, {"albums": page}
+
+    def _full_album(self, album_id: str) -> Dict | None:
+        album = self.catalog.albums.get(album_id)
+        if album is None:
+            return None
+
+        tracks = [self.catalog.tracks[t] for t in album["track_ids"]]
+        page = self._page(
+            f"albums/{album_id}/tracks",
+            {"limit": str(self.page_size)},
+            tracks,
+            MAX_PAGE_LIMIT,
+        )
+        return {
+            **self.catalog.simplified_album(album_id),
+            "label": album["label"],
+            "tracks": page,
+        }
+
+    def _albums(self, query: Dict[str, str]) -> Tuple[int, object]:
+        ids = query.get("ids", "").split(",")
+        if len(ids) > MAX_IDS:
+            return 400, {"error": {"status": 400, "message": "Too many ids requested"}}
+
+        return 200, {"albums": [self._full_album(i) for i in ids]}
+
+    def _album_tracks(self, album_id: str, query: Dict[str, str]) -> Tuple[int, object]:
+        album = self.catalog.albums.get(album_id)
+        if album is None:
+            return 404, {"error": {"status": 404, "message": "Non existing id"}}
+
+        tracks = [self.catalog.tracks[t] for t in album["track_ids"]]
+        return 200, self._page(
+            f"albums/{album_id}/tracks", query, tracks, MAX_PAGE_LIMIT
+        )
+
+    def _create_playlist(self, body: object) -> Tuple[int, object]:
+        with self._lock:
+            playlist_id = f"pl{len(self.playlists):06d}"
+            self.playlists[playlist_id] = []
+
+        return 201, {
+            "id": playlist_id,
+            "uri": f"spotify:playlist:{playlist_id}",
+            "name": body["name"] if isinstance(body, dict) else "",
+            "external_urls": {
+                "spotify": f"https://open.spotify.com/playlist/{playlist_id}"
+            },
+        }
+
+    def _playlist_items(
+        self, playlist_id: str, query: Dict[str, str]
+    ) -> Tuple[int, object]:
+        items = [{"track": {"uri": uri}} for uri in self.playlists.get(playlist_id, [])]
+        return 200, self._page(f"playlists/{playlist_id}/items", query, items, 100)
+
+    def _add_playlist_items(self, playlist_id: str, body: object) -> Tuple[int, object]:
+        uris = body.get("uris", []) if isinstance(body, dict) else body or []
+        if len(uris) > MAX_PLAYLIST_ADD:
+            return 400, {"error": {"status": 400, "message": "Too many items"}}
+
+        with self._lock:
+            self.playlists.setdefault(playlist_id, []).extend(uris)
+            snapshot_id = f"snapshot{len(self.playlists[playlist_id])}"
+
+        return 201, {"snapshot_id": snapshot_id}
+
+
+def _make_handler(server: FakeSpotifyServer) -> type:
+    class FakeSpotifyHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            self._dispatch("GET")
+
+        def do_POST(self) -> None:
+            self._dispatch("POST")
+
+        def _dispatch(self, method: str) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            raw_body = self.rfile.read(length) if length else b""
+
+            if server.latency:
+                time.sleep(server.latency)
+
+            status = server._injected_failure()
+            headers = {}
+            if status == 429:
+                body = {"error": {"status": 429, "message": "API rate limit exceeded"}}
+                headers["Retry-After"] = str(server.retry_after)
+            elif status == 503:
+                body = {"error": {"status": 503, "message": "Service unavailable"}}
+            else:
+                url = urlsplit(self.path)
+                query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+                status, body = server.handle(
+                    method, url.path, query, json.loads(raw_body) if raw_body else None
+                )
+
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+    return FakeSpotifyHandler
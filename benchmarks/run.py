@@ -0,0 +1,251 @@
+"""Benchmark the release pipelines against a local fake Spotify Web API.
+
+Usage:
+    uv run python -m benchmarks.run [--scenario daily backfill] [--latency 0.05] ...
+
+Each scenario runs on a fresh client against the same catalog and reports
+wall time, requests served per endpoint and peak traced memory.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+import tracemalloc
+
+from typing import Callable, Dict, List, TypedDict
+
+from spotipy import Spotify
+
+from benchmarks.fake_spotify import FakeCatalog, FakeSpotifyServer
+from crate_digger.constants import CATCH_UP_DAYS, MAX_WORKERS, SEARCH_MAX_LIMIT
+from crate_digger.utils.cache import CachedSpotify, MemoryResponseCache, ResponseCache
+from crate_digger.utils.ratelimit import RateLimiter
+from crate_digger.utils.spotify import (
+    backfill_labels,
+    collect_tracks_from_albums,
+    create_playlists,
+    fetch_all_release_uris,
+    fetch_and_add,
+)
+
+try:
+    from crate_digger.utils.async_spotify import AsyncSpotify, async_fetch_and_add
+except ImportError:
+    AsyncSpotify = None
+
+
+TARGET_PLAYLIST = "spotify:playlist:target"
+
+
+class BenchmarkResult(TypedDict):
+    """Measurements of a single scenario run."""
+
+    scenario: str
+    wall_seconds: float
+    peak_memory_kib: float
+    requests: int
+    requests_per_endpoint: Dict[str, int]
+
+
+def make_client(
+    server: FakeSpotifyServer,
+    rate: float,
+    cache: ResponseCache | None = None,
+) -> Spotify:
+    """Create a rate-limited (and optionally caching) client for the fake server."""
+
+    client = CachedSpotify(
+        auth="benchmark",
+        limiter=RateLimiter(rate=rate, burst=max(int(rate), 1)),
+        cache=cache,
+        backoff_factor=0,
+    )
+    client.prefix = server.prefix
+    return client
+
+
+def run_daily(client: Spotify, labels: List[str], max_workers: int) -> None:
+    fetch_and_add(
+        client,
+        labels,
+        TARGET_PLAYLIST,
+        max_workers=max_workers,
+        n_days=CATCH_UP_DAYS,
+    )
+
+
+def run_backfill(client: Spotify, labels: List[str], max_workers: int) -> None:
+    label = labels[0]
+    release_uris = fetch_all_release_uris(
+        client, label, max_workers=max_workers, page_size=SEARCH_MAX_LIMIT
+    )
+    tracks = collect_tracks_from_albums(client, release_uris, label)
+    create_playlists(client, label, tracks)
+
+
+def run_backfill_all(client: Spotify, labels: List[str], max_workers: int) -> None:
+    backfill_labels(client, labels, max_workers, page_size=SEARCH_MAX_LIMIT)
+
+
+def run_daily_async(
+    server: FakeSpotifyServer,
+    labels: List[str],
+    rate: float,
+    cache: ResponseCache | None = None,
+) -> None:
+    if AsyncSpotify is None:
+        raise SystemExit("The daily-async scenario requires the 'async' extra")
+
+    async def _main() -> None:
+        async with AsyncSpotify(
+            auth="benchmark",
+            limiter=RateLimiter(rate=rate, burst=max(int(rate), 1)),
+            cache=cache,
+            prefix=server.prefix,
+            backoff_factor=0,
+        ) as client:
+            await async_fetch_and_add(
+                client, labels, TARGET_PLAYLIST, n_days=CATCH_UP_DAYS
+            )
+
+    asyncio.run(_main())
+
+
+SCENARIOS = ("daily", "daily-async", "backfill", "backfill-all")
+
+
+def measure(
+    name: str, server: FakeSpotifyServer, run: Callable[[], None]
+) -> BenchmarkResult:
+    """Run one scenario and collect its wall time, request counts and peak memory."""
+
+    server.reset()
+    tracemalloc.start()
+    started_at = time.perf_counter()
+
+    try:
+        run()
+    finally:
+        wall_seconds = time.perf_counter() - started_at
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    per_endpoint = server.stats()
+    return {
+        "scenario": name,
+        "wall_seconds": round(wall_seconds, 3),
+        "peak_memory_kib": round(peak / 1024, 1),
+        "requests": sum(n for k, n in per_endpoint.items() if ":" not in k),
+        "requests_per_endpoint": per_endpoint,
+    }
+
+
+def format_result(result: BenchmarkResult) -> str:
+    endpoints = ", ".join(
+        f"{k}={n}" for k, n in result["requests_per_endpoint"].items()
+    )
+    return (
+        f"{result['scenario']:<12} {result['wall_seconds']:>8.3f}s "
+        f"{result['peak_memory_kib']:>10.1f} KiB {result['requests']:>6} requests "
+        f"({endpoints})"
+    )
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scenario", nargs="+", choices=SCENARIOS, default=["daily", "backfill"]
+    )
+    parser.add_argument("--labels", type=int, default=20, help="catalog labels")
+    parser.add_argument("--albums-per-label", type=int, default=200)
+    parser.add_argument("--tracks-per-album", type=int, default=6)
+    parser.add_argument("--new-per-label", type=int, default=3)
+    parser.add_argument(
+        "--page-size", type=int, default=50, help="tracks embedded per album page"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.02, help="seconds added to every request"
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 503s")
+    parser.add_argument(
+        "--throttle-rate", type=float, default=0.0, help="share of 429s"
+    )
+    parser.add_argument(
+        "--rate", type=float, default=1_000.0, help="client requests per second"
+    )
+    parser.add_argument("--max-workers", type=int, default=MAX_WORKERS)
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="share an in-memory response cache between repeats",
+    )
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", dest="json_path", help="also write results here")
+    parser.add_argument("--verbose", action="store_true", help="keep pipeline logs")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] | None = None) -> List[BenchmarkResult]:
+    args = parse_args(argv)
+    if not args.verbose:
+        logging.disable(logging.INFO)
+
+    try:
+        return run_benchmarks(args)
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+def run_benchmarks(args: argparse.Namespace) -> List[BenchmarkResult]:
+    """Serve a fake catalog and measure every requested scenario on it."""
+
+    labels = [f"Bench Label {i:02d}" for i in range(args.labels)]
+    catalog = FakeCatalog(
+        labels,
+        albums_per_label=args.albums_per_label,
+        tracks_per_album=args.tracks_per_album,
+        new_per_label=args.new_per_label,
+        seed=args.seed,
+    )
+    cache = MemoryResponseCache() if args.cache else None
+    results: List[BenchmarkResult] = []
+
+    with FakeSpotifyServer(
+        catalog,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        page_size=args.page_size,
+        seed=args.seed,
+    ) as server:
+        runs: Dict[str, Callable[[], None]] = {
+            "daily": lambda: run_daily(
+                make_client(server, args.rate, cache), labels, args.max_workers
+            ),
+            "daily-async": lambda: run_daily_async(server, labels, args.rate, cache),
+            "backfill": lambda: run_backfill(
+                make_client(server, args.rate, cache), labels, args.max_workers
+            ),
+            "backfill-all": lambda: run_backfill_all(
+                make_client(server, args.rate, cache), labels, args.max_workers
+            ),
+        }
+
+        for _ in range(args.repeat):
+            for name in args.scenario:
+                result = measure(name, server, runs[name])
+                print(format_result(result))
+                results.append(result)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,67 @@
 SEARCH_LIMIT = 10
+SEARCH_MAX_LIMIT = 50
 FETCH_BATCH_SIZE = 20
+TRACKS_BATCH_SIZE = 50
+TITLE_CACHE_SIZE = 65_536
+VERSION_PREFERENCE = ("original", "radio edit", "extended")
+NEAR_DUPLICATE_IGNORED_TOKENS = (
+    "feat",
+    "ft",
+    "featuring",
+    "vip",
+    "remaster",
+    "remastered",
+)
+NEAR_DUPLICATE_THRESHOLD = 0.65
+MINHASH_PERMUTATIONS = 16
+LSH_BANDS = 8
+LSH_MAX_REPRESENTATIVES = 32
+ALBUM_TRACKS_LIMIT = 50
 MAX_OFFSET = 1000
 
+PLAYLIST_ADD_BATCH_SIZE = 100
+PLAYLIST_PAGE_SIZE = 100
+PLAYLIST_ITEMS_FIELDS = "items(track(uri)),next"
+USER_PLAYLISTS_PAGE_SIZE = 50
+WRITE_RETRIES = 3
+WRITE_RETRY_BACKOFF = 1.0
+
+MAX_WORKERS = 8
+ASYNC_MAX_IN_FLIGHT = 16
+ASYNC_MAX_CONNECTIONS = 16
+
+REQUESTS_PER_SECOND = 10.0
+REQUEST_BURST = 10
+THROTTLE_RETRIES = 5
+MAX_RETRY_AFTER = 300
+
+CATCH_UP_DAYS = 7
+FINGERPRINT_MAX_AGE_DAYS = 365
+
+STATE_DIR = ".crate_digger"
+RELEASE_STORE_FILENAME = "releases.sqlite3"
+RESPONSE_CACHE_FILENAME = "responses.sqlite3"
+METRICS_DIRNAME = "metrics"
+METRICS_MAX_FILES = 30
+BACKFILL_DIRNAME = "backfill"
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CACHE_MAX_ENTRIES = 20_000
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+CACHE_TTLS = {
+    "search:new": 60 * 60,
+    "search": 7 * 24 * 60 * 60,
+    "albums": 90 * 24 * 60 * 60,
+    "album_tracks": 90 * 24 * 60 * 60,
+    "tracks": 90 * 24 * 60 * 60,
+}
+
 BACKFILL_START_YEAR = 1990
+BACKFILL_RANGE_YEARS = 10
+PARTITION_TAGS = ("tag:new", "tag:hipster")
+PARTITION_TERMS = tuple("abcdefghijklmnopqrstuvwxyz0123456789")
+PARTITION_MAX_DEPTH = 2
 
 MARKDOWN_V2_ESCAPE_CHARS = r"_*[]()~`>#+-=|{}.!"
 
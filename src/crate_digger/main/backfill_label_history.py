@@ -1,23 +1,119 @@
-import sys
+import argparse
+import asyncio
 
+from crate_digger.constants import MAX_WORKERS, SEARCH_MAX_LIMIT
+from crate_digger.utils.cache import DiskResponseCache
+from crate_digger.utils.config import get_settings
+from crate_digger.utils.journal import open_backfill_journal
+from crate_digger.utils.metrics import write_run_metrics
 from crate_digger.utils.spotify import (
     get_spotify_client,
-    fetch_all_release_uris,
-    collect_tracks_from_albums,
-    create_playlists,
+    backfill_labels,
+    log_backfill_summary,
+    refresh_labels,
 )
 
 
-if len(sys.argv) < 2:
-    print("Usage: python backfill_label_history.py '<label name>'")
-    sys.exit(1)
+SCOPE = "playlist-modify-private playlist-read-private"
 
-label = " ".join(sys.argv[1:])
 
-sp = get_spotify_client("playlist-modify-private")
+async def backfill_labels_async(labels, cache, journals, near_duplicates):
+    from crate_digger.utils.async_spotify import (
+        async_backfill_labels,
+        get_async_spotify_client,
+    )
 
-release_uris = fetch_all_release_uris(sp, label)
+    async with get_async_spotify_client(
+        SCOPE, cache, cache_scope="playlist-modify-private"
+    ) as sp:
+        summary = await async_backfill_labels(
+            sp,
+            labels,
+            page_size=SEARCH_MAX_LIMIT,
+            journals=journals,
+            near_duplicates=near_duplicates,
+        )
+    return summary, sp.limiter
 
-uris_to_add = collect_tracks_from_albums(sp, release_uris, label)
 
-create_playlists(sp, label, uris_to_add)
+parser = argparse.ArgumentParser(
+    description="Backfill label histories into numbered playlists"
+)
+parser.add_argument("labels", nargs="*", help="label names (quote multi-word names)")
+parser.add_argument(
+    "--all",
+    dest="all_labels",
+    action="store_true",
+    help="backfill every label in config.toml",
+)
+parser.add_argument(
+    "--refresh",
+    action="store_true",
+    help="append releases newer than each label's last numbered playlist",
+)
+parser.add_argument(
+    "--near-duplicates",
+    choices=("report", "collapse"),
+    help="log near-duplicate tracks of each catalog, or drop all but the earliest",
+)
+parser.add_argument(
+    "--async",
+    dest="use_async",
+    action="store_true",
+    help="use the asyncio client (requires the 'async' extra; not with --refresh)",
+)
+args = parser.parse_args()
+
+labels = list(args.labels)
+if args.all_labels:
+    labels.extend(get_settings()["labels"]["names"])
+labels = list(dict.fromkeys(labels))
+
+if not labels:
+    parser.error("give at least one label name or --all")
+if args.use_async and args.refresh:
+    parser.error("--refresh is not supported with --async")
+
+cache = DiskResponseCache()
+
+if args.refresh:
+    sp = get_spotify_client(SCOPE, cache=cache, cache_scope="playlist-modify-private")
+    limiter = sp.limiter
+    summary = refresh_labels(
+        sp, labels, max_workers=MAX_WORKERS, page_size=SEARCH_MAX_LIMIT
+    )
+else:
+    try:
+        journals = {
+            label: open_backfill_journal(label, near_duplicates=args.near_duplicates)
+            for label in labels
+        }
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.use_async:
+        summary, limiter = asyncio.run(
+            backfill_labels_async(labels, cache, journals, args.near_duplicates)
+        )
+    else:
+        sp = get_spotify_client(
+            SCOPE, cache=cache, cache_scope="playlist-modify-private"
+        )
+        limiter = sp.limiter
+        summary = backfill_labels(
+            sp,
+            labels,
+            max_workers=MAX_WORKERS,
+            page_size=SEARCH_MAX_LIMIT,
+            journals=journals,
+            near_duplicates=args.near_duplicates,
+        )
+    for journal in journals.values():
+        journal.archive()
+
+log_backfill_summary(summary)
+
+write_run_metrics(
+    "backfill_label_history",
+    {"rate_limiter": limiter.stats(), "cache": cache.stats(), "labels": summary},
+)
@@ -1,15 +1,65 @@
+import argparse
+import asyncio
+
+from crate_digger.constants import CATCH_UP_DAYS, MAX_WORKERS
+from crate_digger.utils.cache import DiskResponseCache
 from crate_digger.utils.spotify import get_spotify_client, fetch_and_add
 from crate_digger.utils.config import get_settings
+from crate_digger.utils.metrics import write_run_metrics
+from crate_digger.utils.state import open_release_store
 from crate_digger.utils.telegram import construct_message, send_message
 
 
-config = get_settings()
-sp = get_spotify_client("playlist-modify-private")
+async def fetch_and_add_async(config, cache, store):
+    from crate_digger.utils.async_spotify import (
+        async_fetch_and_add,
+        get_async_spotify_client,
+    )
+
+    async with get_async_spotify_client("playlist-modify-private", cache) as sp:
+        track_info = await async_fetch_and_add(
+            sp,
+            config["labels"]["names"],
+            config["spotify"]["to_listen_playlist"],
+            n_days=CATCH_UP_DAYS,
+            store=store,
+        )
+    return track_info, sp.limiter
 
-track_info_to_send = fetch_and_add(
-    sp, config["labels"]["names"], config["spotify"]["to_listen_playlist"]
+
+parser = argparse.ArgumentParser(description="Add new label releases to a playlist")
+parser.add_argument(
+    "--async",
+    dest="use_async",
+    action="store_true",
+    help="use the asyncio client (requires the 'async' extra)",
 )
+args = parser.parse_args()
+
+config = get_settings()
+cache = DiskResponseCache()
+store = open_release_store()
+
+if args.use_async:
+    track_info_to_send, limiter = asyncio.run(fetch_and_add_async(config, cache, store))
+else:
+    sp = get_spotify_client("playlist-modify-private", cache=cache)
+    limiter = sp.limiter
+    track_info_to_send = fetch_and_add(
+        sp,
+        config["labels"]["names"],
+        config["spotify"]["to_listen_playlist"],
+        max_workers=MAX_WORKERS,
+        n_days=CATCH_UP_DAYS,
+        store=store,
+    )
+store.close()
 
 if track_info_to_send:
     message = construct_message(track_info_to_send)
     send_message(message)
+
+write_run_metrics(
+    "fetch_new_releases",
+    {"rate_limiter": limiter.stats(), "cache": cache.stats()},
+)
@@ -0,0 +1,1062 @@
+import asyncio
+import re
+import sqlite3
+import time
+
+from datetime import date
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+try:
+    import httpx
+except ImportError as e:  # pragma: no cover - depends on the installed extras
+    raise ImportError(
+        "The asyncio Spotify client requires httpx; install the 'async' extra"
+    ) from e
+
+from spotipy import Spotify, SpotifyException
+from spotipy.oauth2 import SpotifyOAuth
+
+from crate_digger.constants import (
+    ALBUM_TRACKS_LIMIT,
+    ASYNC_MAX_CONNECTIONS,
+    ASYNC_MAX_IN_FLIGHT,
+    BACKFILL_RANGE_YEARS,
+    BACKFILL_START_YEAR,
+    FETCH_BATCH_SIZE,
+    MAX_OFFSET,
+    MAX_RETRY_AFTER,
+    PARTITION_MAX_DEPTH,
+    PLAYLIST_ADD_BATCH_SIZE,
+    PLAYLIST_ITEMS_FIELDS,
+    PLAYLIST_PAGE_SIZE,
+    SEARCH_LIMIT,
+    SEARCH_MAX_LIMIT,
+    THROTTLE_RETRIES,
+    TRACKS_BATCH_SIZE,
+    WRITE_RETRIES,
+)
+from crate_digger.utils.cache import ResponseCache, cache_endpoint, cache_key
+from crate_digger.utils.concurrency import gather_concurrently
+from crate_digger.utils.journal import BackfillJournal
+from crate_digger.utils.logging import get_logger, pluralize
+from crate_digger.utils.metrics import (
+    CallStats,
+    RunMetrics,
+    get_run_metrics,
+    new_call_stats,
+    request_endpoint,
+    stage,
+)
+from crate_digger.utils.ratelimit import RateLimiter, parse_retry_after
+from crate_digger.utils.spotify import (
+    ReleaseTracks,
+    backfill_search_query,
+    batch,
+    candidate_release_uris,
+    compact_release,
+    extract_isrcs,
+    extract_track_uris,
+    filter_recent_releases,
+    get_auth_manager,
+    has_next_search_page,
+    is_transient_write_error,
+    journaled_release_years,
+    journaled_search_shards,
+    label_albums,
+    log_remaining_track_pages,
+    log_search_coverage,
+    log_truncated_search,
+    lookup_tracks,
+    make_search_shard,
+    merge_album_tracks,
+    merge_label_results,
+    merge_refined_shards,
+    new_releases_query,
+    parse_releases,
+    plan_remaining_track_pages,
+    plan_search_pages,
+    playlist_date_range,
+    record_processed_releases,
+    record_rejected_releases,
+    record_track_fingerprints,
+    refine_query,
+    released_track_uris,
+    resolve_near_duplicates,
+    select_exact_label_releases,
+    select_new_track_uris,
+    select_pending_album_tracks,
+    select_release_tracks,
+    select_release_years,
+    select_unseen_tracks,
+    split_journaled_albums,
+    write_retry_delay,
+    year_ranges,
+)
+from crate_digger.utils.state import filter_unprocessed_releases
+from crate_digger.utils.types import (
+    BackfillSummary,
+    ReleasedTrack,
+    SearchShard,
+    SpotifyAlbum,
+    SpotifyAlbumPage,
+    SpotifyTrack,
+)
+
+
+logger = get_logger(__name__)
+
+API_PREFIX = "https://api.spotify.com/v1/"
+SERVER_ERROR_CODES = (500, 502, 503, 504)
+
+
+def _get_id(kind: str, id: str) -> str:
+    """Extract a base-62 ID from a Spotify URI, URL or raw ID (as spotipy does)."""
+
+    uri_match = re.search(Spotify._regex_spotify_uri, id)
+    if uri_match is not None and uri_match.group("type") == kind:
+        return uri_match.group("id")
+
+    url_match = re.search(Spotify._regex_spotify_url, id)
+    if url_match is not None and url_match.group("type") == kind:
+        return url_match.group("id")
+
+    if re.search(Spotify._regex_base62, id) is not None:
+        return id
+
+    raise SpotifyException(400, -1, f"Unsupported {kind} URL / URI: {id}")
+
+
+class AsyncSpotify:
+    """Asyncio client for the Spotify Web API endpoints used by crate_digger.
+
+    Requests share one pooled `httpx.AsyncClient`, the same RateLimiter and
+    ResponseCache semantics as the blocking client (cache keys are compatible,
+    so both clients can share a cache), and the OAuth token from the existing
+    spotipy cache file. Like the blocking client, only GETs are retried on
+    server errors and dropped connections; a POST may already have been
+    applied, so its caller decides how to retry it.
+    """
+
+    def __init__(
+        self,
+        auth: str | None = None,
+        auth_manager: SpotifyOAuth | None = None,
+        limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        max_connections: int = ASYNC_MAX_CONNECTIONS,
+        requests_timeout: float = 5,
+        status_retries: int = Spotify.max_retries,
+        backoff_factor: float = 0.3,
+        throttle_retries: int = THROTTLE_RETRIES,
+        prefix: str = API_PREFIX,
+        transport: httpx.AsyncBaseTransport | None = None,
+        metrics: RunMetrics | None = None,
+    ) -> None:
+        self._auth = auth
+        self._auth_manager = auth_manager
+        self._token_info: Dict | None = None
+        self._token_lock = asyncio.Lock()
+
+        self.limiter = limiter or RateLimiter()
+        self.cache = cache
+        self.metrics = metrics or get_run_metrics()
+        self.prefix = prefix
+        self.status_retries = status_retries
+        self.backoff_factor = backoff_factor
+        self.throttle_retries = throttle_retries
+
+        self._http = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            timeout=requests_timeout,
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> "AsyncSpotify":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the connection pool."""
+
+        await self._http.aclose()
+
+    async def _access_token(self) -> str:
+        if self._auth is not None:
+            return self._auth
+
+        if self._auth_manager is None:
+            raise SpotifyException(401, -1, "No access token or auth manager given")
+
+        async with self._token_lock:
+            if self._token_info is None or self._auth_manager.is_token_expired(
+                self._token_info
+            ):
+                # Refreshing may hit the accounts service; keep it off the event loop
+                await asyncio.to_thread(
+                    self._auth_manager.get_access_token, None, False
+                )
+                self._token_info = self._auth_manager.cache_handler.get_cached_token()
+
+            if self._token_info is None:
+                raise SpotifyException(401, -1, "No cached Spotify token found")
+
+            return self._token_info["access_token"]
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        params: Mapping | None = None,
+        payload: object = None,
+    ):
+        relative_url = url.removeprefix(self.prefix)
+        call = new_call_stats()
+        started_at = time.perf_counter()
+        error = True
+
+        try:
+            result = await self._send(
+                method, relative_url, dict(params or {}), payload, call
+            )
+            error = False
+            return result
+        finally:
+            self.metrics.observe_call(
+                request_endpoint(method, relative_url),
+                time.perf_counter() - started_at,
+                call,
+                error,
+            )
+
+    async def _send(
+        self,
+        method: str,
+        relative_url: str,
+        params: Dict,
+        payload: object,
+        call: CallStats,
+    ):
+        cache = self.cache if method == "GET" else None
+        endpoint = cache_endpoint(relative_url, params) if cache is not None else None
+
+        key = cache_key(relative_url, params)
+        if cache is not None and endpoint is not None:
+            cached = cache.get(endpoint, key)
+            if cached is not None:
+                return cached
+
+        n_throttled = n_failed = 0
+
+        while True:
+            delay = self.limiter.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            call["http_requests"] += 1
+            try:
+                response = await self._http.request(
+                    method,
+                    httpx.URL(self.prefix + relative_url).copy_merge_params(
+                        {k: v for k, v in params.items() if v is not None}
+                    ),
+                    json=payload,
+                    headers={"Authorization": f"Bearer {await self._access_token()}"},
+                )
+            except httpx.TransportError:
+                if method != "GET" or n_failed >= self.status_retries:
+                    raise
+                await asyncio.sleep(self.backoff_factor * 2**n_failed)
+                n_failed += 1
+                continue
+
+            call["throttled"] += int(response.status_code == 429)
+            call["bytes_sent"] += len(response.request.content)
+            call["bytes_received"] += len(response.content)
+
+            if response.status_code == 429 and n_throttled < self.throttle_retries:
+                retry_after = parse_retry_after(response.headers)
+                if retry_after > MAX_RETRY_AFTER:
+                    logger.error(f"Spotify asked to wait {retry_after:.0f}s, giving up")
+                    break
+
+                logger.warning(f"Rate limited by Spotify, pausing for {retry_after}s")
+                self.limiter.pause(retry_after)
+                n_throttled += 1
+                continue
+
+            if (
+                method == "GET"
+                and response.status_code in SERVER_ERROR_CODES
+                and n_failed < self.status_retries
+            ):
+                await asyncio.sleep(self.backoff_factor * 2**n_failed)
+                n_failed += 1
+                continue
+
+            break
+
+        if response.is_error:
+            try:
+                error = response.json().get("error", {})
+                msg, reason = error.get("message"), error.get("reason")
+            except ValueError:
+                msg, reason = response.text or None, None
+
+            raise SpotifyException(
+                response.status_code,
+                -1,
+                f"{response.url}:\n {msg}",
+                reason=reason,
+                headers=dict(response.headers),
+            )
+
+        result = response.json() if response.content else None
+        if cache is not None and endpoint is not None and result is not None:
+            cache.set(endpoint, key, result)
+        return result
+
+    async def next(self, result: Mapping) -> Dict | None:
+        """Return the next page of a paged result, or None on the last page."""
+
+        if result.get("next"):
+            return await self._request("GET", result["next"])
+        return None
+
+    async def search(
+        self,
+        q: str,
+        limit: int = 10,
+        offset: int = 0,
+        type: str = "track",
+        market: str | None = None,
+    ) -> Dict:
+        return await self._request(
+            "GET",
+            "search",
+            {"q": q, "limit": limit, "offset": offset, "type": type, "market": market},
+        )
+
+    async def albums(self, albums: List[str], market: str | None = None) -> Dict:
+        ids = ",".join(_get_id("album", a) for a in albums)
+        return await self._request("GET", f"albums/?ids={ids}", {"market": market})
+
+    async def album_tracks(
+        self,
+        album_id: str,
+        limit: int = 50,
+        offset: int = 0,
+        market: str | None = None,
+    ) -> Dict:
+        return await self._request(
+            "GET",
+            f"albums/{_get_id('album', album_id)}/tracks/",
+            {"limit": limit, "offset": offset, "market": market},
+        )
+
+    async def tracks(self, tracks: List[str], market: str | None = None) -> Dict:
+        ids = ",".join(_get_id("track", t) for t in tracks)
+        return await self._request("GET", f"tracks/?ids={ids}", {"market": market})
+
+    async def track(self, track_id: str, market: str | None = None) -> Dict:
+        return await self._request(
+            "GET", f"tracks/{_get_id('track', track_id)}", {"market": market}
+        )
+
+    async def me(self) -> Dict:
+        return await self._request("GET", "me/")
+
+    async def playlist_items(
+        self,
+        playlist_id: str,
+        fields: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> Dict:
+        return await self._request(
+            "GET",
+            f"playlists/{_get_id('playlist', playlist_id)}/items",
+            {
+                "fields": fields,
+                "limit": limit,
+                "offset": offset,
+                "additional_types": "track,episode",
+            },
+        )
+
+    async def playlist_add_items(
+        self, playlist_id: str, items: List[str], position: int | None = None
+    ) -> Dict:
+        uris = [i if i.startswith("spotify:") else f"spotify:track:{i}" for i in items]
+        return await self._request(
+            "POST",
+            f"playlists/{_get_id('playlist', playlist_id)}/items",
+            {"position": position},
+            uris,
+        )
+
+    async def user_playlist_create(
+        self,
+        user: str,
+        name: str,
+        public: bool = True,
+        collaborative: bool = False,
+        description: str = "",
+    ) -> Dict:
+        return await self._request(
+            "POST",
+            f"users/{user}/playlists",
+            payload={
+                "name": name,
+                "public": public,
+                "collaborative": collaborative,
+                "description": description,
+            },
+        )
+
+
+def get_async_spotify_client(
+    scope: str, cache: ResponseCache | None = None, cache_scope: str | None = None
+) -> AsyncSpotify:
+    """Create an asyncio Spotify client reusing the cached OAuth token.
+
+    Args:
+        scope: OAuth scope string for Spotify API permissions
+        cache: Optional response cache for search, album and track lookups
+        cache_scope: Scope naming the token cache file (default: `scope`)
+
+    Returns:
+        Authenticated, rate-limited asyncio Spotify client
+    """
+    client = AsyncSpotify(
+        auth_manager=get_auth_manager(scope, cache_scope),
+        limiter=RateLimiter(),
+        cache=cache,
+    )
+
+    logger.info(f"Instantiated asyncio Spotify client for scope {scope}")
+    return client
+
+
+async def async_fetch_and_add(
+    client: AsyncSpotify,
+    record_labels: List[str],
+    target_playlist: str,
+    max_in_flight: int = ASYNC_MAX_IN_FLIGHT,
+    n_days: int = 1,
+    store: sqlite3.Connection | None = None,
+) -> Dict[str, Dict[str, List[SpotifyTrack]]]:
+    """Asyncio variant of `fetch_and_add` with the same results and playlist order.
+
+    Args:
+        client: Asyncio Spotify client
+        record_labels: List of record label names to search
+        target_playlist: Spotify playlist URI to add tracks to
+        max_in_flight: Maximum number of concurrent requests per stage
+        n_days: Number of past days (ending yesterday) to pick releases from
+        store: Optional processed-release store connection
+
+    Returns:
+        Dict mapping labels to their releases and tracks for notification
+    """
+    with stage("find_releases"):
+        searches = await gather_concurrently(
+            lambda label: async_fetch_new_releases(client, label),
+            record_labels,
+            max_in_flight,
+        )
+        candidates = [filter_recent_releases(r, n_days=n_days) for r in searches]
+
+        if store is not None:
+            candidates = [filter_unprocessed_releases(store, c) for c in candidates]
+
+        releases_by_label = dict(zip(record_labels, candidates))
+        full_album_batches = await gather_concurrently(
+            lambda uris_chunk: client.albums(list(uris_chunk)),
+            batch(candidate_release_uris(releases_by_label), FETCH_BATCH_SIZE),
+            max_in_flight,
+        )
+    relevant_releases = select_exact_label_releases(
+        releases_by_label,
+        [a for albums in full_album_batches for a in albums["albums"]],
+    )
+
+    if store is not None:
+        record_rejected_releases(store, releases_by_label, relevant_releases)
+
+    for label, releases in relevant_releases.items():
+        n_releases = len(releases)
+        logger.info(
+            f"Fetched {n_releases} new {pluralize(n_releases, 'release')} for label {label}"
+        )
+
+    with stage("fetch_tracks"):
+        label_release_tracks = await gather_concurrently(
+            lambda label: async_fetch_release_tracks(client, relevant_releases[label]),
+            record_labels,
+            max_in_flight,
+        )
+
+    with stage("enrich_tracks"):
+        isrcs = await async_fetch_track_isrcs(
+            client, released_track_uris(label_release_tracks), max_in_flight
+        )
+    label_results = [
+        select_release_tracks(release_tracks, isrcs)
+        for release_tracks in label_release_tracks
+    ]
+    track_info_to_send, uris_to_add = merge_label_results(record_labels, label_results)
+
+    if store is not None:
+        tracks_to_add = select_unseen_tracks(
+            store, lookup_tracks(track_info_to_send, uris_to_add)
+        )
+        uris_to_add = extract_track_uris(tracks_to_add)
+
+    if track_info_to_send:
+        with stage("write_playlist"):
+            await async_add_to_playlist(client, target_playlist, uris_to_add)
+
+    if store is not None:
+        record_processed_releases(store, relevant_releases)
+        record_track_fingerprints(store, tracks_to_add)
+
+    return track_info_to_send
+
+
+async def async_fetch_new_releases(
+    client: AsyncSpotify, label: str
+) -> List[SpotifyAlbum]:
+    """Asyncio variant of `fetch_new_releases`."""
+
+    result = await client.search(
+        new_releases_query(label), limit=SEARCH_LIMIT, type="album"
+    )
+    page = result["albums"]
+    new_releases: List[SpotifyAlbum] = list(page["items"])
+
+    while has_next_search_page(page, len(new_releases)):
+        page = (await client.next(page))["albums"]
+        new_releases.extend(page["items"])
+
+    log_truncated_search(label, page, len(new_releases))
+    return new_releases
+
+
+async def async_fetch_release_tracks(
+    client: AsyncSpotify, releases: List[SpotifyAlbum]
+) -> ReleaseTracks:
+    """Asyncio variant of `fetch_release_tracks`; releases are fetched concurrently."""
+
+    released_tracks_per_release = await asyncio.gather(
+        *(async_fetch_album_tracks(client, release) for release in releases)
+    )
+    return list(zip(releases, released_tracks_per_release))
+
+
+async def async_fetch_track_isrcs(
+    client: AsyncSpotify,
+    track_uris: List[str],
+    max_in_flight: int = ASYNC_MAX_IN_FLIGHT,
+) -> Dict[str, str]:
+    """Asyncio variant of `fetch_track_isrcs`."""
+
+    responses = await gather_concurrently(
+        lambda uris_chunk: client.tracks(list(uris_chunk)),
+        batch(track_uris, TRACKS_BATCH_SIZE),
+        max_in_flight,
+    )
+    isrcs = extract_isrcs(responses)
+
+    n_tracks = len(track_uris)
+    logger.info(
+        f"Fetched ISRCs of {len(isrcs)} of {n_tracks} {pluralize(n_tracks, 'track')}"
+    )
+    return isrcs
+
+
+async def async_fetch_album_tracks(
+    client: AsyncSpotify, album: SpotifyAlbum
+) -> List[SpotifyTrack]:
+    """Asyncio variant of `fetch_album_tracks`."""
+
+    track_page = album.get("tracks") or await client.album_tracks(album["uri"])
+    album_tracks: List[SpotifyTrack] = list(track_page["items"])
+
+    while track_page.get("next"):
+        track_page = await client.next(track_page)
+        album_tracks.extend(track_page["items"])
+
+    n_album_tracks = len(album_tracks)
+    logger.info(
+        f"Fetched {n_album_tracks} {pluralize(n_album_tracks, 'track')} for release {album['name']}"
+    )
+
+    return album_tracks
+
+
+async def async_fetch_playlist_track_uris(
+    client: AsyncSpotify, playlist_id: str
+) -> set[str]:
+    """Asyncio variant of `fetch_playlist_track_uris`."""
+
+    track_uris: set[str] = set()
+    page = await client.playlist_items(
+        playlist_id, fields=PLAYLIST_ITEMS_FIELDS, limit=PLAYLIST_PAGE_SIZE
+    )
+
+    while page:
+        track_uris.update(
+            item["track"]["uri"] for item in page["items"] if item.get("track")
+        )
+        page = await client.next(page)
+
+    return track_uris
+
+
+async def async_add_to_playlist(
+    client: AsyncSpotify,
+    playlist_id: str,
+    track_uris: List[str],
+    skip_existing: bool = True,
+) -> Dict | None:
+    """Asyncio variant of `add_to_playlist`; chunks are written in order."""
+
+    if not track_uris:
+        logger.info("No new tracks to add to the playlist")
+        return None
+
+    existing_uris = (
+        await async_fetch_playlist_track_uris(client, playlist_id)
+        if skip_existing
+        else set()
+    )
+    new_track_uris = select_new_track_uris(track_uris, existing_uris)
+
+    snapshot_id = None
+
+    for uris_chunk in batch(new_track_uris, PLAYLIST_ADD_BATCH_SIZE):
+        snapshot_id = (
+            await async_add_playlist_chunk(client, playlist_id, list(uris_chunk))
+            or snapshot_id
+        )
+
+    n_added_tracks = len(new_track_uris)
+    logger.info(
+        f"Added {n_added_tracks} new {pluralize(n_added_tracks, 'track')} to the playlist"
+    )
+
+    return snapshot_id
+
+
+async def async_add_playlist_chunk(
+    client: AsyncSpotify, playlist_id: str, track_uris: List[str]
+) -> Dict | None:
+    """Asyncio variant of `add_playlist_chunk`; retries re-read the playlist first."""
+
+    attempt = 0
+
+    while True:
+        try:
+            return await client.playlist_add_items(playlist_id, track_uris)
+        except (SpotifyException, httpx.TransportError) as e:
+            if not is_transient_write_error(e) or attempt >= WRITE_RETRIES:
+                raise
+
+            await asyncio.sleep(write_retry_delay(e, attempt))
+            attempt += 1
+
+            existing_uris = await async_fetch_playlist_track_uris(client, playlist_id)
+            track_uris = select_new_track_uris(track_uris, existing_uris)
+            if not track_uris:
+                return None
+
+
+async def async_backfill_labels(
+    client: AsyncSpotify,
+    labels: List[str],
+    max_in_flight: int = ASYNC_MAX_IN_FLIGHT,
+    page_size: int = SEARCH_LIMIT,
+    journals: Mapping[str, BackfillJournal] | None = None,
+    near_duplicates: str | None = None,
+) -> Dict[str, BackfillSummary]:
+    """Asyncio variant of `backfill_labels` with the same playlists and journal.
+
+    Args:
+        client: Asyncio Spotify client, shared by all labels
+        labels: Record label names
+        max_in_flight: Maximum number of concurrent requests per stage
+        page_size: Search page size, capped at SEARCH_MAX_LIMIT
+        journals: Optional checkpoint journals per label
+        near_duplicates: "report" or "collapse", as in `backfill_labels`
+
+    Returns:
+        Dict mapping labels to their backfill summary, in `labels` order
+    """
+    journals = journals or {}
+    release_uris: Dict[str, List[str]] = {}
+
+    with stage("search_releases"):
+        for n, label in enumerate(labels, start=1):
+            logger.info(f"[{n}/{len(labels)}] Searching releases of {label}")
+            release_uris[label] = await async_fetch_all_release_uris(
+                client, label, max_in_flight, page_size, journals.get(label)
+            )
+
+    with stage("collect_tracks"):
+        tracks = await async_collect_tracks_by_label(
+            client, release_uris, journals, max_in_flight
+        )
+
+    if near_duplicates is not None:
+        with stage("near_duplicates"):
+            for label in labels:
+                tracks[label] = resolve_near_duplicates(
+                    label, tracks[label], collapse=near_duplicates == "collapse"
+                )
+
+    summary: Dict[str, BackfillSummary] = {}
+    with stage("create_playlists"):
+        for n, label in enumerate(labels, start=1):
+            logger.info(f"[{n}/{len(labels)}] Creating playlists of {label}")
+            summary[label] = {
+                "releases": len(release_uris[label]),
+                "tracks": len(tracks[label]),
+                "playlists_created": await async_create_playlists(
+                    client, label, tracks[label], journal=journals.get(label)
+                ),
+            }
+
+    return summary
+
+
+async def async_fetch_all_release_uris(
+    client: AsyncSpotify,
+    label: str,
+    max_in_flight: int = ASYNC_MAX_IN_FLIGHT,
+    page_size: int = SEARCH_LIMIT,
+    journal: BackfillJournal | None = None,
+) -> List[str]:
+    """Asyncio variant of `fetch_all_release_uris`."""
+
+    all_releases = await async_fetch_all_releases(
+        client, label, max_in_flight, page_size, journal
+    )
+    return [release["uri"] for release in parse_releases(all_releases)]
+
+
+async def async_fetch_all_releases(
+    client: AsyncSpotify,
+    label: str,
+    max_in_flight: int = ASYNC_MAX_IN_FLIGHT,
+    page_size: int = SEARCH_LIMIT,
+    journal: BackfillJournal | None = None,
+    first_year: int = BACKFILL_START_YEAR,
+) -> List[SpotifyAlbum]:
+    """Asyncio variant of `fetch_all_releases`; year shards and pages run concurrently."""
+
+    if journal is None:
+        years = await async_find_release_years(
+            client, label, first_year, date.today().year, max_in_flight
+        )
+        year_shards = await async_search_partitions(
+            client,
+            [backfill_search_query(label, year) for year in years],
+            max_in_flight,
+            page_size,
+        )
+    else:
+        years, year_shards = await async_search_years_with_journal(
+            client, label, max_in_flight, page_size, journal, first_year
+        )
+
+    releases = []
+    for year, shard in zip(years, year_shards):
+        year_releases = shard["releases"]
+        if year_releases:
+            logger.info(
+                f"Fetched {len(year_releases)} {pluralize(len(year_releases), 'release')} for year {year}"
+            )
+        releases.extend(year_releases)
+
+    logger.info(f"Fetched {len(releases)} releases in total")
+    log_search_coverage(year_shards)
+
+    return releases
+
+
+async def async_search_years_with_journal(
+    client: AsyncSpotify,
+    label: str,
+    max_in_flight: int,
+    page_size: int,
+    journal: BackfillJournal,
+    first_year: int = BACKFILL_START_YEAR,
+) -> Tuple[List[int], List[SearchShard]]:
+    """Asyncio variant of `search_years_with_journal`."""
+
+    years = journaled_release_years(journal, label, first_year)
+    if years is None:
+        years = await async_find_release_years(
+            client, label, first_year, date.today().year, max_in_flight
+        )
+        journal.record("years", label, years=years, first_year=first_year)
+
+    queries = [backfill_search_query(label, year) for year in years]
+    shards = journaled_search_shards(journal, queries)
+    pending = [query for query in queries if query not in shards]
+
+    for chunk in batch(pending, max(max_in_flight, 1)):
+        for shard in await async_search_partitions(
+            client, list(chunk), max_in_flight, page_size
+        ):
+            journal.record("search", shard["query"], shard=shard)
+            shards[shard["query"]] = shard
+
+    return years, [shards[query] for query in queries]
+
+
+async def async_find_release_years(
+    client: AsyncSpotify,
+    label: str,
+    first_year: int,
+    last_year: int,
+    max_in_flight: int = ASYNC_MAX_IN_FLIGHT,
+) -> List[int]:
+    """Asyncio variant of `find_release_years`."""
+
+    ranges = year_ranges(first_year, last_year, BACKFILL_RANGE_YEARS)
+    probed_ranges = [r for r in ranges if r[0] != r[1]]
+
+    probes = await gather_concurrently(
+        lambda r: async_search_album_page(
+            client, backfill_search_query(label, *r), 0, 1
+        ),
+        probed_ranges,
+        max_in_flight,
+    )
+    return select_release_years(ranges, probed_ranges, probes)
+
+
+async def async_search_partitions(
+    client: AsyncSpotify,
+    queries: List[str],
+    max_in_flight: int = ASYNC_MAX_IN_FLIGHT,
+    page_size: int = SEARCH_LIMIT,
+    depth: int = 0,
+) -> List[SearchShard]:
+    """Asyncio variant of `search_partitions`."""
+
+    shards = await async_search_shards(client, queries, max_in_flight, page_size)
+    saturated = [i for i, shard in enumerate(shards) if shard["saturated"]]
+    if not saturated or depth >= PARTITION_MAX_DEPTH:
+        return shards
+
+    refinements = [refine_query(shards[i]["query"]) for i in saturated]
+    refined_shards = await async_search_partitions(
+        client,
+        [query for refined in refinements for query in refined],
+        max_in_flight,
+        page_size,
+        depth + 1,
+    )
+    return merge_refined_shards(shards, saturated, refinements, refined_shards)
+
+
+async def async_search_shards(
+    client: AsyncSpotify,
+    queries: List[str],
+    max_in_flight: int = ASYNC_MAX_IN_FLIGHT,
+    page_size: int = SEARCH_LIMIT,
+) -> List[SearchShard]:
+    """Asyncio variant of `search_shards`."""
+
+    page_size = min(page_size, SEARCH_MAX_LIMIT)
+    first_pages = await gather_concurrently(
+        lambda query: async_search_album_page(client, query, 0, page_size),
+        queries,
+        max_in_flight,
+    )
+
+    jobs = plan_search_pages(first_pages, page_size)
+
+    async def _fetch_job(job: Tuple[int, int, bool]) -> List[SpotifyAlbum]:
+        i, offset, follow = job
+        if not follow:
+            page = await async_search_album_page(client, queries[i], offset, page_size)
+            return page["items"]
+        return await async_page_search_sequentially(
+            client, queries[i], offset, page_size
+        )
+
+    results: List[List[SpotifyAlbum]] = [list(page["items"]) for page in first_pages]
+    job_results = await gather_concurrently(_fetch_job, jobs, max_in_flight)
+    for (i, _, _), items in zip(jobs, job_results):
+        results[i].extend(items)
+
+    return [
+        make_search_shard(query, page, releases, page_size)
+        for query, page, releases in zip(queries, first_pages, results)
+    ]
+
+
+async def async_search_album_page(
+    client: AsyncSpotify, query: str, offset: int, limit: int
+) -> SpotifyAlbumPage:
+    """Asyncio variant of `search_album_page`."""
+
+    result = await client.search(query, type="album", offset=offset, limit=limit)
+    page = result["albums"]
+    page["items"] = [compact_release(r) for r in page["items"]]
+    return page
+
+
+async def async_page_search_sequentially(
+    client: AsyncSpotify, query: str, offset: int, page_size: int
+) -> List[SpotifyAlbum]:
+    """Asyncio variant of `page_search_sequentially`."""
+
+    releases: List[SpotifyAlbum] = []
+
+    while offset + page_size <= MAX_OFFSET:
+        page = await async_search_album_page(client, query, offset, page_size)
+        if not page["items"]:
+            break
+
+        releases.extend(page["items"])
+        offset += page_size
+
+    return releases
+
+
+async def async_collect_tracks_by_label(
+    client: AsyncSpotify,
+    album_uris_by_label: Mapping[str, Sequence[str]],
+    journals: Mapping[str, BackfillJournal] | None = None,
+    max_in_flight: int = ASYNC_MAX_IN_FLIGHT,
+) -> Dict[str, List[ReleasedTrack]]:
+    """Asyncio variant of `collect_tracks_by_label`; batches are completed concurrently.
+
+    Every batch is journaled as soon as its tracks are complete, so a crash
+    loses only the batches still in flight.
+    """
+    journals = journals or {}
+    album_tracks, pending = split_journaled_albums(album_uris_by_label, journals)
+
+    async def _collect_batch(pending_batch: Sequence[Tuple[str, str]]) -> None:
+        result = await client.albums([uri for _, uri in pending_batch])
+        albums = result["albums"]
+        await async_fetch_remaining_album_tracks(
+            client, label_albums(pending_batch, albums), max_in_flight
+        )
+        album_tracks.update(
+            select_pending_album_tracks(pending_batch, albums, journals)
+        )
+
+    await gather_concurrently(
+        _collect_batch, batch(pending, FETCH_BATCH_SIZE), max_in_flight
+    )
+
+    return merge_album_tracks(album_uris_by_label, album_tracks)
+
+
+async def async_fetch_remaining_album_tracks(
+    client: AsyncSpotify,
+    albums: List[SpotifyAlbum],
+    max_in_flight: int = ASYNC_MAX_IN_FLIGHT,
+) -> None:
+    """Asyncio variant of `fetch_remaining_album_tracks`."""
+
+    jobs = plan_remaining_track_pages(albums)
+
+    async def _fetch_job(job: Tuple[int, int | None]) -> List[SpotifyTrack]:
+        i, offset = job
+        if offset is not None:
+            page = await client.album_tracks(
+                albums[i]["uri"], limit=ALBUM_TRACKS_LIMIT, offset=offset
+            )
+            return page["items"]
+
+        items: List[SpotifyTrack] = []
+        track_page = albums[i]["tracks"]
+        while track_page.get("next"):
+            track_page = await client.next(track_page)
+            items.extend(track_page["items"])
+        return items
+
+    pages = await gather_concurrently(_fetch_job, jobs, max_in_flight)
+    for (i, _), items in zip(jobs, pages):
+        albums[i]["tracks"]["items"].extend(items)
+
+    log_remaining_track_pages(jobs)
+
+
+async def async_create_playlists(
+    client: AsyncSpotify,
+    playlist_name: str,
+    tracks: Sequence[ReleasedTrack],
+    step_size: int = 50,
+    journal: BackfillJournal | None = None,
+    first_number: int = 1,
+) -> int:
+    """Asyncio variant of `create_playlists`; playlists are still created in order."""
+
+    user_id: str | None = None
+    n_created = 0
+
+    for i in range(0, len(tracks), step_size):
+        full_playlist_name = f"{playlist_name} {(i // step_size) + first_number:03d}"
+        playlist_tracks = tracks[i : i + step_size]
+        playlist_track_uris = [t["uri"] for t in playlist_tracks]
+        record = journal.get("playlist", full_playlist_name) if journal else None
+
+        if record is not None:
+            if record["tracks_added"] == len(playlist_track_uris):
+                continue
+
+            logger.info(f"Topping up journaled playlist {full_playlist_name}")
+            await async_add_to_playlist(client, record["uri"], playlist_track_uris)
+            journal.record(
+                "playlist",
+                full_playlist_name,
+                uri=record["uri"],
+                tracks_added=len(playlist_track_uris),
+            )
+            continue
+
+        if user_id is None:
+            user_id = (await client.me())["id"]
+
+        playlist = await client.user_playlist_create(
+            user_id,
+            full_playlist_name,
+            public=False,
+            description=playlist_date_range(playlist_tracks),
+        )
+        logger.info(
+            f"Created playlist {full_playlist_name} - {playlist['external_urls']['spotify']}"
+        )
+        n_created += 1
+
+        if journal is not None:
+            journal.record(
+                "playlist", full_playlist_name, uri=playlist["uri"], tracks_added=0
+            )
+
+        await async_add_to_playlist(
+            client, playlist["uri"], playlist_track_uris, skip_existing=False
+        )
+
+        if journal is not None:
+            journal.record(
+                "playlist",
+                full_playlist_name,
+                uri=playlist["uri"],
+                tracks_added=len(playlist_track_uris),
+            )
+
+    return n_created
@@ -0,0 +1,346 @@
+import json
+import re
+import sqlite3
+import threading
+import time
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import date
+from pathlib import Path
+from typing import Callable, Dict, List, Mapping, Tuple, TypedDict
+from urllib.parse import parse_qs, urlsplit
+
+from crate_digger.constants import (
+    CACHE_MAX_BYTES,
+    CACHE_MAX_ENTRIES,
+    CACHE_TTLS,
+    RESPONSE_CACHE_FILENAME,
+)
+from crate_digger.utils.ratelimit import RateLimitedSpotify
+from crate_digger.utils.state import get_state_path
+
+
+class EndpointCacheStats(TypedDict):
+    """Hit/miss counters of a single endpoint."""
+
+    hits: int
+    misses: int
+
+
+class CacheStats(TypedDict):
+    """Counters describing how well a response cache performed."""
+
+    hits: int
+    misses: int
+    evictions: int
+    endpoints: Dict[str, EndpointCacheStats]
+
+
+def cache_endpoint(url: str, params: Mapping) -> str | None:
+    """Classify a GET request into a cacheable endpoint.
+
+    Args:
+        url: Request URL relative to the API prefix, possibly with a query
+            string (as for `next` pages)
+        params: Query parameters of the request
+
+    Returns:
+        Endpoint name used to pick a TTL, or None if the response must not be
+        cached (playlists, user data); searches that can still gain releases
+        (`tag:new`, or a year range reaching the current year) are "search:new"
+    """
+    split_url = urlsplit(url)
+    parts = split_url.path.strip("/").split("/")
+    # Pages requested through `next` carry their parameters in the URL
+    params = {
+        **{k: v[-1] for k, v in parse_qs(split_url.query).items()},
+        **params,
+    }
+
+    match parts:
+        case ["search"]:
+            query = str(params.get("q") or params.get("query") or "")
+            years = re.search(r"year:(\d{4})(?:-(\d{4}))?", query)
+            current = bool(years) and int(years[2] or years[1]) >= date.today().year
+            return "search:new" if "tag:new" in query or current else "search"
+        case ["albums", _, "tracks"]:
+            return "album_tracks"
+        case ["albums"] | ["albums", _]:
+            return "albums"
+        case ["tracks"] | ["tracks", _]:
+            return "tracks"
+        case _:
+            return None
+
+
+def cache_key(url: str, params: Mapping) -> str:
+    """Build a stable cache key from a request URL and its query parameters."""
+
+    query = sorted((k, str(v)) for k, v in params.items() if v is not None)
+    return f"{url}|{json.dumps(query, ensure_ascii=False)}"
+
+
+def _body_size(body: str) -> int:
+    """Size of a stored response body in bytes."""
+
+    return len(body.encode())
+
+
+class ResponseCache(ABC):
+    """Base class of JSON response caches with per-endpoint TTLs and LRU eviction.
+
+    Subclasses provide the storage through `_load`, `_store` and `_evict`;
+    locking, TTL selection and statistics live here. The cache is bounded
+    both by its number of entries and by the total size of the stored bodies.
+    """
+
+    def __init__(
+        self,
+        ttls: Mapping[str, float] = CACHE_TTLS,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+        max_bytes: int = CACHE_MAX_BYTES,
+    ) -> None:
+        self.ttls = dict(ttls)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._evictions = 0
+        self._endpoint_stats: Dict[str, EndpointCacheStats] = {}
+
+    def get(self, endpoint: str, key: str) -> object | None:
+        """Return a cached, unexpired response or None.
+
+        Args:
+            endpoint: Endpoint name from `cache_endpoint`
+            key: Cache key from `cache_key`
+
+        Returns:
+            Decoded JSON response, or None on a miss
+        """
+        with self._lock:
+            body = self._load(key, self._clock())
+            stats = self._endpoint_stats.setdefault(endpoint, {"hits": 0, "misses": 0})
+            stats["hits" if body is not None else "misses"] += 1
+
+        return json.loads(body) if body is not None else None
+
+    def set(self, endpoint: str, key: str, response: object) -> None:
+        """Store a response if its endpoint has a TTL.
+
+        Args:
+            endpoint: Endpoint name from `cache_endpoint`
+            key: Cache key from `cache_key`
+            response: Decoded JSON response
+        """
+        ttl = self.ttls.get(endpoint)
+        if not ttl:
+            return
+
+        body = json.dumps(response, ensure_ascii=False)
+        with self._lock:
+            now = self._clock()
+            self._store(key, endpoint, body, now + ttl, now)
+            self._evictions += self._evict(self.max_entries, self.max_bytes)
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache counters."""
+
+        with self._lock:
+            endpoints = {e: s.copy() for e, s in self._endpoint_stats.items()}
+            return {
+                "hits": sum(s["hits"] for s in endpoints.values()),
+                "misses": sum(s["misses"] for s in endpoints.values()),
+                "evictions": self._evictions,
+                "endpoints": endpoints,
+            }
+
+    @abstractmethod
+    def _load(self, key: str, now: float) -> str | None:
+        """Return the unexpired body stored under `key` and mark it as used."""
+
+    @abstractmethod
+    def _store(
+        self, key: str, endpoint: str, body: str, expires_at: float, now: float
+    ) -> None:
+        """Store or replace the body under `key`."""
+
+    @abstractmethod
+    def _evict(self, max_entries: int, max_bytes: int) -> int:
+        """Drop least recently used entries until both limits hold.
+
+        Returns:
+            Number of evicted entries
+        """
+
+
+class MemoryResponseCache(ResponseCache):
+    """In-process response cache, for tests and one-off runs."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._entries: OrderedDict[str, Tuple[str, float]] = OrderedDict()
+        self._n_bytes = 0
+
+    def _load(self, key: str, now: float) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        body, expires_at = entry
+        if expires_at <= now:
+            del self._entries[key]
+            self._n_bytes -= _body_size(body)
+            return None
+
+        self._entries.move_to_end(key)
+        return body
+
+    def _store(
+        self, key: str, endpoint: str, body: str, expires_at: float, now: float
+    ) -> None:
+        previous = self._entries.get(key)
+        if previous is not None:
+            self._n_bytes -= _body_size(previous[0])
+
+        self._entries[key] = (body, expires_at)
+        self._entries.move_to_end(key)
+        self._n_bytes += _body_size(body)
+
+    def _evict(self, max_entries: int, max_bytes: int) -> int:
+        n_evicted = 0
+        while len(self._entries) > max_entries or self._n_bytes > max_bytes:
+            _, (body, _) = self._entries.popitem(last=False)
+            self._n_bytes -= _body_size(body)
+            n_evicted += 1
+        return n_evicted
+
+
+DISK_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    body TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+"""
+
+
+class DiskResponseCache(ResponseCache):
+    """SQLite-backed response cache that survives between runs.
+
+    The number of entries and their total size are counted once on open and
+    then kept up to date on every write, so storing a response never scans
+    the table; eviction only reads the least recently used rows it deletes.
+    """
+
+    def __init__(self, path: Path | str | None = None, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._conn = sqlite3.connect(
+            path or get_state_path(RESPONSE_CACHE_FILENAME), check_same_thread=False
+        )
+        self._conn.executescript(DISK_CACHE_SCHEMA)
+        self._n_entries, self._n_bytes = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(CAST(body AS BLOB))), 0) "
+            "FROM responses"
+        ).fetchone()
+
+    def _load(self, key: str, now: float) -> str | None:
+        row = self._conn.execute(
+            "SELECT body, expires_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        body, expires_at = row
+        with self._conn:
+            if expires_at <= now:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._n_entries -= 1
+                self._n_bytes -= _body_size(body)
+                return None
+
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+        return body
+
+    def _store(
+        self, key: str, endpoint: str, body: str, expires_at: float, now: float
+    ) -> None:
+        previous = self._conn.execute(
+            "SELECT LENGTH(CAST(body AS BLOB)) FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, endpoint, body, expires_at, now),
+            )
+
+        if previous is None:
+            self._n_entries += 1
+        else:
+            self._n_bytes -= previous[0]
+        self._n_bytes += _body_size(body)
+
+    def _evict(self, max_entries: int, max_bytes: int) -> int:
+        if self._n_entries <= max_entries and self._n_bytes <= max_bytes:
+            return 0
+
+        evicted_keys: List[Tuple[str]] = []
+        n_entries, n_bytes = self._n_entries, self._n_bytes
+        rows = self._conn.execute(
+            "SELECT key, LENGTH(CAST(body AS BLOB)) FROM responses ORDER BY accessed_at"
+        )
+        for key, size in rows:
+            if n_entries <= max_entries and n_bytes <= max_bytes:
+                break
+            evicted_keys.append((key,))
+            n_entries -= 1
+            n_bytes -= size
+        rows.close()
+
+        with self._conn:
+            self._conn.executemany("DELETE FROM responses WHERE key = ?", evicted_keys)
+        self._n_entries, self._n_bytes = n_entries, n_bytes
+        return len(evicted_keys)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+
+        self._conn.close()
+
+
+class CachedSpotify(RateLimitedSpotify):
+    """Rate-limited Spotify client that answers catalog GETs from a response cache.
+
+    Only `search`, `albums`, `album_tracks` and `tracks` responses are cached;
+    cache hits do not consume rate limiter slots.
+    """
+
+    def __init__(self, *args, cache: ResponseCache | None = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.cache = cache
+
+    def _internal_call(self, method, url, payload, params):
+        if self.cache is None or method != "GET":
+            return super()._internal_call(method, url, payload, params)
+
+        relative_url = url.removeprefix(self.prefix)
+        endpoint = cache_endpoint(relative_url, params)
+        if endpoint is None:
+            return super()._internal_call(method, url, payload, params)
+
+        key = cache_key(relative_url, params)
+        cached = self.cache.get(endpoint, key)
+        if cached is not None:
+            return cached
+
+        response = super()._internal_call(method, url, payload, params)
+        if response is not None:
+            self.cache.set(endpoint, key, response)
+        return response
@@ -0,0 +1,95 @@
+import asyncio
+import contextvars
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Awaitable, Callable, Deque, Iterable, Iterator, List, TypeVar
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def map_concurrently(
+    fn: Callable[[T], R], items: Iterable[T], max_workers: int = 1
+) -> List[R]:
+    """Apply a function to every item on a bounded thread pool, keeping input order.
+
+    Each call runs in a copy of the caller's context, so context variables
+    (e.g. the current metrics stage) carry over into the workers.
+
+    Args:
+        fn: Function to apply (typically one or more blocking API calls)
+        items: Items to process
+        max_workers: Maximum number of concurrent calls; 1 runs sequentially
+
+    Returns:
+        List of results in the same order as the input items
+    """
+    items = list(items)
+
+    if max_workers <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+
+    context = contextvars.copy_context()
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(lambda item: context.copy().run(fn, item), items))
+
+
+def imap_concurrently(
+    fn: Callable[[T], R], items: Iterable[T], max_in_flight: int = 1
+) -> Iterator[R]:
+    """Lazily apply a function on a thread pool, yielding results in input order.
+
+    At most `max_in_flight` calls are submitted ahead of the consumer; results
+    that finish early wait in a reorder buffer until every earlier result has
+    been yielded. Unlike `map_concurrently`, the caller can act on (e.g.
+    checkpoint) each result while later calls are still running.
+
+    Args:
+        fn: Function to apply (typically one or more blocking API calls)
+        items: Items to process, consumed lazily
+        max_in_flight: Maximum number of submitted, unconsumed calls; 1 runs
+            sequentially
+
+    Yields:
+        Results in the same order as the input items
+    """
+    if max_in_flight <= 1:
+        yield from (fn(item) for item in items)
+        return
+
+    context = contextvars.copy_context()
+    pending: Deque[Future[R]] = deque()
+
+    with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+        for item in items:
+            pending.append(executor.submit(context.copy().run, fn, item))
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+
+
+async def gather_concurrently(
+    fn: Callable[[T], Awaitable[R]], items: Iterable[T], max_in_flight: int
+) -> List[R]:
+    """Await a coroutine function for every item with a bounded number in flight.
+
+    Args:
+        fn: Coroutine function to apply (typically one or more API calls)
+        items: Items to process
+        max_in_flight: Maximum number of coroutines running at once
+
+    Returns:
+        List of results in the same order as the input items
+    """
+    semaphore = asyncio.Semaphore(max(max_in_flight, 1))
+
+    async def _run(item: T) -> R:
+        async with semaphore:
+            return await fn(item)
+
+    return list(await asyncio.gather(*(_run(item) for item in items)))
@@ -0,0 +1,142 @@
+import json
+import os
+import re
+import threading
+
+from pathlib import Path
+from typing import Dict, Tuple
+
+from crate_digger.constants import BACKFILL_DIRNAME
+from crate_digger.utils.logging import get_logger
+from crate_digger.utils.state import get_state_path
+
+
+logger = get_logger(__name__)
+
+
+class BackfillJournal:
+    """Append-only JSONL journal of completed backfill steps.
+
+    Every record is one line `{"kind": ..., "key": ..., **data}`; a later
+    record of the same kind and key replaces the earlier one. A line cut
+    short by a crash is ignored on the next load, so a rerun resumes from
+    the last complete record.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._records: Dict[Tuple[str, str], Dict] = {}
+
+        if self.path.exists():
+            with self.path.open(encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning(
+                            f"Ignoring incomplete journal line in {self.path}"
+                        )
+                        continue
+                    self._records[(record["kind"], record["key"])] = record
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("a", encoding="utf-8")
+
+        # Start on a fresh line after a record cut short by a crash
+        if self._file.tell() and not self.path.read_bytes().endswith(b"\n"):
+            self._file.write("\n")
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def get(self, kind: str, key: str) -> Dict | None:
+        """Return the latest record of a step, or None if it never completed.
+
+        Args:
+            kind: Step kind (e.g. "search", "albums", "playlist")
+            key: Step identifier within its kind
+
+        Returns:
+            Record data including `kind` and `key`
+        """
+        with self._lock:
+            return self._records.get((kind, key))
+
+    def record(self, kind: str, key: str, **data) -> None:
+        """Durably append a completed step.
+
+        Args:
+            kind: Step kind
+            key: Step identifier within its kind
+            **data: JSON-serializable step results
+        """
+        record = {"kind": kind, "key": key, **data}
+        line = json.dumps(record, ensure_ascii=False)
+
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._records[(kind, key)] = record
+
+    def close(self) -> None:
+        """Close the journal file."""
+
+        self._file.close()
+
+    def archive(self) -> Path:
+        """Close the journal and move it aside once its backfill has completed.
+
+        A later run then starts a fresh backfill instead of replaying this
+        one; the archive replaces that of any earlier completed run.
+
+        Returns:
+            Path of the archived journal (`<label>.done.jsonl`)
+        """
+        self.close()
+        archived = self.path.replace(self.path.with_suffix(".done.jsonl"))
+
+        logger.info(f"Backfill complete, archived its journal to {archived}")
+        return archived
+
+
+def get_journal_path(label: str) -> Path:
+    """Resolve the backfill journal file of a label in the state directory."""
+
+    slug = re.sub(r"[^\w-]+", "_", label.lower()).strip("_") or "label"
+    return get_state_path(BACKFILL_DIRNAME) / f"{slug}.jsonl"
+
+
+def open_backfill_journal(label: str, **options) -> BackfillJournal:
+    """Open (or create) the backfill journal of a label.
+
+    Args:
+        label: Record label name
+        **options: JSON-serializable run options that shape the journaled
+            results (e.g. `near_duplicates`); recorded by the first run
+
+    Returns:
+        Journal holding every step completed by earlier runs for the label
+
+    Raises:
+        ValueError: If the journal was started with different options
+    """
+    journal = BackfillJournal(get_journal_path(label))
+
+    record = journal.get("options", "run")
+    if record is None:
+        journal.record("options", "run", **options)
+    else:
+        journaled = {k: v for k, v in record.items() if k not in ("kind", "key")}
+        if journaled != options:
+            journal.close()
+            raise ValueError(
+                f"Backfill of {label} was started with options {journaled}, "
+                f"not {options}; rerun with the same options or delete {journal.path}"
+            )
+
+        n_steps = len(journal) - 1
+        logger.info(f"Resuming backfill of {label} from {n_steps} journaled steps")
+
+    return journal
@@ -0,0 +1,363 @@
+import json
+import threading
+import time
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, TypedDict
+
+import requests
+
+from crate_digger.constants import LATENCY_BUCKETS, METRICS_DIRNAME, METRICS_MAX_FILES
+from crate_digger.utils.cache import CachedSpotify
+from crate_digger.utils.logging import get_logger
+from crate_digger.utils.state import get_state_path
+
+
+logger = get_logger(__name__)
+
+
+class LatencyHistogram(TypedDict):
+    """Cumulative latency histogram in seconds (Prometheus-style `le` buckets)."""
+
+    count: int
+    sum: float
+    max: float
+    buckets: Dict[str, int]
+
+
+class EndpointMetrics(TypedDict):
+    """Counters of one endpoint, or of all calls made within one stage."""
+
+    calls: int
+    errors: int
+    retries: int
+    throttled: int
+    cache_hits: int
+    bytes_sent: int
+    bytes_received: int
+    latency: LatencyHistogram
+
+
+class StageMetrics(EndpointMetrics):
+    """Endpoint counters of a pipeline stage plus its wall time."""
+
+    seconds: float
+
+
+class MetricsSummary(TypedDict):
+    """JSON-serializable snapshot of a run."""
+
+    endpoints: Dict[str, EndpointMetrics]
+    stages: Dict[str, StageMetrics]
+
+
+class CallStats(TypedDict):
+    """HTTP attempts made by one logical client call."""
+
+    http_requests: int
+    retries: int
+    throttled: int
+    bytes_sent: int
+    bytes_received: int
+
+
+def new_call_stats() -> CallStats:
+    """Return zeroed counters for a new client call."""
+
+    return {
+        "http_requests": 0,
+        "retries": 0,
+        "throttled": 0,
+        "bytes_sent": 0,
+        "bytes_received": 0,
+    }
+
+
+def _empty_endpoint_metrics() -> EndpointMetrics:
+    return {
+        "calls": 0,
+        "errors": 0,
+        "retries": 0,
+        "throttled": 0,
+        "cache_hits": 0,
+        "bytes_sent": 0,
+        "bytes_received": 0,
+        "latency": {
+            "count": 0,
+            "sum": 0.0,
+            "max": 0.0,
+            "buckets": {str(b): 0 for b in LATENCY_BUCKETS} | {"+Inf": 0},
+        },
+    }
+
+
+def request_endpoint(method: str, url: str) -> str:
+    """Name the endpoint of a request, with IDs left out.
+
+    Args:
+        method: HTTP method
+        url: Request URL relative to the API prefix
+
+    Returns:
+        Endpoint name such as "search", "album_tracks" or "playlist_items:POST"
+    """
+    parts = url.split("?", 1)[0].strip("/").split("/")
+
+    match parts:
+        case ["search"]:
+            name = "search"
+        case ["albums", _, "tracks"]:
+            name = "album_tracks"
+        case ["albums"] | ["albums", _]:
+            name = "albums"
+        case ["tracks"] | ["tracks", _]:
+            name = "tracks"
+        case ["me"]:
+            name = "me"
+        case ["users", _, "playlists"]:
+            name = "user_playlists"
+        case ["playlists", _, "items" | "tracks"]:
+            name = "playlist_items"
+        case _:
+            name = parts[0] or "unknown"
+
+    return name if method == "GET" else f"{name}:{method}"
+
+
+_current_stage: ContextVar[str | None] = ContextVar("stage", default=None)
+
+
+class RunMetrics:
+    """Thread-safe collector of per-endpoint and per-stage request metrics.
+
+    Calls are attributed to the stage active in the calling context (see
+    `stage`); worker threads of `map_concurrently` and asyncio tasks inherit it.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, EndpointMetrics] = {}
+        self._stages: Dict[str, StageMetrics] = {}
+
+    def observe(
+        self,
+        endpoint: str,
+        seconds: float,
+        error: bool = False,
+        retries: int = 0,
+        throttled: int = 0,
+        cache_hit: bool = False,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+    ) -> None:
+        """Record one logical call (including its retries) to an endpoint.
+
+        Args:
+            endpoint: Endpoint name from `request_endpoint`
+            seconds: Wall time of the call, rate limiter waits and retries included
+            error: Whether the call finally failed
+            retries: Number of repeated HTTP attempts
+            throttled: Number of 429 responses among the attempts
+            cache_hit: Whether the response came from the response cache
+            bytes_sent: Request body bytes over all attempts
+            bytes_received: Response body bytes over all attempts
+        """
+        stage_name = _current_stage.get()
+
+        with self._lock:
+            targets = [self._endpoints.setdefault(endpoint, _empty_endpoint_metrics())]
+            if stage_name is not None:
+                targets.append(self._stage_metrics(stage_name))
+
+            for metrics in targets:
+                metrics["calls"] += 1
+                metrics["errors"] += int(error)
+                metrics["retries"] += retries
+                metrics["throttled"] += throttled
+                metrics["cache_hits"] += int(cache_hit)
+                metrics["bytes_sent"] += bytes_sent
+                metrics["bytes_received"] += bytes_received
+
+                latency = metrics["latency"]
+                latency["count"] += 1
+                latency["sum"] += seconds
+                latency["max"] = max(latency["max"], seconds)
+                for bucket in LATENCY_BUCKETS:
+                    if seconds <= bucket:
+                        latency["buckets"][str(bucket)] += 1
+                latency["buckets"]["+Inf"] += 1
+
+    def observe_call(
+        self, endpoint: str, seconds: float, call: CallStats, error: bool
+    ) -> None:
+        """Record a client call from the HTTP attempts it made.
+
+        Every attempt after the first counts as a retry; a successful call
+        without any attempt was answered from the response cache.
+
+        Args:
+            endpoint: Endpoint name from `request_endpoint`
+            seconds: Wall time of the call
+            call: Counters filled while the call was running
+            error: Whether the call finally failed
+        """
+        self.observe(
+            endpoint,
+            seconds,
+            error=error,
+            retries=call["retries"] + max(call["http_requests"] - 1, 0),
+            throttled=call["throttled"],
+            cache_hit=call["http_requests"] == 0 and not error,
+            bytes_sent=call["bytes_sent"],
+            bytes_received=call["bytes_received"],
+        )
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Attribute the calls made inside the block to a pipeline stage.
+
+        Args:
+            name: Stage name; repeated stages accumulate
+        """
+        token = _current_stage.set(name)
+        started_at = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started_at
+            _current_stage.reset(token)
+            with self._lock:
+                self._stage_metrics(name)["seconds"] += elapsed
+
+    def _stage_metrics(self, name: str) -> StageMetrics:
+        if name not in self._stages:
+            self._stages[name] = {**_empty_endpoint_metrics(), "seconds": 0.0}
+        return self._stages[name]
+
+    def summary(self) -> MetricsSummary:
+        """Return a JSON-serializable snapshot of all counters."""
+
+        with self._lock:
+            summary: MetricsSummary = json.loads(
+                json.dumps({"endpoints": self._endpoints, "stages": self._stages})
+            )
+
+        for metrics in [*summary["endpoints"].values(), *summary["stages"].values()]:
+            metrics["latency"]["sum"] = round(metrics["latency"]["sum"], 3)
+            metrics["latency"]["max"] = round(metrics["latency"]["max"], 3)
+        for stage_metrics in summary["stages"].values():
+            stage_metrics["seconds"] = round(stage_metrics["seconds"], 3)
+
+        return summary
+
+    def reset(self) -> None:
+        """Drop every recorded call and stage."""
+
+        with self._lock:
+            self._endpoints.clear()
+            self._stages.clear()
+
+
+_run_metrics = RunMetrics()
+
+
+def get_run_metrics() -> RunMetrics:
+    """Return the process-wide metrics collector."""
+
+    return _run_metrics
+
+
+def stage(name: str):
+    """Attribute the calls made inside the block to a stage of the run metrics."""
+
+    return _run_metrics.stage(name)
+
+
+_current_call: ContextVar[CallStats | None] = ContextVar("call", default=None)
+
+
+class InstrumentedSpotify(CachedSpotify):
+    """Cached, rate-limited Spotify client that records every call in RunMetrics.
+
+    A call is timed from before the rate limiter until the final response, so
+    limiter waits and retries count towards its latency; the HTTP attempts it
+    took are counted through a response hook on the client's session.
+    """
+
+    def __init__(self, *args, metrics: RunMetrics | None = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = metrics or get_run_metrics()
+        self._session.hooks["response"].append(_count_http_response)
+
+    def _internal_call(self, method, url, payload, params):
+        endpoint = request_endpoint(method, url.removeprefix(self.prefix))
+        call = new_call_stats()
+        token = _current_call.set(call)
+        started_at = time.perf_counter()
+        error = True
+
+        try:
+            response = super()._internal_call(method, url, payload, params)
+            error = False
+            return response
+        finally:
+            _current_call.reset(token)
+            self.metrics.observe_call(
+                endpoint, time.perf_counter() - started_at, call, error
+            )
+
+
+def _count_http_response(response: requests.Response, *args, **kwargs) -> None:
+    call = _current_call.get()
+    if call is None:
+        return
+
+    call["http_requests"] += 1
+    call["throttled"] += int(response.status_code == 429)
+    call["bytes_received"] += len(response.content)
+
+    body = response.request.body
+    call["bytes_sent"] += len(body) if body else 0
+
+    # Attempts retried by urllib3 (5xx) never reach the hook themselves
+    urllib3_retries = getattr(response.raw, "retries", None)
+    if urllib3_retries is not None:
+        call["retries"] += len(urllib3_retries.history)
+
+
+def write_run_metrics(name: str, extra: Dict | None = None) -> Path:
+    """Log the run metrics as one JSON line and store them in the state directory.
+
+    Only the latest METRICS_MAX_FILES files of a run name are kept.
+
+    Args:
+        name: Run name (e.g. the entry point), used in the file name
+        extra: Additional JSON-serializable sections (rate limiter, cache stats)
+
+    Returns:
+        Path of the written `<name>-<UTC timestamp>.json` file
+    """
+    finished_at = datetime.now(timezone.utc)
+    summary = {
+        "run": name,
+        "finished_at": finished_at.isoformat(timespec="seconds"),
+        **get_run_metrics().summary(),
+        **(extra or {}),
+    }
+
+    path = get_state_path(METRICS_DIRNAME) / (
+        f"{name}-{finished_at.strftime('%Y%m%dT%H%M%SZ')}.json"
+    )
+    path.parent.mkdir(exist_ok=True)
+    path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+
+    # Timestamps sort chronologically, so the oldest files come first
+    for old_path in sorted(path.parent.glob(f"{name}-*.json"))[:-METRICS_MAX_FILES]:
+        old_path.unlink()
+
+    logger.info(f"Run metrics: {json.dumps(summary, separators=(',', ':'))}")
+    return path
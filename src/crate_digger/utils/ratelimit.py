@@ -0,0 +1,194 @@
+import threading
+import time
+
+from typing import Callable, TypedDict
+
+from spotipy import Spotify, SpotifyException
+from urllib3.util.retry import Retry
+
+from crate_digger.constants import (
+    MAX_RETRY_AFTER,
+    REQUEST_BURST,
+    REQUESTS_PER_SECOND,
+    THROTTLE_RETRIES,
+)
+from crate_digger.utils.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class RateLimiterStats(TypedDict):
+    """Counters describing how much a rate limiter held requests back."""
+
+    requests: int
+    throttled_responses: int
+    throttled_seconds: float
+    waited_seconds: float
+
+
+class RateLimiter:
+    """Thread-safe token bucket shared by every request of a client.
+
+    Implemented as a generic cell rate algorithm: each request reserves the
+    next free send slot, so concurrent workers queue up instead of bursting.
+    A `pause` (from a 429 `Retry-After`) moves the earliest slot for all
+    workers at once, after which they resume at the base rate.
+    """
+
+    def __init__(
+        self,
+        rate: float = REQUESTS_PER_SECOND,
+        burst: int = REQUEST_BURST,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._interval = 1.0 / rate
+        self._tolerance = (burst - 1) * self._interval
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._theoretical_arrival = clock()
+        self._paused_until = 0.0
+
+        self._requests = 0
+        self._throttled_responses = 0
+        self._throttled_seconds = 0.0
+        self._waited_seconds = 0.0
+
+    def reserve(self) -> float:
+        """Reserve a send slot for one request.
+
+        Returns:
+            Seconds the caller has to wait before sending
+        """
+        with self._lock:
+            now = self._clock()
+            send_at = max(
+                now,
+                self._paused_until,
+                self._theoretical_arrival - self._tolerance,
+            )
+            self._theoretical_arrival = (
+                max(self._theoretical_arrival, send_at) + self._interval
+            )
+
+            delay = send_at - now
+            self._requests += 1
+            self._waited_seconds += delay
+            return delay
+
+    def acquire(self) -> None:
+        """Block until the calling worker may send a request."""
+
+        delay = self.reserve()
+        if delay > 0:
+            self._sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every worker for the given time (e.g. a `Retry-After`).
+
+        Args:
+            seconds: Pause length counted from now
+        """
+        with self._lock:
+            now = self._clock()
+            paused_until = now + seconds
+            self._throttled_responses += 1
+
+            if paused_until > self._paused_until:
+                self._throttled_seconds += paused_until - max(now, self._paused_until)
+                self._paused_until = paused_until
+
+            # Resume at the base rate rather than with a fresh burst
+            self._theoretical_arrival = max(
+                self._theoretical_arrival, self._paused_until + self._tolerance
+            )
+
+    def stats(self) -> RateLimiterStats:
+        """Return a snapshot of the limiter counters."""
+
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "throttled_responses": self._throttled_responses,
+                "throttled_seconds": round(self._throttled_seconds, 3),
+                "waited_seconds": round(self._waited_seconds, 3),
+            }
+
+
+def parse_retry_after(headers: dict | None, default: float = 1.0) -> float:
+    """Read the `Retry-After` header of a 429 response, in seconds.
+
+    Args:
+        headers: Response headers (may be None)
+        default: Value used when the header is missing or malformed
+
+    Returns:
+        Seconds to wait before retrying
+    """
+    try:
+        return max(float((headers or {})["Retry-After"]), 0.0)
+    except (KeyError, TypeError, ValueError):
+        return default
+
+
+class RateLimitedSpotify(Spotify):
+    """Spotify client that sends every request through a shared RateLimiter.
+
+    429 responses are not retried per request by urllib3; instead their
+    `Retry-After` pauses the limiter, so all in-flight workers back off together.
+    Server errors are retried by urllib3 alone; once those retries run out,
+    spotipy's header-less "Max Retries" 429 is re-raised as is.
+    urllib3 does not retry POSTs on error statuses either: a failed POST may
+    have been applied, so callers reconcile before writing again.
+    """
+
+    def __init__(
+        self,
+        *args,
+        limiter: RateLimiter | None = None,
+        throttle_retries: int = THROTTLE_RETRIES,
+        **kwargs,
+    ) -> None:
+        kwargs.setdefault(
+            "status_forcelist",
+            [c for c in Spotify.default_retry_codes if c != 429],
+        )
+        super().__init__(*args, **kwargs)
+        self.limiter = limiter or RateLimiter()
+        self.throttle_retries = throttle_retries
+
+    def _build_session(self):
+        super()._build_session()
+
+        # urllib3 would otherwise sleep on a 429's Retry-After per request,
+        # and resend non-idempotent POSTs on 5xx
+        for adapter in self._session.adapters.values():
+            adapter.max_retries = adapter.max_retries.new(
+                respect_retry_after_header=False,
+                allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            )
+
+    def _internal_call(self, method, url, payload, params):
+        attempt = 0
+
+        while True:
+            self.limiter.acquire()
+            try:
+                return super()._internal_call(method, url, payload, dict(params))
+            except SpotifyException as e:
+                # spotipy reports exhausted 5xx retries as a 429 without
+                # headers ("Max Retries"); only a real 429 response has them
+                throttled = e.http_status == 429 and bool(e.headers)
+                if not throttled or attempt >= self.throttle_retries:
+                    raise
+
+                retry_after = parse_retry_after(e.headers)
+                if retry_after > MAX_RETRY_AFTER:
+                    logger.error(f"Spotify asked to wait {retry_after:.0f}s, giving up")
+                    raise
+
+                logger.warning(f"Rate limited by Spotify, pausing for {retry_after}s")
+                self.limiter.pause(retry_after)
+                attempt += 1
@@ -0,0 +1,149 @@
+import hashlib
+import random
+
+from collections import defaultdict
+from functools import lru_cache
+from typing import AbstractSet, Dict, Hashable, Iterable, List, Sequence, Tuple
+
+from crate_digger.constants import (
+    LSH_BANDS,
+    LSH_MAX_REPRESENTATIVES,
+    MINHASH_PERMUTATIONS,
+    NEAR_DUPLICATE_THRESHOLD,
+    TITLE_CACHE_SIZE,
+)
+
+
+_MERSENNE_PRIME = (1 << 61) - 1
+
+Permutations = List[Tuple[int, int]]
+
+
+@lru_cache(maxsize=None)
+def minhash_permutations(num_perm: int, seed: int = 0) -> Permutations:
+    """Draw the (a, b) coefficients of `num_perm` universal hash permutations.
+
+    Args:
+        num_perm: Number of permutations (signature length)
+        seed: Seed of the coefficient generator; fixed so signatures are stable
+
+    Returns:
+        List of (a, b) pairs for `(a * h + b) mod p`
+    """
+    rng = random.Random(seed)
+    return [
+        (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(_MERSENNE_PRIME))
+        for _ in range(num_perm)
+    ]
+
+
+@lru_cache(maxsize=TITLE_CACHE_SIZE)
+def token_hash(token: str) -> int:
+    """Hash a token into a stable 64-bit integer."""
+
+    return int.from_bytes(
+        hashlib.blake2b(token.encode(), digest_size=8).digest(), "big"
+    )
+
+
+def minhash_signature(
+    tokens: AbstractSet[str], permutations: Permutations
+) -> Tuple[int, ...]:
+    """Compute the MinHash signature of a non-empty token set.
+
+    Two signatures agree in a position with probability equal to the
+    Jaccard similarity of their token sets.
+
+    Args:
+        tokens: Token set (shingles) of one item
+        permutations: Coefficients from `minhash_permutations`
+
+    Returns:
+        One minimum hash per permutation
+    """
+    hashes = [token_hash(token) for token in tokens]
+    return tuple(
+        min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in permutations
+    )
+
+
+def jaccard(a: AbstractSet[str], b: AbstractSet[str]) -> float:
+    """Jaccard similarity of two token sets (0.0 for two empty sets)."""
+
+    union = len(a | b)
+    return len(a & b) / union if union else 0.0
+
+
+def cluster_near_duplicates(
+    token_sets: Sequence[AbstractSet[str]],
+    blocks: Sequence[Iterable[Hashable]] | None = None,
+    threshold: float = NEAR_DUPLICATE_THRESHOLD,
+    num_perm: int = MINHASH_PERMUTATIONS,
+    bands: int = LSH_BANDS,
+    max_representatives: int = LSH_MAX_REPRESENTATIVES,
+) -> List[List[int]]:
+    """Cluster items whose token sets are near duplicates, in linear time.
+
+    Items are bucketed by locality-sensitive hashing of their MinHash
+    signatures (`bands` bands of `num_perm // bands` rows), once per blocking
+    key, so only items sharing a block and a band are compared. Within a
+    bucket, every item is checked by exact Jaccard similarity against the
+    bucket's last `max_representatives` representatives (items that matched
+    no earlier one), which bounds the work per item however large a bucket
+    grows; matches are merged with union-find, so clusters are transitive.
+
+    Args:
+        token_sets: Token set of every item; empty sets are never clustered
+        blocks: Blocking keys of every item (e.g. artist names); items are
+            only compared when they share one. Without blocks, all items
+            share one block
+        threshold: Minimum Jaccard similarity of a near-duplicate pair
+        num_perm: MinHash signature length
+        bands: Number of LSH bands; more bands catch less similar pairs
+        max_representatives: Maximum number of comparisons per item and bucket
+
+    Returns:
+        Clusters of two or more item indices, each in input order, ordered
+        by their first item
+    """
+    permutations = minhash_permutations(num_perm)
+    rows = num_perm // bands
+    buckets: Dict[Tuple[Hashable, int, Tuple[int, ...]], List[int]] = defaultdict(list)
+
+    for i, tokens in enumerate(token_sets):
+        if not tokens:
+            continue
+        signature = minhash_signature(tokens, permutations)
+        for block in set(blocks[i]) if blocks is not None else (None,):
+            for band in range(bands):
+                band_key = signature[band * rows : (band + 1) * rows]
+                buckets[(block, band, band_key)].append(i)
+
+    parent = list(range(len(token_sets)))
+
+    def _find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for members in buckets.values():
+        representatives: List[int] = []
+        for i in members:
+            for r in representatives[-max_representatives:]:
+                if jaccard(token_sets[i], token_sets[r]) >= threshold:
+                    root_i, root_r = _find(i), _find(r)
+                    parent[max(root_i, root_r)] = min(root_i, root_r)
+                    break
+            else:
+                representatives.append(i)
+
+    clusters: Dict[int, List[int]] = defaultdict(list)
+    for i, tokens in enumerate(token_sets):
+        if tokens:
+            clusters[_find(i)].append(i)
+
+    return sorted(
+        (cluster for cluster in clusters.values() if len(cluster) > 1),
+        key=lambda cluster: cluster[0],
+    )
@@ -1,115 +1,523 @@
 import re
+import sqlite3
+import time
 
-import pandas as pd
+import requests
 
 from datetime import date, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Sequence, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 from dotenv import load_dotenv
 
-from spotipy import Spotify
+from spotipy import Spotify, SpotifyException
 from spotipy.oauth2 import CacheFileHandler, SpotifyOAuth
 
 from crate_digger.constants import (
+    ALBUM_TRACKS_LIMIT,
+    BACKFILL_RANGE_YEARS,
     BACKFILL_START_YEAR,
     FETCH_BATCH_SIZE,
     MAX_OFFSET,
+    NEAR_DUPLICATE_IGNORED_TOKENS,
+    PARTITION_MAX_DEPTH,
+    PARTITION_TAGS,
+    PARTITION_TERMS,
+    PLAYLIST_ADD_BATCH_SIZE,
+    PLAYLIST_ITEMS_FIELDS,
+    PLAYLIST_PAGE_SIZE,
     SEARCH_LIMIT,
+    SEARCH_MAX_LIMIT,
+    TITLE_CACHE_SIZE,
+    TRACKS_BATCH_SIZE,
+    USER_PLAYLISTS_PAGE_SIZE,
+    VERSION_PREFERENCE,
+    WRITE_RETRIES,
+    WRITE_RETRY_BACKOFF,
 )
+from crate_digger.utils.cache import ResponseCache
+from crate_digger.utils.concurrency import imap_concurrently, map_concurrently
+from crate_digger.utils.journal import BackfillJournal
 from crate_digger.utils.logging import get_logger, pluralize
-from crate_digger.utils.types import SpotifyAlbum, SpotifyTrack
+from crate_digger.utils.metrics import InstrumentedSpotify, stage
+from crate_digger.utils.ratelimit import RateLimiter
+from crate_digger.utils.similarity import cluster_near_duplicates
+from crate_digger.utils.state import (
+    filter_unprocessed_releases,
+    find_known_fingerprints,
+    hash_fingerprint,
+    mark_release_processed,
+    record_fingerprints,
+)
+from crate_digger.utils.types import (
+    BackfillSummary,
+    ReleasedTrack,
+    SearchShard,
+    SpotifyAlbum,
+    SpotifyAlbumPage,
+    SpotifyTrack,
+)
 
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+TrackT = TypeVar("TrackT", bound=Mapping[str, Any])
+
+TrackKey = Tuple[str, Tuple[str, ...]]
+ReleaseTracks = List[Tuple[SpotifyAlbum, List[SpotifyTrack]]]
+AlbumTracks = Dict[Tuple[str, str], Tuple[List[ReleasedTrack], int]]
 
-def get_spotify_client(scope: str) -> Spotify:
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_PLAYLIST_DATE_RANGE = re.compile(r"(\d{4}(?:-\d{2}){0,2}) - (\d{4}(?:-\d{2}){0,2})")
+
+
+def get_spotify_client(
+    scope: str, cache: ResponseCache | None = None, cache_scope: str | None = None
+) -> InstrumentedSpotify:
     """Create and return an authenticated Spotify client with cached OAuth token.
 
+    All requests of the client share one rate limiter (see `client.limiter`);
+    catalog lookups are answered from `cache` when one is given. Every call
+    is recorded in the process-wide run metrics.
+
+    Args:
+        scope: OAuth scope string for Spotify API permissions
+        cache: Optional response cache for search, album and track lookups
+        cache_scope: Scope naming the token cache file (default: `scope`)
+
+    Returns:
+        Authenticated, rate-limited Spotify client instance
+    """
+    auth = get_auth_manager(scope, cache_scope)
+    sp = InstrumentedSpotify(auth_manager=auth, limiter=RateLimiter(), cache=cache)
+
+    logger.info(f"Instantiated Spotipy client for scope {scope}")
+    return sp
+
+
+def get_auth_manager(scope: str, cache_scope: str | None = None) -> SpotifyOAuth:
+    """Create an OAuth manager backed by the project's token cache file.
+
+    Requesting more scopes than the cached token holds asks for a new
+    authorization once; the new token is stored in the same file.
+
     Args:
         scope: OAuth scope string for Spotify API permissions
+        cache_scope: Scope naming the token cache file (default: `scope`),
+            so a client that needs an extra scope keeps its existing file
 
     Returns:
-        Authenticated Spotify client instance
+        OAuth manager reading and refreshing `.spotipy_cache/.cache-<cache_scope>`
     """
     load_dotenv()
 
+    cache_name = (cache_scope or scope).replace(",", "_")
     project_root = Path(__file__).resolve().parents[3]
-    cache_path = project_root / ".spotipy_cache" / f".cache-{scope.replace(',', '_')}"
+    cache_path = project_root / ".spotipy_cache" / f".cache-{cache_name}"
 
     cache_handler = CacheFileHandler(cache_path=cache_path)
-    auth = SpotifyOAuth(scope=scope, cache_handler=cache_handler)
-    sp = Spotify(auth_manager=auth)
-
-    logger.info(f"Instantiated Spotipy client for scope {scope}")
-    return sp
+    return SpotifyOAuth(scope=scope, cache_handler=cache_handler)
 
 
 def fetch_and_add(
     client: Spotify,
     record_labels: List[str],
     target_playlist: str,
+    max_workers: int = 1,
+    n_days: int = 1,
+    store: sqlite3.Connection | None = None,
 ) -> Dict[str, Dict[str, List[SpotifyTrack]]]:
     """Fetch past day releases from labels, deduplicate, and add to playlist.
 
+    Labels are fetched on a bounded thread pool when max_workers > 1; results
+    are merged in `record_labels` order, so the output and playlist ordering
+    match the sequential run. The ISRCs of all released tracks are then
+    looked up in shared `tracks` batches so dedupe can key on them.
+
+    With a release store, releases processed by earlier runs are skipped and
+    the added ones are recorded, so a multi-day `n_days` window can catch up
+    on missed runs without duplicating playlist entries. Tracks whose
+    fingerprint was added before (by any label, in any run) are skipped too.
+
     Args:
         client: Authenticated Spotify client
         record_labels: List of record label names to search
         target_playlist: Spotify playlist URI to add tracks to
+        max_workers: Maximum number of labels fetched concurrently
+        n_days: Number of past days (ending yesterday) to pick releases from
+        store: Optional processed-release store connection
 
     Returns:
         Dict mapping labels to their releases and tracks for notification
     """
-    uris_to_add = []
-    track_info_to_send: Dict[str, Dict[str, List[SpotifyTrack]]] = {}
+    with stage("find_releases"):
+        relevant_releases = fetch_new_relevant_releases_by_label(
+            client, record_labels, max_workers, n_days=n_days, store=store
+        )
 
-    for label in record_labels:
-        label_tracks_to_add: List[SpotifyTrack] = []
-        relevant_releases = fetch_new_relevant_releases(client, label)
+    with stage("fetch_tracks"):
+        label_release_tracks = map_concurrently(
+            lambda label: fetch_release_tracks(client, relevant_releases[label]),
+            record_labels,
+            max_workers,
+        )
 
-        if relevant_releases:
-            track_info_to_send[label] = {}
+    with stage("enrich_tracks"):
+        isrcs = fetch_track_isrcs(
+            client, released_track_uris(label_release_tracks), max_workers
+        )
+    label_results = [
+        select_release_tracks(release_tracks, isrcs)
+        for release_tracks in label_release_tracks
+    ]
 
-        for release in relevant_releases:
-            released_tracks = fetch_album_tracks(client, release)
-            filtered_tracks = remove_extended_versions(released_tracks)
-            label_tracks_to_add.extend(filtered_tracks)
-            track_info_to_send[label][release["name"]] = released_tracks
+    track_info_to_send, uris_to_add = merge_label_results(record_labels, label_results)
 
-        deduped_tracks = dedupe_tracks(label_tracks_to_add)
-        uris_to_add.extend(extract_track_uris(deduped_tracks))
+    if store is not None:
+        tracks_to_add = select_unseen_tracks(
+            store, lookup_tracks(track_info_to_send, uris_to_add)
+        )
+        uris_to_add = extract_track_uris(tracks_to_add)
 
     if track_info_to_send:
-        add_to_playlist(client, target_playlist, uris_to_add)
+        with stage("write_playlist"):
+            add_to_playlist(client, target_playlist, uris_to_add)
+
+    if store is not None:
+        record_processed_releases(store, relevant_releases)
+        record_track_fingerprints(store, tracks_to_add)
 
     return track_info_to_send
 
 
-def fetch_new_relevant_releases(client: Spotify, label: str) -> List[SpotifyAlbum]:
-    """Fetch past day releases from a label with exact label name matching.
+def merge_label_results(
+    record_labels: List[str],
+    label_results: List[Tuple[ReleaseTracks, List[str]]],
+) -> Tuple[Dict[str, Dict[str, List[SpotifyTrack]]], List[str]]:
+    """Merge per-label results in label order.
+
+    Releases are keyed by name only here, for the notification; tracks of
+    same-named releases of a label (e.g. two "Remixes") are listed together.
+
+    Args:
+        record_labels: Label names, in config order
+        label_results: `select_release_tracks` results, one per label
+
+    Returns:
+        Tuple of (label -> release name -> tracks for notification, track URIs to add)
+    """
+    uris_to_add: List[str] = []
+    track_info_to_send: Dict[str, Dict[str, List[SpotifyTrack]]] = {}
+
+    for label, (release_tracks, label_uris) in zip(record_labels, label_results):
+        if release_tracks:
+            releases_info: Dict[str, List[SpotifyTrack]] = {}
+            for release, tracks in release_tracks:
+                releases_info.setdefault(release["name"], []).extend(tracks)
+            track_info_to_send[label] = releases_info
+        uris_to_add.extend(label_uris)
+
+    return track_info_to_send, uris_to_add
+
+
+def record_processed_releases(
+    store: sqlite3.Connection, relevant_releases: Dict[str, List[SpotifyAlbum]]
+) -> None:
+    """Record every release handled in this run in the processed-release store.
+
+    Args:
+        store: Open release store connection
+        relevant_releases: Label -> verified album objects
+    """
+    for label, releases in relevant_releases.items():
+        for release in releases:
+            mark_release_processed(store, label, release)
+
+
+def record_rejected_releases(
+    store: sqlite3.Connection,
+    releases_by_label: Dict[str, List[SpotifyAlbum]],
+    relevant_releases: Dict[str, List[SpotifyAlbum]],
+) -> None:
+    """Record search candidates that failed label verification for every label.
+
+    Recorded candidates are dropped by `filter_unprocessed_releases`, so
+    look-alike-label releases are not sent to `albums` again on every run.
+
+    Args:
+        store: Open release store connection
+        releases_by_label: Label -> album objects from search
+        relevant_releases: Label -> verified album objects
+    """
+    verified_uris = {r["uri"] for rs in relevant_releases.values() for r in rs}
+    for label, releases in releases_by_label.items():
+        for release in releases:
+            if release["uri"] not in verified_uris:
+                mark_release_processed(store, label, release, verified=False)
+
+
+def lookup_tracks(
+    track_info: Dict[str, Dict[str, List[SpotifyTrack]]], track_uris: List[str]
+) -> List[SpotifyTrack]:
+    """Map track URIs back to their track objects.
+
+    Args:
+        track_info: Label -> release name -> tracks, as built by `merge_label_results`
+        track_uris: URIs of tracks in `track_info`
+
+    Returns:
+        Track objects in `track_uris` order
+    """
+    tracks_by_uri = {
+        track["uri"]: track
+        for releases_info in track_info.values()
+        for tracks in releases_info.values()
+        for track in tracks
+    }
+    return [tracks_by_uri[uri] for uri in track_uris]
+
+
+def select_unseen_tracks(
+    store: sqlite3.Connection, tracks: Sequence[SpotifyTrack]
+) -> List[SpotifyTrack]:
+    """Drop tracks whose fingerprint was already added, by an earlier run or label.
+
+    A track counts as seen when any of its `track_fingerprints` is in the
+    store or belongs to an earlier track of `tracks`.
+
+    Args:
+        store: Open release store connection
+        tracks: Candidate tracks, in playlist order
+
+    Returns:
+        Unseen tracks in input order
+    """
+    fingerprints = [track_fingerprints(track) for track in tracks]
+    seen = find_known_fingerprints(store, (f for fs in fingerprints for f in fs))
+
+    unseen: List[SpotifyTrack] = []
+    for track, track_fps in zip(tracks, fingerprints):
+        if seen.isdisjoint(track_fps):
+            unseen.append(track)
+        seen.update(track_fps)
+
+    n_dropped = len(tracks) - len(unseen)
+    if n_dropped:
+        logger.info(
+            f"Dropped {n_dropped} previously added {pluralize(n_dropped, 'track')}"
+        )
+    return unseen
+
+
+def record_track_fingerprints(
+    store: sqlite3.Connection, tracks: Sequence[SpotifyTrack]
+) -> None:
+    """Record the fingerprints of added tracks, evicting expired ones.
+
+    Args:
+        store: Open release store connection
+        tracks: Tracks added to the playlist
+    """
+    n_evicted = record_fingerprints(
+        store, (f for track in tracks for f in track_fingerprints(track))
+    )
+    if n_evicted:
+        logger.info(
+            f"Evicted {n_evicted} expired track {pluralize(n_evicted, 'fingerprint')}"
+        )
+
+
+def fetch_release_tracks(
+    client: Spotify, releases: List[SpotifyAlbum]
+) -> ReleaseTracks:
+    """Fetch tracks of a label's releases.
 
     Args:
         client: Authenticated Spotify client
-        label: Record label name to search for
+        releases: Verified album objects of a single label
+
+    Returns:
+        (release, released tracks) pairs in release order; releases sharing a
+        name stay separate
+    """
+    return [(release, fetch_album_tracks(client, release)) for release in releases]
+
+
+def released_track_uris(label_release_tracks: List[ReleaseTracks]) -> List[str]:
+    """Collect the unique track URIs of `fetch_release_tracks` results, in order."""
+
+    return list(
+        dict.fromkeys(
+            track["uri"]
+            for release_tracks in label_release_tracks
+            for _, tracks in release_tracks
+            for track in tracks
+        )
+    )
+
+
+def fetch_track_isrcs(
+    client: Spotify, track_uris: List[str], max_workers: int = 1
+) -> Dict[str, str]:
+    """Look up the ISRCs of tracks through the batched `tracks` endpoint.
+
+    Simplified track objects (from albums and `album_tracks`) carry no
+    `external_ids`, so full track objects are fetched TRACKS_BATCH_SIZE at a
+    time, on a bounded thread pool when max_workers > 1. Responses go through
+    the client's response cache like other catalog lookups.
+
+    Args:
+        client: Authenticated Spotify client
+        track_uris: Track URIs to look up
+        max_workers: Maximum number of batches fetched concurrently
 
     Returns:
-        List of album objects released exactly n days ago with exact label match
+        Dict mapping track URIs to ISRCs, for tracks that have one
     """
-    new_releases = fetch_new_releases(client, label)
-    yesterdays_releases = filter_releases_by_date(new_releases, n_days=1)
-    relevant_releases = filter_exact_label_releases(client, yesterdays_releases, label)
+    responses = map_concurrently(
+        lambda uris_chunk: client.tracks(list(uris_chunk)),
+        batch(track_uris, TRACKS_BATCH_SIZE),
+        max_workers,
+    )
+    isrcs = extract_isrcs(responses)
 
-    n_releases = len(relevant_releases)
+    n_tracks = len(track_uris)
     logger.info(
-        f"Fetched {n_releases} new {pluralize(n_releases, 'release')} for label {label}"
+        f"Fetched ISRCs of {len(isrcs)} of {n_tracks} {pluralize(n_tracks, 'track')}"
+    )
+    return isrcs
+
+
+def extract_isrcs(responses: Iterable[Dict]) -> Dict[str, str]:
+    """Map track URIs to ISRCs from `tracks` responses.
+
+    Args:
+        responses: Responses of the `tracks` endpoint
+
+    Returns:
+        Dict mapping track URIs to ISRCs; unknown tracks and tracks without
+        an ISRC are left out
+    """
+    return {
+        track["uri"]: track["external_ids"]["isrc"]
+        for response in responses
+        for track in response["tracks"]
+        if track and track.get("external_ids", {}).get("isrc")
+    }
+
+
+def select_release_tracks(
+    release_tracks: ReleaseTracks, isrcs: Mapping[str, str]
+) -> Tuple[ReleaseTracks, List[str]]:
+    """Attach ISRCs to a label's released tracks and pick the track URIs to add.
+
+    Args:
+        release_tracks: (release, released tracks) pairs, from `fetch_release_tracks`
+        isrcs: Track URI -> ISRC, from `fetch_track_isrcs`
+
+    Returns:
+        Tuple of ((release, released tracks) pairs, deduplicated track URIs to add)
+    """
+    enriched = [
+        (release, with_isrcs(tracks, isrcs)) for release, tracks in release_tracks
+    ]
+    label_tracks_to_add = [
+        track for _, tracks in enriched for track in remove_extended_versions(tracks)
+    ]
+
+    deduped_tracks = dedupe_tracks(label_tracks_to_add)
+    return enriched, extract_track_uris(deduped_tracks)
+
+
+def with_isrcs(
+    tracks: List[SpotifyTrack], isrcs: Mapping[str, str]
+) -> List[SpotifyTrack]:
+    """Copy tracks with a known ISRC into tracks carrying `external_ids`.
+
+    Args:
+        tracks: Spotify track objects
+        isrcs: Track URI -> ISRC
+
+    Returns:
+        Tracks in input order; tracks without a known ISRC are returned as is
+    """
+    return [
+        {**track, "external_ids": {"isrc": isrcs[track["uri"]]}}
+        if track["uri"] in isrcs
+        else track
+        for track in tracks
+    ]
+
+
+def fetch_new_relevant_releases_by_label(
+    client: Spotify,
+    labels: List[str],
+    max_workers: int = 1,
+    n_days: int = 1,
+    store: sqlite3.Connection | None = None,
+) -> Dict[str, List[SpotifyAlbum]]:
+    """Fetch recent releases for many labels, verifying labels in shared batches.
+
+    Searches run per label; the candidates of all labels are then verified
+    together so every `albums` request carries a full batch. Releases already
+    in the store are dropped before verification, and candidates that fail it
+    are recorded there.
+
+    Args:
+        client: Authenticated Spotify client
+        labels: Record label names to search for
+        max_workers: Maximum number of concurrent requests
+        n_days: Number of past days (ending yesterday) to pick releases from
+        store: Optional processed-release store connection
+
+    Returns:
+        Dict mapping each label (in input order) to its verified album objects
+    """
+    candidates = map_concurrently(
+        lambda label: filter_recent_releases(
+            fetch_new_releases(client, label), n_days=n_days
+        ),
+        labels,
+        max_workers,
+    )
+
+    if store is not None:
+        candidates = [filter_unprocessed_releases(store, c) for c in candidates]
+
+    releases_by_label = dict(zip(labels, candidates))
+    relevant_releases = filter_exact_label_releases_by_label(
+        client, releases_by_label, max_workers
     )
 
+    if store is not None:
+        record_rejected_releases(store, releases_by_label, relevant_releases)
+
+    for label, releases in relevant_releases.items():
+        n_releases = len(releases)
+        logger.info(
+            f"Fetched {n_releases} new {pluralize(n_releases, 'release')} for label {label}"
+        )
+
     return relevant_releases
 
 
 def fetch_new_releases(client: Spotify, label: str) -> List[SpotifyAlbum]:
     """Search Spotify for new releases tagged with the given label.
 
+    `tag:new` covers the last two weeks, more than one SEARCH_LIMIT page for
+    a busy label, so the search is paged until its last page (or MAX_OFFSET).
+
     Args:
         client: Authenticated Spotify client
         label: Record label name to search for
@@ -117,12 +525,41 @@ def fetch_new_releases(client: Spotify, label: str) -> List[SpotifyAlbum]:
     Returns:
         List of album objects from Spotify search results
     """
-    new_releases = client.search(
-        f"label:{label.replace("'", '')} tag:new", limit=SEARCH_LIMIT, type="album"
-    )["albums"]["items"]
+    page = client.search(new_releases_query(label), limit=SEARCH_LIMIT, type="album")[
+        "albums"
+    ]
+    new_releases: List[SpotifyAlbum] = list(page["items"])
+
+    while has_next_search_page(page, len(new_releases)):
+        page = client.next(page)["albums"]
+        new_releases.extend(page["items"])
+
+    log_truncated_search(label, page, len(new_releases))
     return new_releases
 
 
+def new_releases_query(label: str) -> str:
+    """Build the search query for a label's releases tagged as new."""
+
+    return f"label:{label.replace("'", '')} tag:new"
+
+
+def has_next_search_page(page: SpotifyAlbumPage, n_releases: int) -> bool:
+    """Check if a search has another page within MAX_OFFSET."""
+
+    return bool(page.get("next")) and n_releases < MAX_OFFSET
+
+
+def log_truncated_search(label: str, page: SpotifyAlbumPage, n_releases: int) -> None:
+    """Warn when a new-release search reports more results than could be paged."""
+
+    total = page.get("total")
+    if total is not None and total > n_releases:
+        logger.warning(
+            f"New release search for {label} stopped at {n_releases} of {total} releases"
+        )
+
+
 def batch(iterable: Sequence[str], size: int) -> Iterable[Sequence[str]]:
     """Yield fixed-size slices from a sequence."""
 
@@ -130,44 +567,90 @@ def batch(iterable: Sequence[str], size: int) -> Iterable[Sequence[str]]:
         yield iterable[i : i + size]
 
 
-def filter_releases_by_date(
-    releases: List[SpotifyAlbum], n_days: int = 7
+def filter_recent_releases(
+    releases: List[SpotifyAlbum], n_days: int = 1
 ) -> List[SpotifyAlbum]:
-    """Filter releases to only those with release dates exactly n days ago.
+    """Filter releases to those released within the past n days, excluding today.
 
     Args:
         releases: List of Spotify album objects
+        n_days: Window length; 1 keeps only yesterday's releases
 
     Returns:
-        Filtered list containing only releases exactly n days ago
+        Filtered list containing only releases from the last n days
     """
-    target_date = date.today() - timedelta(days=n_days)
-    return [r for r in releases if date.fromisoformat(r["release_date"]) == target_date]
+    today = date.today()
+    first_date = today - timedelta(days=n_days)
+    return [
+        r
+        for r in releases
+        if first_date <= date.fromisoformat(r["release_date"]) < today
+    ]
 
 
-def filter_exact_label_releases(
-    client: Spotify, releases: List[SpotifyAlbum], label: str
-) -> List[SpotifyAlbum]:
-    """Fetch full album details and filter to exact label name matches.
+def filter_exact_label_releases_by_label(
+    client: Spotify,
+    releases_by_label: Dict[str, List[SpotifyAlbum]],
+    max_workers: int = 1,
+) -> Dict[str, List[SpotifyAlbum]]:
+    """Verify search candidates of many labels with shared `albums` batches.
 
-    Spotify search may return approximate matches; this verifies the label field.
+    Candidate URIs of all labels are pooled into full FETCH_BATCH_SIZE batches,
+    and each verified album is routed back to the label that searched for it.
 
     Args:
         client: Authenticated Spotify client
-        releases: List of album objects from search results
-        label: Exact label name to match
+        releases_by_label: Dict mapping label names to album objects from search
+        max_workers: Maximum number of concurrent `albums` requests
 
     Returns:
-        List of albums with exact label match
+        Dict mapping each label to its albums with exact label match
     """
-    release_uris = [r["uri"] for r in releases]
-    releases_with_correct_label = []
+    release_uris = candidate_release_uris(releases_by_label)
+
+    full_album_batches = map_concurrently(
+        lambda uris_chunk: client.albums(uris_chunk)["albums"],
+        batch(release_uris, FETCH_BATCH_SIZE),
+        max_workers,
+    )
+    return select_exact_label_releases(
+        releases_by_label, [a for albums in full_album_batches for a in albums]
+    )
 
-    for uris_chunk in batch(release_uris, FETCH_BATCH_SIZE):
-        full_albums = client.albums(uris_chunk)["albums"]
-        releases_with_correct_label.extend(
-            [a for a in full_albums if a["label"] == label]
+
+def candidate_release_uris(
+    releases_by_label: Dict[str, List[SpotifyAlbum]],
+) -> List[str]:
+    """List the unique candidate URIs of all labels, in label order."""
+
+    return list(
+        dict.fromkeys(
+            r["uri"] for releases in releases_by_label.values() for r in releases
         )
+    )
+
+
+def select_exact_label_releases(
+    releases_by_label: Dict[str, List[SpotifyAlbum]],
+    full_albums: Iterable[SpotifyAlbum | None],
+) -> Dict[str, List[SpotifyAlbum]]:
+    """Route full album objects back to the labels whose search found them.
+
+    Args:
+        releases_by_label: Dict mapping label names to album objects from search
+        full_albums: Full album objects from `albums` (None for unknown IDs)
+
+    Returns:
+        Dict mapping each label to its albums with exact label match
+    """
+    albums_by_uri = {a["uri"]: a for a in full_albums if a is not None}
+    releases_with_correct_label: Dict[str, List[SpotifyAlbum]] = {}
+
+    for label, releases in releases_by_label.items():
+        verified = (albums_by_uri.get(r["uri"]) for r in releases)
+        releases_with_correct_label[label] = [
+            a for a in verified if a is not None and a["label"] == label
+        ]
 
     return releases_with_correct_label
 
@@ -175,6 +658,10 @@ def filter_exact_label_releases(
 def fetch_album_tracks(client: Spotify, album: SpotifyAlbum) -> List[SpotifyTrack]:
     """Fetch all tracks for a given album.
 
+    Full album objects (from `albums`) already embed the first page of tracks;
+    it is reused and only the remaining pages are requested. Simplified album
+    objects fall back to `album_tracks`.
+
     Args:
         client: Authenticated Spotify client
         album: Spotify album object
@@ -182,7 +669,13 @@ def fetch_album_tracks(client: Spotify, album: SpotifyAlbum) -> List[SpotifyTrac
     Returns:
         List of track objects from the album
     """
-    album_tracks: List[SpotifyTrack] = client.album_tracks(album["uri"])["items"]
+    track_page = album.get("tracks") or client.album_tracks(album["uri"])
+    album_tracks: List[SpotifyTrack] = list(track_page["items"])
+
+    while track_page.get("next"):
+        track_page = client.next(track_page)
+        album_tracks.extend(track_page["items"])
+
     n_album_tracks = len(album_tracks)
     logger.info(
         f"Fetched {n_album_tracks} {pluralize(n_album_tracks, 'track')} for release {album['name']}"
@@ -204,288 +697,1631 @@ def extract_track_uris(tracks: List[SpotifyTrack]) -> List[str]:
     return track_uris
 
 
+@lru_cache(maxsize=TITLE_CACHE_SIZE)
 def normalize_title(title: str) -> str:
-    """Normalize a track title for comparison (lowercase, punctuation/whitespace collapsed)."""
-
-    return " ".join(re.sub(r"[^\w\s]", "", title.lower()).split())
+    """Normalize a track title for comparison (lowercase, punctuation/whitespace collapsed).
 
+    Results are memoized per raw title (up to TITLE_CACHE_SIZE titles), so
+    titles repeated across releases and labels are normalized once per run.
+    """
+    return " ".join(_PUNCTUATION.sub("", title.lower()).split())
 
-def is_extended_version(normalized_title: str) -> bool:
-    """Check if a normalized title indicates an extended version.
 
-    Args:
-        normalized_title: Pre-normalized title string
+def normalize_titles(titles: Iterable[str]) -> List[str]:
+    """Normalize a batch of titles with `normalize_title`."""
 
-    Returns:
-        True if title contains 'extended' keyword
-    """
-    return "extended" in normalized_title
+    return list(map(normalize_title, titles))
 
 
-def base_title(normalized_title: str) -> str:
-    """Extract base title by removing 'extended' suffixes.
+def track_key(track: SpotifyTrack) -> TrackKey:
+    """Build the dedupe key of a track from its normalized title and artists.
 
     Args:
-        normalized_title: Pre-normalized title string
+        track: Spotify track object
 
     Returns:
-        Base title with extended version indicators removed
+        Tuple of (normalized title, normalized artist names in credit order)
     """
-    return normalized_title.replace(" extended mix", "").replace(" extended", "")
+    return (
+        normalize_title(track["name"]),
+        tuple(normalize_titles(artist["name"] for artist in track["artists"])),
+    )
 
 
-def remove_extended_versions(tracks: List[SpotifyTrack]) -> List[SpotifyTrack]:
-    """Drop extended versions when an original exists, without mutating input track dicts."""
+def track_isrc(track: SpotifyTrack) -> str | None:
+    """Return the upper-cased ISRC of a track, or None if it is not known."""
 
-    sorted_tracks = sorted(tracks, key=lambda t: len(t["name"]))
+    isrc = track.get("external_ids", {}).get("isrc")
+    return isrc.upper() if isrc else None
 
-    unique_tracks: List[SpotifyTrack] = []
-    seen_titles: set[str] = set()
 
-    for track in sorted_tracks:
-        normalized = normalize_title(track["name"])
-        base = base_title(normalized)
+def dedupe_keys(track: SpotifyTrack) -> List[TrackKey | Tuple[str, str]]:
+    """Build the dedupe keys of a track: its `track_key`, plus its ISRC when known.
 
-        if is_extended_version(normalized) and base in seen_titles:
-            continue
+    Args:
+        track: Spotify track object
 
-        seen_titles.add(base)
-        unique_tracks.append(track)
+    Returns:
+        The `track_key`, followed by ("isrc", ISRC) for tracks with an ISRC
+    """
+    keys: List[TrackKey | Tuple[str, str]] = [track_key(track)]
 
-    n_dropped_tracks = len(tracks) - len(unique_tracks)
+    isrc = track_isrc(track)
+    if isrc:
+        keys.append(("isrc", isrc))
 
-    if n_dropped_tracks:
-        logger.info(
-            f"Dropped {n_dropped_tracks} extended {pluralize(n_dropped_tracks, 'mix', 'mixes')}"
-        )
+    return keys
 
-    return unique_tracks
 
+def track_fingerprints(track: SpotifyTrack) -> List[int]:
+    """Build the persistent fingerprints of a track.
 
-def dedupe_tracks(tracks: Sequence[SpotifyTrack]) -> List[SpotifyTrack]:
-    """Remove duplicate tracks based on (name, artists) key.
+    Every track gets a fingerprint of its `track_key`; tracks with a known
+    ISRC get a second one, so re-releases match on either.
 
     Args:
-        tracks: Sequence of Spotify track objects
+        track: Spotify track object
 
     Returns:
-        Deduplicated list of tracks
+        Fingerprints from `hash_fingerprint` (name first, then ISRC)
     """
-    deduped: List[SpotifyTrack] = []
-    seen: set[Tuple[str, Tuple[str, ...]]] = set()
+    title, artists = track_key(track)
+    keys = ["\x1f".join((title, *artists))]
 
-    for track in tracks:
-        key = (
-            track["name"].lower(),
-            tuple(artist["name"].lower() for artist in track["artists"]),
-        )
-        if key in seen:
-            continue
-        seen.add(key)
-        deduped.append(track)
+    isrc = track_isrc(track)
+    if isrc:
+        keys.append(f"isrc:{isrc}")
 
-    return deduped
+    return [hash_fingerprint(key) for key in keys]
 
 
-def add_to_playlist(client: Spotify, playlist_id: str, track_uris: List[str]) -> Dict:
-    """Add tracks to a Spotify playlist.
+def is_extended_version(normalized_title: str) -> bool:
+    """Check if a normalized title indicates an extended version.
 
     Args:
-        client: Authenticated Spotify client
-        playlist_id: Spotify playlist URI
-        track_uris: List of track URIs to add
+        normalized_title: Pre-normalized title string
 
     Returns:
-        Snapshot ID dict from Spotify API
+        True if title contains 'extended' keyword
     """
-    snapshot_id = client.playlist_add_items(playlist_id, track_uris)
+    return "extended" in normalized_title
 
-    n_added_tracks = len(track_uris)
-    logger.info(
-        f"Added {n_added_tracks} new {pluralize(n_added_tracks, 'track')} to the playlist"
+
+def base_title(normalized_title: str) -> str:
+    """Extract base title by removing version suffixes.
+
+    Args:
+        normalized_title: Pre-normalized title string
+
+    Returns:
+        Base title with extended, radio edit and original mix indicators removed
+    """
+    return (
+        normalized_title.replace(" extended mix", "")
+        .replace(" extended", "")
+        .replace(" radio edit", "")
+        .replace(" original mix", "")
     )
 
-    return snapshot_id
 
+def near_duplicate_tokens(track: ReleasedTrack) -> frozenset[str]:
+    """Tokenize the title of a backfill track for near-duplicate detection.
 
-def fetch_all_releases(client: Spotify, label: str) -> List[SpotifyAlbum]:
-    """Fetch all releases for a label from BACKFILL_START_YEAR to present.
+    Version suffixes (see `base_title`), NEAR_DUPLICATE_IGNORED_TOKENS and
+    words of the track's own artist names are dropped, so "Song (feat. B)"
+    by A, B and "Song VIP" by A both reduce to the tokens of "Song". Artists
+    are compared separately (see `resolve_near_duplicates`).
 
     Args:
-        client: Authenticated Spotify client
-        label: Record label name
+        track: Backfill track record
 
     Returns:
-        List of all album objects for the label
+        Title token set, empty for records without a name
     """
-    releases = []
-    search_normalized_label = label.replace("'", "")
-
-    for year in range(BACKFILL_START_YEAR, date.today().year + 1):
-        len_beginning = len(releases)
-
-        offset = 0
-
-        page_of_found_releases = client.search(
-            f"label:{search_normalized_label} year:{year}",
-            type="album",
-            offset=offset,
-            limit=SEARCH_LIMIT,
-        )["albums"]["items"]
-
-        while page_of_found_releases:
-            releases.extend(page_of_found_releases)
-            offset += SEARCH_LIMIT
-
-            if offset + SEARCH_LIMIT > MAX_OFFSET:
-                break
-
-            page_of_found_releases = client.search(
-                f"label:{search_normalized_label} year:{year}",
-                type="album",
-                offset=offset,
-                limit=SEARCH_LIMIT,
-            )["albums"]["items"]
-        len_end = len(releases)
-        if len_end != len_beginning:
-            logger.info(
-                f"Fetched {len_end - len_beginning} {pluralize(len_end - len_beginning, 'release')} for year {year}"
-            )
+    if "name" not in track:
+        return frozenset()
 
-    logger.info(f"Fetched {len(releases)} releases in total")
+    tokens = frozenset(base_title(normalize_title(track["name"])).split())
+    tokens = tokens.difference(NEAR_DUPLICATE_IGNORED_TOKENS)
+    artist_tokens = {t for a in normalize_titles(track["artists"]) for t in a.split()}
+    return tokens - artist_tokens or tokens
 
-    return releases
 
+def resolve_near_duplicates(
+    label: str, tracks: Sequence[ReleasedTrack], collapse: bool = False
+) -> List[ReleasedTrack]:
+    """Report near-duplicate tracks of a label's catalog, optionally collapsing them.
 
-def parse_releases(releases: List[SpotifyAlbum]) -> pd.DataFrame:
-    """Parse and clean release data into DataFrame with deduplication.
+    Clusters come from `cluster_near_duplicates` (MinHash/LSH over the
+    `near_duplicate_tokens` of the titles), blocked by normalized artist name:
+    two tracks are only near duplicates when their titles are similar and
+    they share a credited artist. When collapsing, the first track of every
+    cluster, i.e. the earliest release, is kept.
 
     Args:
-        releases: List of Spotify album objects
+        label: Label name, for logging
+        tracks: Backfill tracks in release date order
+        collapse: Drop all but the first track of every cluster
 
     Returns:
-        Cleaned and deduplicated DataFrame of releases sorted by date
+        Tracks in input order, without the collapsed near duplicates
     """
-    release_df = pd.DataFrame(releases)
-
-    size_beginning = release_df.shape[0]
-
-    release_df = release_df.drop(
-        ["artists", "images", "available_markets", "external_urls"], axis=1
+    clusters = cluster_near_duplicates(
+        [near_duplicate_tokens(t) for t in tracks],
+        [normalize_titles(t.get("artists", [])) for t in tracks],
     )
 
-    release_df = release_df.drop_duplicates(["uri"])
-
-    size_unique = release_df.shape[0]
-    n_duplicates_dropped = size_beginning - size_unique
+    n_clusters = len(clusters)
+    n_duplicates = sum(len(cluster) - 1 for cluster in clusters)
     logger.info(
-        f"Dropped {n_duplicates_dropped} duplicate{'s' if n_duplicates_dropped != 1 else ''}"
+        f"{label}: {n_duplicates} near-duplicate {pluralize(n_duplicates, 'track')} "
+        f"in {n_clusters} {pluralize(n_clusters, 'cluster')}"
     )
+    for cluster in clusters:
+        logger.debug(
+            f"{label}: near duplicates "
+            + " | ".join(
+                f"{tracks[i]['name']} ({tracks[i]['release_date']})" for i in cluster
+            )
+        )
 
-    release_df = release_df.sort_values("release_date")
-    logger.info(
-        f"{release_df.shape[0]} {pluralize(release_df.shape[0], 'release')} left"
-    )
+    if not collapse:
+        return list(tracks)
 
-    return release_df
+    duplicates = {i for cluster in clusters for i in cluster[1:]}
+    return [track for i, track in enumerate(tracks) if i not in duplicates]
 
 
-def fetch_all_release_uris(client: Spotify, label: str) -> pd.Series:
-    """Fetch and parse all release URIs for a label.
+def version_rank(
+    normalized_title: str, preference: Sequence[str] = VERSION_PREFERENCE
+) -> int:
+    """Rank the version of a track by a preference order (lower is preferred).
 
     Args:
-        client: Authenticated Spotify client
-        label: Record label name
+        normalized_title: Pre-normalized title string
+        preference: Version names, most preferred first; every name except
+            "original" is a phrase marking that version in a title, and
+            titles without any of them are originals
 
     Returns:
-        Series of release URIs
+        Index of the track's version in `preference`
     """
-    all_releases = fetch_all_releases(client, label)
-    parsed_df = parse_releases(all_releases)
-    release_uris = parsed_df.uri
-    return release_uris
+    for rank, version in enumerate(preference):
+        if version != "original" and version in normalized_title:
+            return rank
+    return preference.index("original")
 
 
-def collect_tracks_from_albums(
-    client: Spotify, album_uris: pd.Series, label: str
-) -> List[str]:
-    """Collect all track URIs from albums, filtering extended versions.
+def resolve_versions(
+    tracks: Sequence[TrackT], preference: Sequence[str] = VERSION_PREFERENCE
+) -> List[TrackT]:
+    """Keep only the preferred version of every song, in one linear pass.
+
+    Tracks are grouped by (base title, artist set); within a group only the
+    tracks of the most preferred version present are kept. A song without
+    an original therefore keeps its radio edit or extended mix. Input order
+    is preserved and input dicts are not mutated.
 
     Args:
-        client: Authenticated Spotify client
-        album_uris: Series of album URIs
-        label: Exact label name to verify
+        tracks: Track objects with `name` and `artists`
+        preference: Version names, most preferred first (see `version_rank`)
 
     Returns:
-        List of track URIs with extended versions removed
+        Tracks of the preferred versions, in input order
     """
-    total_dropped = 0
-    all_track_uris = []
+    keys: List[Tuple[str, frozenset[str]]] = []
+    ranks: List[int] = []
+    best: Dict[Tuple[str, frozenset[str]], int] = {}
 
-    for uris_batch in batch(list(album_uris), FETCH_BATCH_SIZE):
-        album_batch = [
-            a for a in client.albums(uris_batch)["albums"] if a["label"] == label
-        ]
+    for track, normalized in zip(tracks, normalize_titles(t["name"] for t in tracks)):
+        key = (
+            base_title(normalized),
+            frozenset(normalize_titles(a["name"] for a in track["artists"])),
+        )
+        rank = version_rank(normalized, preference)
+        keys.append(key)
+        ranks.append(rank)
+        best[key] = min(rank, best.get(key, rank))
 
-        for album in album_batch:
-            album_tracks = album["tracks"]["items"]
-            unique_track_uris = [
-                t["uri"] for t in album_tracks if "extended" not in t["name"].lower()
-            ]
-            total_dropped += len(album_tracks) - len(unique_track_uris)
-            all_track_uris.extend(unique_track_uris)
+    return [track for track, key, rank in zip(tracks, keys, ranks) if rank == best[key]]
 
-    logger.info(
-        f"{len(all_track_uris)} {pluralize(len(all_track_uris), 'track')} found"
-    )
-    logger.info(f"{total_dropped} {pluralize(total_dropped, 'track')} dropped")
 
-    return all_track_uris
+def remove_extended_versions(tracks: List[SpotifyTrack]) -> List[SpotifyTrack]:
+    """Keep the preferred version of every song of a release (see `resolve_versions`)."""
 
+    unique_tracks = resolve_versions(tracks)
+    n_dropped_tracks = len(tracks) - len(unique_tracks)
 
-def create_playlists(
-    client: Spotify, playlist_name: str, track_uris: List[str], step_size: int = 50
+    if n_dropped_tracks:
+        logger.info(
+            f"Dropped {n_dropped_tracks} less preferred track {pluralize(n_dropped_tracks, 'version')}"
+        )
+
+    return unique_tracks
+
+
+def dedupe_tracks(tracks: Sequence[SpotifyTrack]) -> List[SpotifyTrack]:
+    """Remove duplicate tracks based on their `dedupe_keys`.
+
+    A track is a duplicate when its normalized name key or its ISRC matches
+    one of an earlier track, so the same song is caught whether or not each
+    copy carries an ISRC, and re-issues under a new ISRC are caught by name.
+
+    Args:
+        tracks: Sequence of Spotify track objects
+
+    Returns:
+        Deduplicated list of tracks
+    """
+    deduped: List[SpotifyTrack] = []
+    seen: set[TrackKey | Tuple[str, str]] = set()
+
+    for track in tracks:
+        keys = dedupe_keys(track)
+        if not seen.isdisjoint(keys):
+            seen.update(keys)
+            continue
+        seen.update(keys)
+        deduped.append(track)
+
+    return deduped
+
+
+def fetch_playlist_track_uris(client: Spotify, playlist_id: str) -> set[str]:
+    """Load the URIs of all tracks currently in a playlist.
+
+    Pages through the playlist requesting only the track URIs.
+
+    Args:
+        client: Authenticated Spotify client
+        playlist_id: Spotify playlist URI
+
+    Returns:
+        Set of track URIs in the playlist
+    """
+    track_uris: set[str] = set()
+    page = client.playlist_items(
+        playlist_id, fields=PLAYLIST_ITEMS_FIELDS, limit=PLAYLIST_PAGE_SIZE
+    )
+
+    while page:
+        track_uris.update(
+            item["track"]["uri"] for item in page["items"] if item.get("track")
+        )
+        page = client.next(page) if page.get("next") else None
+
+    return track_uris
+
+
+def add_to_playlist(
+    client: Spotify,
+    playlist_id: str,
+    track_uris: List[str],
+    skip_existing: bool = True,
+) -> Dict | None:
+    """Add tracks to a Spotify playlist in API-sized chunks, skipping known tracks.
+
+    Args:
+        client: Authenticated Spotify client
+        playlist_id: Spotify playlist URI
+        track_uris: List of track URIs to add
+        skip_existing: Drop URIs already in the playlist (skip for new playlists)
+
+    Returns:
+        Snapshot ID dict of the last write, or None if nothing was added
+    """
+    if not track_uris:
+        logger.info("No new tracks to add to the playlist")
+        return None
+
+    existing_uris = (
+        fetch_playlist_track_uris(client, playlist_id) if skip_existing else set()
+    )
+    new_track_uris = select_new_track_uris(track_uris, existing_uris)
+
+    snapshot_id = None
+
+    for uris_chunk in batch(new_track_uris, PLAYLIST_ADD_BATCH_SIZE):
+        snapshot_id = (
+            add_playlist_chunk(client, playlist_id, list(uris_chunk)) or snapshot_id
+        )
+
+    n_added_tracks = len(new_track_uris)
+    logger.info(
+        f"Added {n_added_tracks} new {pluralize(n_added_tracks, 'track')} to the playlist"
+    )
+
+    return snapshot_id
+
+
+def select_new_track_uris(track_uris: List[str], existing_uris: set[str]) -> List[str]:
+    """Drop repeated URIs and URIs already in the playlist, keeping input order.
+
+    Args:
+        track_uris: Track URIs to add
+        existing_uris: Track URIs already in the playlist
+
+    Returns:
+        URIs that still need to be written
+    """
+    new_track_uris = [u for u in dict.fromkeys(track_uris) if u not in existing_uris]
+
+    n_skipped_tracks = len(track_uris) - len(new_track_uris)
+    if n_skipped_tracks:
+        logger.info(
+            f"Skipped {n_skipped_tracks} {pluralize(n_skipped_tracks, 'track')} already in the playlist"
+        )
+
+    return new_track_uris
+
+
+def add_playlist_chunk(
+    client: Spotify, playlist_id: str, track_uris: List[str]
+) -> Dict | None:
+    """Write one chunk of tracks to a playlist, reconciling before every retry.
+
+    A POST that failed with a 5xx or a dropped connection may still have
+    been applied, so before each retry the playlist is re-read and only the
+    URIs still missing are sent; 429s are retried by the client itself.
+
+    Args:
+        client: Authenticated Spotify client
+        playlist_id: Spotify playlist URI
+        track_uris: At most PLAYLIST_ADD_BATCH_SIZE track URIs
+
+    Returns:
+        Snapshot ID dict of the write, or None if a retry found every track
+        already added
+
+    Raises:
+        SpotifyException: If the write fails with a non-transient status or
+            keeps failing after WRITE_RETRIES retries
+        requests.RequestException: If the connection keeps failing
+    """
+    attempt = 0
+
+    while True:
+        try:
+            return client.playlist_add_items(playlist_id, track_uris)
+        except (SpotifyException, requests.RequestException) as e:
+            if not is_transient_write_error(e) or attempt >= WRITE_RETRIES:
+                raise
+
+            time.sleep(write_retry_delay(e, attempt))
+            attempt += 1
+
+            existing_uris = fetch_playlist_track_uris(client, playlist_id)
+            track_uris = select_new_track_uris(track_uris, existing_uris)
+            if not track_uris:
+                return None
+
+
+def _call_with_retries(fn: Callable[..., T], *args: Any) -> T:
+    """Call an idempotent Spotify client method, retrying transient failures.
+
+    Args:
+        fn: Client method to call
+        *args: Positional arguments for the method
+
+    Returns:
+        The method's return value
+
+    Raises:
+        SpotifyException: If the call fails with a non-transient status or
+            keeps failing after WRITE_RETRIES retries
+        requests.RequestException: If the connection keeps failing
+    """
+    attempt = 0
+
+    while True:
+        try:
+            return fn(*args)
+        except (SpotifyException, requests.RequestException) as e:
+            if not is_transient_write_error(e) or attempt >= WRITE_RETRIES:
+                raise
+
+            time.sleep(write_retry_delay(e, attempt))
+            attempt += 1
+
+
+def is_transient_write_error(e: Exception) -> bool:
+    """Check if a failed write is worth retrying (5xx or no response).
+
+    429s are not: the rate-limited clients have already retried them through
+    the rate limiter when they reach the caller.
+    """
+    status = getattr(e, "http_status", None)
+    return status is None or status >= 500
+
+
+def write_retry_delay(e: Exception, attempt: int) -> float:
+    """Log a failed write and return the exponential backoff before its retry."""
+
+    delay = WRITE_RETRY_BACKOFF * 2**attempt
+    logger.warning(f"Spotify write failed ({e}), retrying in {delay:.1f}s")
+    return delay
+
+
+def backfill_labels(
+    client: Spotify,
+    labels: List[str],
+    max_workers: int = 1,
+    page_size: int = SEARCH_LIMIT,
+    journals: Mapping[str, BackfillJournal] | None = None,
+    near_duplicates: str | None = None,
+) -> Dict[str, BackfillSummary]:
+    """Backfill the history of several labels into their numbered playlists.
+
+    Labels are searched one after another, each with `max_workers`
+    concurrent searches; their albums are then fetched in shared batches
+    (`collect_tracks_by_label`) before the playlists are created label by
+    label.
+
+    Args:
+        client: Authenticated Spotify client, shared by all labels
+        labels: Record label names
+        max_workers: Maximum number of concurrent search requests
+        page_size: Search page size, capped at SEARCH_MAX_LIMIT
+        journals: Optional checkpoint journals per label
+        near_duplicates: "report" to log near-duplicate clusters of every
+            catalog, "collapse" to also drop them (see `resolve_near_duplicates`)
+
+    Returns:
+        Dict mapping labels to their backfill summary, in `labels` order
+    """
+    journals = journals or {}
+    release_uris: Dict[str, List[str]] = {}
+
+    with stage("search_releases"):
+        for n, label in enumerate(labels, start=1):
+            logger.info(f"[{n}/{len(labels)}] Searching releases of {label}")
+            release_uris[label] = fetch_all_release_uris(
+                client, label, max_workers, page_size, journals.get(label)
+            )
+
+    with stage("collect_tracks"):
+        tracks = collect_tracks_by_label(client, release_uris, journals, max_workers)
+
+    if near_duplicates is not None:
+        with stage("near_duplicates"):
+            for label in labels:
+                tracks[label] = resolve_near_duplicates(
+                    label, tracks[label], collapse=near_duplicates == "collapse"
+                )
+
+    summary: Dict[str, BackfillSummary] = {}
+    with stage("create_playlists"):
+        for n, label in enumerate(labels, start=1):
+            logger.info(f"[{n}/{len(labels)}] Creating playlists of {label}")
+            summary[label] = {
+                "releases": len(release_uris[label]),
+                "tracks": len(tracks[label]),
+                "playlists_created": create_playlists(
+                    client, label, tracks[label], journal=journals.get(label)
+                ),
+            }
+
+    return summary
+
+
+def refresh_labels(
+    client: Spotify,
+    labels: List[str],
+    max_workers: int = 1,
+    page_size: int = SEARCH_LIMIT,
+) -> Dict[str, BackfillSummary]:
+    """Bring several backfilled labels up to date with `refresh_label`.
+
+    Args:
+        client: Authenticated Spotify client, shared by all labels
+        labels: Record label names
+        max_workers: Maximum number of concurrent search requests
+        page_size: Search page size, capped at SEARCH_MAX_LIMIT
+
+    Returns:
+        Dict mapping labels to their refresh summary, in `labels` order
+    """
+    summary: Dict[str, BackfillSummary] = {}
+
+    with stage("refresh_playlists"):
+        for n, label in enumerate(labels, start=1):
+            logger.info(f"[{n}/{len(labels)}] Refreshing playlists of {label}")
+            summary[label] = refresh_label(client, label, max_workers, page_size)
+
+    return summary
+
+
+def refresh_label(
+    client: Spotify,
+    label: str,
+    max_workers: int = 1,
+    page_size: int = SEARCH_LIMIT,
+    step_size: int = 50,
+) -> BackfillSummary:
+    """Append releases newer than a label's last numbered playlist.
+
+    The end date of the last "<label> NNN" playlist's description bounds the
+    search to the years from that date onward; a label whose description is
+    not a date range (e.g. edited by hand) is skipped with a warning. Tracks
+    already in any of the label's numbered playlists are dropped. New tracks
+    first fill the last playlist up to `step_size` (its description is
+    extended to the new end date), then go to new playlists numbered after it.
+
+    Args:
+        client: Authenticated Spotify client
+        label: Record label name
+        max_workers: Maximum number of concurrent search requests
+        page_size: Search page size, capped at SEARCH_MAX_LIMIT
+        step_size: Number of tracks per playlist (default 50)
+
+    Returns:
+        Summary of the releases and tracks added and the playlists created
+    """
+    playlists = find_numbered_playlists(client, label)
+    if not playlists:
+        logger.warning(f"No playlists of {label} to refresh, backfill it first")
+        return {"releases": 0, "tracks": 0, "playlists_created": 0}
+
+    last_number, last_playlist = playlists[-1]
+    date_range = _PLAYLIST_DATE_RANGE.fullmatch(last_playlist["description"] or "")
+    if date_range is None:
+        logger.warning(
+            f"Description of {last_playlist['name']} is not a date range "
+            f"({last_playlist['description']!r}), skipping {label}"
+        )
+        return {"releases": 0, "tracks": 0, "playlists_created": 0}
+
+    first_date, end_date = date_range.groups()
+    logger.info(f"Refreshing {label} from {end_date} ({last_playlist['name']})")
+
+    releases = fetch_all_releases(
+        client, label, max_workers, page_size, first_year=int(end_date[:4])
+    )
+    release_uris = [
+        r["uri"] for r in parse_releases(releases) if r["release_date"] >= end_date
+    ]
+
+    playlist_uris = map_concurrently(
+        lambda item: fetch_playlist_track_uris(client, item[1]["uri"]),
+        playlists,
+        max_workers,
+    )
+    existing_uris = set().union(*playlist_uris)
+    tracks = [
+        t
+        for t in collect_tracks_from_albums(
+            client, release_uris, label, max_workers=max_workers
+        )
+        if t["uri"] not in existing_uris
+    ]
+
+    top_up = tracks[: max(step_size - len(playlist_uris[-1]), 0)]
+    if top_up:
+        add_to_playlist(
+            client,
+            last_playlist["uri"],
+            [t["uri"] for t in top_up],
+            skip_existing=False,
+        )
+        description = f"{first_date} - {top_up[-1]['release_date']}"
+        _call_with_retries(
+            lambda: client.playlist_change_details(
+                last_playlist["id"], description=description
+            )
+        )
+        logger.info(
+            f"Added {len(top_up)} {pluralize(len(top_up), 'track')} to {last_playlist['name']}"
+        )
+
+    n_created = create_playlists(
+        client, label, tracks[len(top_up) :], step_size, first_number=last_number + 1
+    )
+
+    return {
+        "releases": len(release_uris),
+        "tracks": len(tracks),
+        "playlists_created": n_created,
+    }
+
+
+def find_numbered_playlists(client: Spotify, label: str) -> List[Tuple[int, Dict]]:
+    """Find the current user's "<label> NNN" playlists.
+
+    Args:
+        client: Authenticated Spotify client
+        label: Record label name (the playlists' base name)
+
+    Returns:
+        List of (number, simplified playlist object) sorted by number
+    """
+    pattern = re.compile(rf"{re.escape(label)} (\d{{3,}})")
+    playlists: List[Tuple[int, Dict]] = []
+    page = client.current_user_playlists(limit=USER_PLAYLISTS_PAGE_SIZE)
+
+    while page:
+        for playlist in page["items"]:
+            match = pattern.fullmatch(playlist["name"]) if playlist else None
+            if match:
+                playlists.append((int(match.group(1)), playlist))
+        page = client.next(page) if page.get("next") else None
+
+    return sorted(playlists, key=lambda item: item[0])
+
+
+def log_backfill_summary(summary: Dict[str, BackfillSummary]) -> None:
+    """Log one line per backfilled label and the combined totals."""
+
+    for label, label_summary in summary.items():
+        logger.info(
+            f"{label}: {label_summary['releases']} releases, "
+            f"{label_summary['tracks']} tracks, "
+            f"{label_summary['playlists_created']} playlists created"
+        )
+
+    n_releases = sum(s["releases"] for s in summary.values())
+    n_tracks = sum(s["tracks"] for s in summary.values())
+    n_playlists = sum(s["playlists_created"] for s in summary.values())
+    logger.info(
+        f"Backfilled {len(summary)} {pluralize(len(summary), 'label')}: "
+        f"{n_releases} {pluralize(n_releases, 'release')}, "
+        f"{n_tracks} {pluralize(n_tracks, 'track')}, "
+        f"{n_playlists} {pluralize(n_playlists, 'playlist')} created"
+    )
+
+
+def fetch_all_releases(
+    client: Spotify,
+    label: str,
+    max_workers: int = 1,
+    page_size: int = SEARCH_LIMIT,
+    journal: BackfillJournal | None = None,
+    first_year: int = BACKFILL_START_YEAR,
+) -> List[SpotifyAlbum]:
+    """Fetch all releases for a label from `first_year` to present.
+
+    Years are first located with `find_release_years`, so only years with
+    releases are searched. Every such year is a separate search shard;
+    shards and their pages are fetched on a bounded thread pool and merged
+    in year and page order. Years with more releases than MAX_OFFSET lets
+    a search reach are split into refined queries (`search_partitions`).
+
+    With a journal, the located years and every completed year shard are
+    checkpointed; years journaled by an earlier run are not searched again.
+
+    Args:
+        client: Authenticated Spotify client
+        label: Record label name
+        max_workers: Maximum number of concurrent search requests
+        page_size: Search page size, capped at SEARCH_MAX_LIMIT
+        journal: Optional checkpoint journal of the label's backfill
+        first_year: First year to search (default BACKFILL_START_YEAR)
+
+    Returns:
+        List of all album objects for the label
+    """
+    if journal is None:
+        years = find_release_years(
+            client, label, first_year, date.today().year, max_workers
+        )
+        year_shards = search_partitions(
+            client,
+            [backfill_search_query(label, year) for year in years],
+            max_workers,
+            page_size,
+        )
+    else:
+        years, year_shards = search_years_with_journal(
+            client, label, max_workers, page_size, journal, first_year
+        )
+
+    releases = []
+    for year, shard in zip(years, year_shards):
+        year_releases = shard["releases"]
+        if year_releases:
+            logger.info(
+                f"Fetched {len(year_releases)} {pluralize(len(year_releases), 'release')} for year {year}"
+            )
+        releases.extend(year_releases)
+
+    logger.info(f"Fetched {len(releases)} releases in total")
+    log_search_coverage(year_shards)
+
+    return releases
+
+
+def search_years_with_journal(
+    client: Spotify,
+    label: str,
+    max_workers: int,
+    page_size: int,
+    journal: BackfillJournal,
+    first_year: int = BACKFILL_START_YEAR,
+) -> Tuple[List[int], List[SearchShard]]:
+    """Search the release years of a label, resuming from journaled shards.
+
+    Pending years are searched in chunks of `max_workers` shards so that a
+    crash loses at most one chunk of searches. Journaled release years are
+    reused when they were located from `first_year` or earlier.
+
+    Args:
+        client: Authenticated Spotify client
+        label: Record label name
+        max_workers: Maximum number of concurrent search requests
+        page_size: Search page size, capped at SEARCH_MAX_LIMIT
+        journal: Checkpoint journal of the label's backfill
+        first_year: First year to search (default BACKFILL_START_YEAR)
+
+    Returns:
+        Tuple of (searched years, one shard per year in year order)
+    """
+    years = journaled_release_years(journal, label, first_year)
+    if years is None:
+        years = find_release_years(
+            client, label, first_year, date.today().year, max_workers
+        )
+        journal.record("years", label, years=years, first_year=first_year)
+
+    queries = [backfill_search_query(label, year) for year in years]
+    shards = journaled_search_shards(journal, queries)
+    pending = [query for query in queries if query not in shards]
+
+    for chunk in batch(pending, max(max_workers, 1)):
+        for shard in search_partitions(client, list(chunk), max_workers, page_size):
+            journal.record("search", shard["query"], shard=shard)
+            shards[shard["query"]] = shard
+
+    return years, [shards[query] for query in queries]
+
+
+def journaled_release_years(
+    journal: BackfillJournal, label: str, first_year: int
+) -> List[int] | None:
+    """Return the journaled release years of a label from `first_year` on.
+
+    Args:
+        journal: Checkpoint journal of the label's backfill
+        label: Record label name
+        first_year: First year to search
+
+    Returns:
+        Years to search, or None when they were not located from
+        `first_year` or earlier and have to be located again
+    """
+    years_record = journal.get("years", label)
+    if (
+        years_record is None
+        or years_record.get("first_year", BACKFILL_START_YEAR) > first_year
+    ):
+        return None
+    return [year for year in years_record["years"] if year >= first_year]
+
+
+def journaled_search_shards(
+    journal: BackfillJournal, queries: List[str]
+) -> Dict[str, SearchShard]:
+    """Look up the year shards an earlier run completed, logging how many resume."""
+
+    shards: Dict[str, SearchShard] = {}
+    for query in queries:
+        record = journal.get("search", query)
+        if record is not None:
+            shards[query] = record["shard"]
+
+    if shards:
+        n_resumed = len(shards)
+        logger.info(
+            f"Resuming {n_resumed} journaled year {pluralize(n_resumed, 'search', 'searches')}"
+        )
+    return shards
+
+
+def compact_release(release: SpotifyAlbum) -> SpotifyAlbum:
+    """Keep only the album fields the backfill needs from a search result."""
+
+    return {
+        "uri": release["uri"],
+        "name": release["name"],
+        "release_date": release["release_date"],
+    }
+
+
+def find_release_years(
+    client: Spotify,
+    label: str,
+    first_year: int,
+    last_year: int,
+    max_workers: int = 1,
+) -> List[int]:
+    """Find the years that may contain releases of a label.
+
+    Coarse ranges of BACKFILL_RANGE_YEARS years are probed with a one-item
+    `year:A-B` search; only the years of non-empty ranges are returned.
+
+    Args:
+        client: Authenticated Spotify client
+        label: Record label name
+        first_year: First year to consider
+        last_year: Last year to consider (inclusive)
+        max_workers: Maximum number of concurrent probe requests
+
+    Returns:
+        Sorted list of years to search year by year
+    """
+    ranges = year_ranges(first_year, last_year, BACKFILL_RANGE_YEARS)
+    probed_ranges = [r for r in ranges if r[0] != r[1]]
+
+    probes = map_concurrently(
+        lambda r: search_album_page(client, backfill_search_query(label, *r), 0, 1),
+        probed_ranges,
+        max_workers,
+    )
+    return select_release_years(ranges, probed_ranges, probes)
+
+
+def select_release_years(
+    ranges: List[Tuple[int, int]],
+    probed_ranges: List[Tuple[int, int]],
+    probes: List[SpotifyAlbumPage],
+) -> List[int]:
+    """Expand the year ranges whose probe found a release into single years.
+
+    Args:
+        ranges: All year ranges, in year order
+        probed_ranges: Ranges of more than one year that were probed
+        probes: One-item search page of every probed range
+
+    Returns:
+        Sorted list of years to search; unprobed single years are kept
+    """
+    empty_ranges = {r for r, page in zip(probed_ranges, probes) if not page["items"]}
+
+    n_skipped = sum(end - start + 1 for start, end in empty_ranges)
+    if n_skipped:
+        logger.info(
+            f"Skipping {n_skipped} {pluralize(n_skipped, 'year')} without releases"
+        )
+
+    return [
+        year
+        for start, end in ranges
+        if (start, end) not in empty_ranges
+        for year in range(start, end + 1)
+    ]
+
+
+def year_ranges(first_year: int, last_year: int, width: int) -> List[Tuple[int, int]]:
+    """Split an inclusive year span into consecutive ranges of `width` years."""
+
+    return [
+        (start, min(start + width - 1, last_year))
+        for start in range(first_year, last_year + 1, width)
+    ]
+
+
+def search_partitions(
+    client: Spotify,
+    queries: List[str],
+    max_workers: int = 1,
+    page_size: int = SEARCH_LIMIT,
+    depth: int = 0,
+) -> List[SearchShard]:
+    """Search shards, splitting the ones saturated at MAX_OFFSET into refined queries.
+
+    A saturated shard is searched again with every query of `refine_query`;
+    refined queries that saturate too are split further, up to
+    PARTITION_MAX_DEPTH levels. Releases of the refinements are merged into
+    their parent shard without duplicates.
+
+    Args:
+        client: Authenticated Spotify client
+        queries: Search queries (shards)
+        max_workers: Maximum number of concurrent search requests
+        page_size: Search page size, capped at SEARCH_MAX_LIMIT
+        depth: Refinement level of `queries`
+
+    Returns:
+        One shard per query, in query order
+    """
+    shards = search_shards(client, queries, max_workers, page_size)
+    saturated = [i for i, shard in enumerate(shards) if shard["saturated"]]
+    if not saturated or depth >= PARTITION_MAX_DEPTH:
+        return shards
+
+    refinements = [refine_query(shards[i]["query"]) for i in saturated]
+    refined_shards = search_partitions(
+        client,
+        [query for refined in refinements for query in refined],
+        max_workers,
+        page_size,
+        depth + 1,
+    )
+    return merge_refined_shards(shards, saturated, refinements, refined_shards)
+
+
+def search_shards(
+    client: Spotify,
+    queries: List[str],
+    max_workers: int = 1,
+    page_size: int = SEARCH_LIMIT,
+) -> List[SearchShard]:
+    """Fetch every page of several album searches concurrently.
+
+    The first page of every query is fetched first. Queries whose response
+    reports a `total` then have all remaining pages fetched concurrently;
+    the others are paged sequentially until an empty page.
+
+    Args:
+        client: Authenticated Spotify client
+        queries: Search queries (shards)
+        max_workers: Maximum number of concurrent search requests
+        page_size: Search page size, capped at SEARCH_MAX_LIMIT
+
+    Returns:
+        One shard per query with its albums in page order
+    """
+    page_size = min(page_size, SEARCH_MAX_LIMIT)
+    first_pages = map_concurrently(
+        lambda query: search_album_page(client, query, 0, page_size),
+        queries,
+        max_workers,
+    )
+
+    jobs = plan_search_pages(first_pages, page_size)
+
+    def _fetch_job(job: Tuple[int, int, bool]) -> List[SpotifyAlbum]:
+        i, offset, follow = job
+        if not follow:
+            return search_album_page(client, queries[i], offset, page_size)["items"]
+        return page_search_sequentially(client, queries[i], offset, page_size)
+
+    results: List[List[SpotifyAlbum]] = [list(page["items"]) for page in first_pages]
+    for (i, _, _), items in zip(jobs, map_concurrently(_fetch_job, jobs, max_workers)):
+        results[i].extend(items)
+
+    return [
+        make_search_shard(query, page, releases, page_size)
+        for query, page, releases in zip(queries, first_pages, results)
+    ]
+
+
+def plan_search_pages(
+    first_pages: List[SpotifyAlbumPage], page_size: int
+) -> List[Tuple[int, int, bool]]:
+    """Plan the pages that follow the first page of every search.
+
+    Args:
+        first_pages: First page of every search (offset 0)
+        page_size: Page size used for the searches
+
+    Returns:
+        (search index, offset, follow) jobs; `follow` marks a search without
+        `total` that is paged from `offset` until an empty page
+    """
+    jobs: List[Tuple[int, int, bool]] = []
+    for i, page in enumerate(first_pages):
+        offsets = remaining_page_offsets(page, page_size)
+        if offsets is None:
+            jobs.append((i, page_size, True))
+        else:
+            jobs.extend((i, offset, False) for offset in offsets)
+
+    return jobs
+
+
+def make_search_shard(
+    query: str,
+    first_page: SpotifyAlbumPage,
+    releases: List[SpotifyAlbum],
+    page_size: int,
+) -> SearchShard:
+    """Describe a fully paged search, flagging it if MAX_OFFSET cut it short.
+
+    Args:
+        query: Search query
+        first_page: First page of the search (carries `total` when known)
+        releases: All albums paged from the search
+        page_size: Page size used for the search
+
+    Returns:
+        Search shard; without a `total`, a search that filled every reachable
+        page counts as saturated
+    """
+    reachable = page_size * (MAX_OFFSET // page_size)
+    total = first_page.get("total")
+    saturated = total > reachable if total is not None else len(releases) >= reachable
+
+    return {
+        "query": query,
+        "total": total,
+        "releases": releases,
+        "saturated": saturated,
+        "n_refinements": 0,
+    }
+
+
+def refine_query(query: str) -> List[str]:
+    """Split a saturated search query into narrower ones.
+
+    Partition dimensions (PARTITION_TAGS, then PARTITION_TERMS) are applied
+    in order: a query is narrowed by every dimension after the last one it
+    already uses, so no term is repeated and no combination is searched twice.
+
+    Args:
+        query: Saturated query
+
+    Returns:
+        Narrowed queries; empty when every dimension is used already
+    """
+    dimensions = [PARTITION_TAGS, PARTITION_TERMS]
+    last_term = query.rsplit(" ", 1)[-1]
+    used = [i for i, terms in enumerate(dimensions) if last_term in terms]
+    remaining = dimensions[used[-1] + 1 :] if used else dimensions
+
+    return [f"{query} {term}" for terms in remaining for term in terms]
+
+
+def merge_refined_shards(
+    shards: List[SearchShard],
+    saturated: List[int],
+    refinements: List[List[str]],
+    refined_shards: List[SearchShard],
+) -> List[SearchShard]:
+    """Fold the releases of refined queries back into their saturated shards.
+
+    A shard whose merged releases reach its reported `total` is complete and
+    no longer counts as saturated.
+
+    Args:
+        shards: Shards of one refinement level
+        saturated: Indices of the saturated shards
+        refinements: Refined queries of every saturated shard
+        refined_shards: Shards of all refined queries, in order
+
+    Returns:
+        `shards` with the saturated ones extended by unseen refined releases
+    """
+    refined = iter(refined_shards)
+
+    for i, queries in zip(saturated, refinements):
+        children = [next(refined) for _ in queries]
+        seen = {r["uri"] for r in shards[i]["releases"]}
+
+        for child in children:
+            for release in child["releases"]:
+                if release["uri"] not in seen:
+                    seen.add(release["uri"])
+                    shards[i]["releases"].append(release)
+
+        shards[i]["n_refinements"] = sum(1 + c["n_refinements"] for c in children)
+
+        total = shards[i]["total"]
+        if total is not None and len(shards[i]["releases"]) >= total:
+            shards[i]["saturated"] = False
+
+    return shards
+
+
+def log_search_coverage(shards: List[SearchShard]) -> None:
+    """Log how many of the reported search results were actually collected."""
+
+    n_found = sum(len(s["releases"]) for s in shards)
+    n_reported = sum(s["total"] or len(s["releases"]) for s in shards)
+    saturated = [s for s in shards if s["saturated"]]
+
+    for shard in saturated:
+        n_shard_found = len(shard["releases"])
+        logger.warning(
+            f"{shard['query']}: found {n_shard_found} of {shard['total'] or 'unknown'} "
+            f"releases after {shard['n_refinements']} refined "
+            f"{pluralize(shard['n_refinements'], 'query', 'queries')}"
+        )
+
+    coverage = min(n_found / n_reported, 1.0) if n_reported else 1.0
+    logger.info(
+        f"Search coverage: {n_found} of {n_reported} reported releases ({coverage:.0%}), "
+        f"{len(saturated)} saturated {pluralize(len(saturated), 'shard')}"
+    )
+
+
+def search_album_page(
+    client: Spotify, query: str, offset: int, limit: int
+) -> SpotifyAlbumPage:
+    """Fetch one page of an album search, its albums reduced by `compact_release`.
+
+    Raw search results carry nested `images`, `artists` and
+    `available_markets` lists the backfill never reads; dropping them as
+    pages arrive keeps memory proportional to the releases found.
+    """
+    page = client.search(query, type="album", offset=offset, limit=limit)["albums"]
+    page["items"] = [compact_release(r) for r in page["items"]]
+    return page
+
+
+def remaining_page_offsets(page: SpotifyAlbumPage, page_size: int) -> List[int] | None:
+    """Plan the offsets of the pages following a first search page.
+
+    Args:
+        page: First page of a search (offset 0)
+        page_size: Page size used for the search
+
+    Returns:
+        Offsets of the remaining pages within MAX_OFFSET, or None when the
+        response has no `total` and the search has to be paged until empty
+    """
+    if not page["items"]:
+        return []
+
+    total = page.get("total")
+    if total is None:
+        return None if page_size * 2 <= MAX_OFFSET else []
+
+    return [
+        offset
+        for offset in range(page_size, total, page_size)
+        if offset + page_size <= MAX_OFFSET
+    ]
+
+
+def page_search_sequentially(
+    client: Spotify, query: str, offset: int, page_size: int
+) -> List[SpotifyAlbum]:
+    """Page an album search from `offset` until an empty page or MAX_OFFSET."""
+
+    releases: List[SpotifyAlbum] = []
+
+    while offset + page_size <= MAX_OFFSET:
+        page_of_found_releases = search_album_page(client, query, offset, page_size)[
+            "items"
+        ]
+        if not page_of_found_releases:
+            break
+
+        releases.extend(page_of_found_releases)
+        offset += page_size
+
+    return releases
+
+
+def backfill_search_query(label: str, year: int, last_year: int | None = None) -> str:
+    """Build the backfill search query for one label and a year or year range."""
+
+    search_normalized_label = label.replace("'", "")
+    years = f"{year}-{last_year}" if last_year not in (None, year) else f"{year}"
+    return f"label:{search_normalized_label} year:{years}"
+
+
+def parse_releases(releases: Iterable[SpotifyAlbum]) -> List[SpotifyAlbum]:
+    """Dedupe releases by URI and sort them by release date.
+
+    Releases are streamed into a URI -> (release_date, name) index, so only
+    unique releases are held; the first occurrence of a URI wins.
+
+    Args:
+        releases: Album objects, e.g. search results as they are paged
+
+    Returns:
+        Unique releases (`uri`, `name`, `release_date`) sorted by date
+    """
+    index: Dict[str, Tuple[str, str]] = {}
+    n_releases = 0
+
+    for release in releases:
+        n_releases += 1
+        if release["uri"] not in index:
+            index[release["uri"]] = (release["release_date"], release["name"])
+
+    n_duplicates_dropped = n_releases - len(index)
+    logger.info(
+        f"Dropped {n_duplicates_dropped} {pluralize(n_duplicates_dropped, 'duplicate')}"
+    )
+    logger.info(f"{len(index)} {pluralize(len(index), 'release')} left")
+
+    return [
+        {"uri": uri, "name": name, "release_date": release_date}
+        for uri, (release_date, name) in sorted(
+            index.items(), key=lambda item: item[1][0]
+        )
+    ]
+
+
+def fetch_all_release_uris(
+    client: Spotify,
+    label: str,
+    max_workers: int = 1,
+    page_size: int = SEARCH_LIMIT,
+    journal: BackfillJournal | None = None,
+) -> List[str]:
+    """Fetch and parse all release URIs for a label.
+
+    Args:
+        client: Authenticated Spotify client
+        label: Record label name
+        max_workers: Maximum number of concurrent search requests
+        page_size: Search page size, capped at SEARCH_MAX_LIMIT
+        journal: Optional checkpoint journal of the label's backfill
+
+    Returns:
+        Unique release URIs sorted by release date
+    """
+    all_releases = fetch_all_releases(client, label, max_workers, page_size, journal)
+    return [release["uri"] for release in parse_releases(all_releases)]
+
+
+def collect_tracks_from_albums(
+    client: Spotify,
+    album_uris: Sequence[str],
+    label: str,
+    journal: BackfillJournal | None = None,
+    max_workers: int = 1,
+) -> List[ReleasedTrack]:
+    """Collect all tracks from albums, filtering extended versions.
+
+    Args:
+        client: Authenticated Spotify client
+        album_uris: Album URIs
+        label: Exact label name to verify
+        journal: Optional checkpoint journal; journaled albums are not
+            fetched again
+        max_workers: Maximum number of concurrent track page requests
+
+    Returns:
+        Track URIs with their album's release date, extended versions removed
+    """
+    journals = {label: journal} if journal is not None else None
+    return collect_tracks_by_label(client, {label: album_uris}, journals, max_workers)[
+        label
+    ]
+
+
+def collect_tracks_by_label(
+    client: Spotify,
+    album_uris_by_label: Mapping[str, Sequence[str]],
+    journals: Mapping[str, BackfillJournal] | None = None,
+    max_workers: int = 1,
+) -> Dict[str, List[ReleasedTrack]]:
+    """Collect the tracks of several labels' albums with shared `albums` batches.
+
+    Albums of all labels are fetched together in FETCH_BATCH_SIZE batches,
+    so a label with only a few albums does not cost a half-empty request.
+    Up to `max_workers` batches are in flight at once and are consumed in
+    batch order, so the tracks come out exactly as in a sequential run.
+    Every album is checked against the label it was found for; only albums
+    that pass (and that Spotify returned at all) with more tracks than the
+    embedded first page are completed with `fetch_remaining_album_tracks`.
+
+    Args:
+        client: Authenticated Spotify client
+        album_uris_by_label: Album URIs per exact label name
+        journals: Optional checkpoint journals per label; journaled albums
+            are not fetched again
+        max_workers: Maximum number of `albums` batches in flight, and of
+            concurrent track page requests
+
+    Returns:
+        Dict mapping labels to their tracks with release dates, in album
+        order and with extended versions removed
+    """
+    journals = journals or {}
+    album_tracks, pending = split_journaled_albums(album_uris_by_label, journals)
+
+    def _fetch_batch(pending_batch: Sequence[Tuple[str, str]]) -> List[SpotifyAlbum]:
+        return client.albums([uri for _, uri in pending_batch])["albums"]
+
+    pending_batches = list(batch(pending, FETCH_BATCH_SIZE))
+    album_batches = imap_concurrently(_fetch_batch, pending_batches, max_workers)
+
+    for pending_batch, albums in zip(pending_batches, album_batches):
+        fetch_remaining_album_tracks(
+            client, label_albums(pending_batch, albums), max_workers
+        )
+        album_tracks.update(
+            select_pending_album_tracks(pending_batch, albums, journals)
+        )
+
+    return merge_album_tracks(album_uris_by_label, album_tracks)
+
+
+def split_journaled_albums(
+    album_uris_by_label: Mapping[str, Sequence[str]],
+    journals: Mapping[str, BackfillJournal],
+) -> Tuple[AlbumTracks, List[Tuple[str, str]]]:
+    """Separate albums collected by an earlier run from the ones to fetch.
+
+    Args:
+        album_uris_by_label: Album URIs per exact label name
+        journals: Checkpoint journals per label (labels may be missing)
+
+    Returns:
+        Tuple of ((label, uri) -> journaled (tracks, n_dropped), pending
+        (label, uri) pairs in label and album order)
+    """
+    album_tracks: AlbumTracks = {}
+    pending: List[Tuple[str, str]] = []
+
+    for label, album_uris in album_uris_by_label.items():
+        journal = journals.get(label)
+        for uri in album_uris:
+            record = journal.get("album", uri) if journal else None
+            if record is not None:
+                album_tracks[(label, uri)] = (record["tracks"], record["n_dropped"])
+            else:
+                pending.append((label, uri))
+
+    return album_tracks, pending
+
+
+def label_albums(
+    pending_batch: Sequence[Tuple[str, str]], albums: List[SpotifyAlbum | None]
+) -> List[SpotifyAlbum]:
+    """Keep the albums of a batch that Spotify returned with the label they were found for."""
+
+    return [
+        album
+        for (label, _), album in zip(pending_batch, albums)
+        if album and album["label"] == label
+    ]
+
+
+def select_pending_album_tracks(
+    pending_batch: Sequence[Tuple[str, str]],
+    albums: List[SpotifyAlbum | None],
+    journals: Mapping[str, BackfillJournal],
+) -> AlbumTracks:
+    """Pick the tracks of a completed `albums` batch and journal every album.
+
+    Args:
+        pending_batch: (label, uri) pairs of the batch
+        albums: Full album objects of the batch, their track pages completed
+        journals: Checkpoint journals per label (labels may be missing)
+
+    Returns:
+        (label, uri) -> (kept tracks, number of dropped tracks)
+    """
+    album_tracks: AlbumTracks = {}
+
+    for (label, uri), album in zip(pending_batch, albums):
+        tracks, n_dropped = select_album_batch_tracks([album], label)
+        album_tracks[(label, uri)] = (tracks, n_dropped)
+
+        journal = journals.get(label)
+        if journal is not None:
+            journal.record("album", uri, tracks=tracks, n_dropped=n_dropped)
+
+    return album_tracks
+
+
+def merge_album_tracks(
+    album_uris_by_label: Mapping[str, Sequence[str]], album_tracks: AlbumTracks
+) -> Dict[str, List[ReleasedTrack]]:
+    """Concatenate the tracks of every label's albums in album order.
+
+    Args:
+        album_uris_by_label: Album URIs per exact label name
+        album_tracks: (label, uri) -> (kept tracks, number of dropped tracks)
+
+    Returns:
+        Dict mapping labels to their tracks with release dates
+    """
+    tracks_by_label: Dict[str, List[ReleasedTrack]] = {}
+    for label, album_uris in album_uris_by_label.items():
+        label_tracks: List[ReleasedTrack] = []
+        total_dropped = 0
+        for uri in album_uris:
+            tracks, n_dropped = album_tracks[(label, uri)]
+            label_tracks.extend(tracks)
+            total_dropped += n_dropped
+
+        logger.info(
+            f"{label}: {len(label_tracks)} {pluralize(len(label_tracks), 'track')} found, "
+            f"{total_dropped} dropped"
+        )
+        tracks_by_label[label] = label_tracks
+
+    return tracks_by_label
+
+
+def fetch_remaining_album_tracks(
+    client: Spotify, albums: List[SpotifyAlbum], max_workers: int = 1
 ) -> None:
+    """Complete the embedded track pages of full album objects in place.
+
+    `albums` responses embed only the first page of every album's tracks.
+    For albums with a `next` cursor, the offsets of the missing pages are
+    derived from `total` and fetched concurrently; pages are appended in
+    offset order, so every album keeps its track order. Without a `total`,
+    the album is paged sequentially through its cursors.
+
+    Args:
+        client: Authenticated Spotify client
+        albums: Full album objects of one `albums` batch
+        max_workers: Maximum number of concurrent track page requests
+    """
+    jobs = plan_remaining_track_pages(albums)
+
+    def _fetch_job(job: Tuple[int, int | None]) -> List[SpotifyTrack]:
+        i, offset = job
+        if offset is not None:
+            return client.album_tracks(
+                albums[i]["uri"], limit=ALBUM_TRACKS_LIMIT, offset=offset
+            )["items"]
+
+        items: List[SpotifyTrack] = []
+        track_page = albums[i]["tracks"]
+        while track_page.get("next"):
+            track_page = client.next(track_page)
+            items.extend(track_page["items"])
+        return items
+
+    for (i, _), items in zip(jobs, map_concurrently(_fetch_job, jobs, max_workers)):
+        albums[i]["tracks"]["items"].extend(items)
+
+    log_remaining_track_pages(jobs)
+
+
+def plan_remaining_track_pages(
+    albums: List[SpotifyAlbum],
+) -> List[Tuple[int, int | None]]:
+    """Plan the track pages missing from the embedded first page of every album.
+
+    Args:
+        albums: Full album objects of one `albums` batch
+
+    Returns:
+        (album index, offset) jobs in album and offset order; the offset is
+        None for an album without `total` that has to be paged through its cursors
+    """
+    jobs: List[Tuple[int, int | None]] = []
+    for i, album in enumerate(albums):
+        track_page = album["tracks"] if album else None
+        if not track_page or not track_page.get("next"):
+            continue
+
+        total = track_page.get("total")
+        if total is None:
+            jobs.append((i, None))
+        else:
+            first_offset = len(track_page["items"])
+            jobs.extend(
+                (i, offset) for offset in range(first_offset, total, ALBUM_TRACKS_LIMIT)
+            )
+
+    return jobs
+
+
+def log_remaining_track_pages(jobs: List[Tuple[int, int | None]]) -> None:
+    """Log how many extra track pages `plan_remaining_track_pages` planned."""
+
+    if jobs:
+        n_albums = len({i for i, _ in jobs})
+        logger.info(
+            f"Fetched {len(jobs)} more track {pluralize(len(jobs), 'page')} "
+            f"for {n_albums} {pluralize(n_albums, 'album')}"
+        )
+
+
+def select_album_batch_tracks(
+    albums: List[SpotifyAlbum], label: str
+) -> Tuple[List[ReleasedTrack], int]:
+    """Pick the tracks of an `albums` batch, dropping other labels and less preferred versions.
+
+    Args:
+        albums: Full album objects of one batch
+        label: Exact label name to verify
+
+    Returns:
+        Tuple of (kept tracks with their album's release date in album order,
+        number of dropped tracks)
+    """
+    tracks: List[ReleasedTrack] = []
+    n_dropped = 0
+
+    for album in albums:
+        if not album or album["label"] != label:
+            continue
+
+        album_tracks = album["tracks"]["items"]
+        unique_tracks: List[ReleasedTrack] = [
+            {
+                "uri": t["uri"],
+                "release_date": album["release_date"],
+                "name": t["name"],
+                "artists": [artist["name"] for artist in t["artists"]],
+            }
+            for t in resolve_versions(album_tracks)
+        ]
+        n_dropped += len(album_tracks) - len(unique_tracks)
+        tracks.extend(unique_tracks)
+
+    return tracks, n_dropped
+
+
+def create_playlists(
+    client: Spotify,
+    playlist_name: str,
+    tracks: Sequence[ReleasedTrack],
+    step_size: int = 50,
+    journal: BackfillJournal | None = None,
+    first_number: int = 1,
+) -> int:
     """Create numbered playlists with batches of tracks and date range descriptions.
 
+    Descriptions are built from the release dates carried by `tracks` and
+    the current user is looked up once, so besides the playlist writes no
+    further requests are made.
+
+    With a journal, every playlist is recorded once created and again once
+    its tracks are added. A rerun skips completed playlists and tops up the
+    ones created but not filled, instead of creating duplicates.
+
     Args:
         client: Authenticated Spotify client
         playlist_name: Base name for playlists (will be numbered)
-        track_uris: List of track URIs to split into playlists
+        tracks: Track URIs with release dates, in playlist order
         step_size: Number of tracks per playlist (default 50)
+        journal: Optional checkpoint journal of the label's backfill
+        first_number: Number of the first playlist (default 1)
+
+    Returns:
+        Number of playlists created by this call
     """
-    for i in range(0, len(track_uris), step_size):
-        full_playlist_name = f"{playlist_name} {(i // step_size) + 1:03d}"
-        first_track_release_date = fetch_track_release_date(client, track_uris[i])
-        last_track_release_date = fetch_track_release_date(
-            client, track_uris[min(i + step_size, len(track_uris)) - 1]
-        )
+    user_id: str | None = None
+    n_created = 0
+
+    for i in range(0, len(tracks), step_size):
+        full_playlist_name = f"{playlist_name} {(i // step_size) + first_number:03d}"
+        playlist_tracks = tracks[i : i + step_size]
+        playlist_track_uris = [t["uri"] for t in playlist_tracks]
+        record = journal.get("playlist", full_playlist_name) if journal else None
+
+        if record is not None:
+            if record["tracks_added"] == len(playlist_track_uris):
+                continue
+
+            logger.info(f"Topping up journaled playlist {full_playlist_name}")
+            add_to_playlist(client, record["uri"], playlist_track_uris)
+            journal.record(
+                "playlist",
+                full_playlist_name,
+                uri=record["uri"],
+                tracks_added=len(playlist_track_uris),
+            )
+            continue
 
-        playlist_description = (
-            first_track_release_date + " - " + last_track_release_date
-        )
+        if user_id is None:
+            user_id = client.me()["id"]
 
         playlist = client.user_playlist_create(
-            client.me()["id"],
+            user_id,
             full_playlist_name,
             public=False,
-            description=playlist_description,
+            description=playlist_date_range(playlist_tracks),
         )
         logger.info(
             f"Created playlist {full_playlist_name} - {playlist['external_urls']['spotify']}"
         )
+        n_created += 1
 
-        client.playlist_add_items(playlist["uri"], track_uris[i : i + step_size])
+        if journal is not None:
+            journal.record(
+                "playlist", full_playlist_name, uri=playlist["uri"], tracks_added=0
+            )
 
+        add_to_playlist(
+            client, playlist["uri"], playlist_track_uris, skip_existing=False
+        )
 
-def fetch_track_release_date(client: Spotify, track_uri: str) -> str:
-    """Fetch the release date for a track.
+        if journal is not None:
+            journal.record(
+                "playlist",
+                full_playlist_name,
+                uri=playlist["uri"],
+                tracks_added=len(playlist_track_uris),
+            )
 
-    Args:
-        client: Authenticated Spotify client
-        track_uri: Spotify track URI
+    return n_created
 
-    Returns:
-        Release date string from track's album
-    """
-    return client.track(track_uri)["album"]["release_date"]
+
+def playlist_date_range(tracks: Sequence[ReleasedTrack]) -> str:
+    """Describe a playlist by the release dates of its first and last track."""
+
+    return f"{tracks[0]['release_date']} - {tracks[-1]['release_date']}"
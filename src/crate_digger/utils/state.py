@@ -0,0 +1,195 @@
+import hashlib
+import sqlite3
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterable, List
+
+from crate_digger.constants import (
+    FINGERPRINT_MAX_AGE_DAYS,
+    RELEASE_STORE_FILENAME,
+    STATE_DIR,
+)
+from crate_digger.utils.types import SpotifyAlbum
+
+
+RELEASE_STORE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS processed_releases (
+    album_uri TEXT PRIMARY KEY,
+    label TEXT NOT NULL,
+    release_date TEXT NOT NULL,
+    processed_at TEXT NOT NULL,
+    verified INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS processed_releases_label_date
+    ON processed_releases (label, release_date);
+DROP TABLE IF EXISTS processed_tracks;
+CREATE TABLE IF NOT EXISTS track_fingerprints (
+    fingerprint INTEGER PRIMARY KEY,
+    added_at INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS track_fingerprints_added_at
+    ON track_fingerprints (added_at);
+"""
+
+
+def get_state_path(filename: str) -> Path:
+    """Resolve a file inside the project's local state directory.
+
+    Args:
+        filename: File name relative to the state directory
+
+    Returns:
+        Absolute path; the state directory is created if missing
+    """
+    state_dir = Path(__file__).resolve().parents[3] / STATE_DIR
+    state_dir.mkdir(parents=True, exist_ok=True)
+    return state_dir / filename
+
+
+def open_release_store(path: Path | str | None = None) -> sqlite3.Connection:
+    """Open (and initialize) the SQLite store of processed releases.
+
+    Args:
+        path: Database file path (default: RELEASE_STORE_FILENAME in the state directory)
+
+    Returns:
+        Open SQLite connection with the schema in place
+    """
+    conn = sqlite3.connect(path or get_state_path(RELEASE_STORE_FILENAME))
+    conn.executescript(RELEASE_STORE_SCHEMA)
+
+    # Stores created before rejected candidates were recorded lack `verified`
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(processed_releases)")}
+    if "verified" not in columns:
+        with conn:
+            conn.execute(
+                "ALTER TABLE processed_releases"
+                " ADD COLUMN verified INTEGER NOT NULL DEFAULT 1"
+            )
+    return conn
+
+
+def filter_unprocessed_releases(
+    conn: sqlite3.Connection, releases: List[SpotifyAlbum]
+) -> List[SpotifyAlbum]:
+    """Drop releases that a previous run has already processed or rejected.
+
+    Args:
+        conn: Open release store connection
+        releases: Album objects (search results are enough, only `uri` is read)
+
+    Returns:
+        Releases not yet recorded in the store, in input order
+    """
+    if not releases:
+        return []
+
+    uris = [r["uri"] for r in releases]
+    placeholders = ", ".join("?" * len(uris))
+    known = {
+        row[0]
+        for row in conn.execute(
+            f"SELECT album_uri FROM processed_releases WHERE album_uri IN ({placeholders})",
+            uris,
+        )
+    }
+    return [r for r in releases if r["uri"] not in known]
+
+
+def mark_release_processed(
+    conn: sqlite3.Connection,
+    label: str,
+    release: SpotifyAlbum,
+    verified: bool = True,
+) -> None:
+    """Record a release as processed.
+
+    Args:
+        conn: Open release store connection
+        label: Label the release was fetched for
+        release: Album object of the release
+        verified: False for a search candidate that failed label verification
+    """
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO processed_releases"
+            " (album_uri, label, release_date, processed_at, verified)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (
+                release["uri"],
+                label,
+                release["release_date"],
+                datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                int(verified),
+            ),
+        )
+
+
+def hash_fingerprint(key: str) -> int:
+    """Hash a track identity string into a signed 64-bit SQLite integer.
+
+    Args:
+        key: Identity string, e.g. normalized title and artists or an ISRC
+
+    Returns:
+        Fingerprint stored as the integer primary key of `track_fingerprints`
+    """
+    digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def find_known_fingerprints(
+    conn: sqlite3.Connection, fingerprints: Iterable[int]
+) -> set[int]:
+    """Look up which fingerprints an earlier run has already recorded.
+
+    Args:
+        conn: Open release store connection
+        fingerprints: Fingerprints from `hash_fingerprint`
+
+    Returns:
+        The subset of `fingerprints` present in the store
+    """
+    fingerprints = list(set(fingerprints))
+    if not fingerprints:
+        return set()
+
+    placeholders = ", ".join("?" * len(fingerprints))
+    return {
+        row[0]
+        for row in conn.execute(
+            f"SELECT fingerprint FROM track_fingerprints WHERE fingerprint IN ({placeholders})",
+            fingerprints,
+        )
+    }
+
+
+def record_fingerprints(
+    conn: sqlite3.Connection,
+    fingerprints: Iterable[int],
+    max_age_days: int = FINGERPRINT_MAX_AGE_DAYS,
+) -> int:
+    """Record fingerprints of added tracks and evict those older than `max_age_days`.
+
+    Args:
+        conn: Open release store connection
+        fingerprints: Fingerprints from `hash_fingerprint`
+        max_age_days: Age after which a fingerprint no longer blocks a track
+
+    Returns:
+        Number of evicted fingerprints
+    """
+    now = datetime.now(timezone.utc)
+    cutoff = now - timedelta(days=max_age_days)
+
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO track_fingerprints VALUES (?, ?)",
+            [(fingerprint, int(now.timestamp())) for fingerprint in fingerprints],
+        )
+        evicted = conn.execute(
+            "DELETE FROM track_fingerprints WHERE added_at < ?",
+            (int(cutoff.timestamp()),),
+        )
+    return evicted.rowcount
@@ -1,10 +1,12 @@
 import os
+import time
 import requests
 
 from typing import Dict, List
 
 from crate_digger.utils.markdownv2 import bold, escape_markdown_v2
 from crate_digger.utils.logging import get_logger
+from crate_digger.utils.metrics import get_run_metrics
 from crate_digger.utils.types import SpotifyTrack
 
 
@@ -27,12 +29,23 @@ def send_message(message: str) -> None:
         "parse_mode": "MarkdownV2",
     }
 
+    started_at = time.perf_counter()
+    failed = True
+
     try:
         resp = requests.post(url, data=data)
         resp.raise_for_status()
+        failed = False
     except requests.RequestException as e:
         logger.error(f"Telegram request failed: {e}")
         raise
+    finally:
+        get_run_metrics().observe(
+            "telegram:sendMessage",
+            time.perf_counter() - started_at,
+            error=failed,
+            bytes_sent=len(message.encode()),
+        )
 
 
 def construct_message(releases_info: Dict[str, Dict[str, List[SpotifyTrack]]]) -> str:
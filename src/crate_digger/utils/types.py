@@ -1,4 +1,4 @@
-from typing import List, TypedDict
+from typing import Dict, List, NotRequired, TypedDict
 
 
 class SpotifyArtist(TypedDict):
@@ -7,22 +7,77 @@ class SpotifyArtist(TypedDict):
     name: str
 
 
+class SpotifyTrackPage(TypedDict):
+    """Paging object of tracks, as embedded in full album objects."""
+
+    items: List["SpotifyTrack"]
+    next: str | None
+    total: NotRequired[int]
+
+
 class SpotifyAlbum(TypedDict):
-    """Album metadata as returned by album and search endpoints."""
+    """Album metadata as returned by album and search endpoints.
+
+    Search results are simplified album objects without a `label`.
+    """
 
     uri: str
     name: str
-    label: str
+    label: NotRequired[str]
     release_date: str
+    tracks: NotRequired[SpotifyTrackPage]
+
+
+class SpotifyAlbumPage(TypedDict):
+    """Paging object of albums, as returned by album searches."""
+
+    items: List[SpotifyAlbum]
+    next: NotRequired[str | None]
+    total: NotRequired[int]
+
+
+class SearchShard(TypedDict):
+    """Releases found by one backfill search partition."""
+
+    query: str
+    total: int | None
+    releases: List[SpotifyAlbum]
+    saturated: bool
+    n_refinements: int
 
 
 class SpotifyTrack(TypedDict):
-    """Track metadata used throughout the project."""
+    """Track metadata used throughout the project.
+
+    Only full track objects carry `external_ids` (e.g. the ISRC).
+    """
 
     name: str
     uri: str
     artists: List[SpotifyArtist]
     album: SpotifyAlbum
+    external_ids: NotRequired[Dict[str, str]]
+
+
+class ReleasedTrack(TypedDict):
+    """Compact backfill record of a track URI and its album's release date.
+
+    `name` and `artists` (artist names) are used for near-duplicate
+    detection; records journaled before they were kept lack them.
+    """
+
+    uri: str
+    release_date: str
+    name: NotRequired[str]
+    artists: NotRequired[List[str]]
+
+
+class BackfillSummary(TypedDict):
+    """Outcome of backfilling one label."""
+
+    releases: int
+    tracks: int
+    playlists_created: int
 
 
 class TrackInfo(TypedDict):
@@ -35,6 +90,11 @@ class TrackInfo(TypedDict):
 __all__ = [
     "SpotifyArtist",
     "SpotifyAlbum",
+    "SpotifyAlbumPage",
+    "SpotifyTrackPage",
+    "SearchShard",
     "SpotifyTrack",
+    "ReleasedTrack",
+    "BackfillSummary",
     "TrackInfo",
 ]
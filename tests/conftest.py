@@ -0,0 +1,13 @@
+import pytest
+
+
+@pytest.fixture
+def per_label():
+    """Adapt a per-label releases stub to fetch_new_relevant_releases_by_label."""
+
+    def _per_label(fetch_releases):
+        return lambda c, labels, *args, **kwargs: {
+            label: fetch_releases(c, label) for label in labels
+        }
+
+    return _per_label
@@ -0,0 +1,357 @@
+import asyncio
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from spotipy import SpotifyException  # noqa: E402
+
+from crate_digger.utils.async_spotify import (  # noqa: E402
+    AsyncSpotify,
+    async_add_to_playlist,
+    async_backfill_labels,
+    async_fetch_album_tracks,
+    async_fetch_and_add,
+)
+from crate_digger.utils.cache import MemoryResponseCache  # noqa: E402
+from crate_digger.utils.journal import BackfillJournal  # noqa: E402
+from crate_digger.utils.ratelimit import RateLimiter  # noqa: E402
+
+
+def _mk_client(handler, **kwargs):
+    return AsyncSpotify(
+        auth="token",
+        limiter=RateLimiter(rate=1_000, burst=1_000),
+        transport=httpx.MockTransport(handler),
+        backoff_factor=0,
+        **kwargs,
+    )
+
+
+def _run(client, coro_fn):
+    async def _main():
+        async with client:
+            return await coro_fn(client)
+
+    return asyncio.run(_main())
+
+
+def test_search_sends_spotipy_compatible_request():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"albums": {"items": []}})
+
+    client = _mk_client(handler)
+    _run(client, lambda c: c.search("label:X tag:new", limit=10, type="album"))
+
+    (request,) = requests
+    assert request.url.path == "/v1/search"
+    assert request.url.params["q"] == "label:X tag:new"
+    assert request.url.params["type"] == "album"
+    assert "market" not in request.url.params
+    assert request.headers["Authorization"] == "Bearer token"
+
+
+def test_cached_responses_skip_the_network():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"albums": [{"uri": "spotify:album:a"}]})
+
+    client = _mk_client(handler, cache=MemoryResponseCache())
+
+    async def _twice(c):
+        await c.albums(["spotify:album:a"])
+        return await c.albums(["spotify:album:a"])
+
+    assert _run(client, _twice) == {"albums": [{"uri": "spotify:album:a"}]}
+    assert calls == ["/v1/albums/"]
+
+
+def test_429_pauses_limiter_and_retries():
+    responses = iter(
+        [
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"albums": []}),
+        ]
+    )
+    limiter = RateLimiter(rate=1_000, burst=1_000)
+    client = AsyncSpotify(
+        auth="token",
+        limiter=limiter,
+        transport=httpx.MockTransport(lambda request: next(responses)),
+    )
+
+    assert _run(client, lambda c: c.albums(["a"])) == {"albums": []}
+    assert limiter.stats()["throttled_responses"] == 1
+
+
+def test_server_errors_are_retried_then_raised():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503, json={"error": {"message": "unavailable"}})
+
+    client = _mk_client(handler, status_retries=2)
+
+    with pytest.raises(SpotifyException) as exc_info:
+        _run(client, lambda c: c.albums(["a"]))
+
+    assert exc_info.value.http_status == 503
+    assert len(calls) == 3
+
+
+def test_server_errors_on_writes_are_not_resent():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503, json={"error": {"message": "unavailable"}})
+
+    client = _mk_client(handler, status_retries=2)
+
+    with pytest.raises(SpotifyException):
+        _run(client, lambda c: c.playlist_add_items("p", ["spotify:track:t1"]))
+
+    assert len(calls) == 1
+
+
+def test_fetch_album_tracks_follows_next_pages():
+    def handler(request):
+        return httpx.Response(200, json={"items": [{"uri": "t3"}], "next": None})
+
+    album = {
+        "uri": "spotify:album:a",
+        "name": "A",
+        "tracks": {
+            "items": [{"uri": "t1"}, {"uri": "t2"}],
+            "next": "https://api.spotify.com/v1/albums/a/tracks?offset=2",
+        },
+    }
+    client = _mk_client(handler)
+
+    tracks = _run(client, lambda c: async_fetch_album_tracks(c, album))
+
+    assert [t["uri"] for t in tracks] == ["t1", "t2", "t3"]
+
+
+def test_add_to_playlist_skips_existing_and_chunks():
+    posted = []
+
+    def handler(request):
+        if request.method == "GET":
+            return httpx.Response(
+                200,
+                json={"items": [{"track": {"uri": "spotify:track:t0"}}], "next": None},
+            )
+        posted.append(json.loads(request.content))
+        return httpx.Response(201, json={"snapshot_id": "s"})
+
+    uris = [f"spotify:track:t{i}" for i in range(151)]
+    client = _mk_client(handler)
+
+    _run(client, lambda c: async_add_to_playlist(c, "spotify:playlist:p", uris))
+
+    assert [len(chunk) for chunk in posted] == [100, 50]
+    assert posted[0][0] == "spotify:track:t1"
+
+
+def test_async_fetch_and_add_matches_blocking_pipeline(monkeypatch):
+    monkeypatch.setattr(
+        "crate_digger.utils.async_spotify.filter_recent_releases",
+        lambda releases, n_days=1: releases,
+    )
+    albums = {
+        "a1": {
+            "uri": "spotify:album:a1",
+            "name": "First",
+            "label": "Label A",
+            "tracks": {
+                "items": [{"uri": "spotify:track:x1", "name": "X", "artists": []}],
+                "next": None,
+            },
+        },
+        "a2": {
+            "uri": "spotify:album:a2",
+            "name": "Second",
+            "label": "Other",
+            "tracks": {"items": [], "next": None},
+        },
+    }
+    posted = []
+    track_lookups = []
+
+    def handler(request):
+        path = request.url.path
+        if path == "/v1/search":
+            return httpx.Response(
+                200, json={"albums": {"items": list(albums.values())}}
+            )
+        if path == "/v1/albums/":
+            ids = request.url.params["ids"].split(",")
+            return httpx.Response(200, json={"albums": [albums[i] for i in ids]})
+        if path == "/v1/tracks/":
+            track_lookups.append(request.url.params["ids"])
+            return httpx.Response(
+                200,
+                json={
+                    "tracks": [
+                        {"uri": "spotify:track:x1", "external_ids": {"isrc": "X1"}}
+                    ]
+                },
+            )
+        if request.method == "GET":
+            return httpx.Response(200, json={"items": [], "next": None})
+        posted.append(json.loads(request.content))
+        return httpx.Response(201, json={"snapshot_id": "s"})
+
+    client = _mk_client(handler)
+
+    result = _run(
+        client,
+        lambda c: async_fetch_and_add(c, ["Label A"], "spotify:playlist:p"),
+    )
+
+    assert list(result["Label A"]) == ["First"]
+    assert result["Label A"]["First"][0]["external_ids"] == {"isrc": "X1"}
+    assert track_lookups == ["x1"]
+    assert posted == [["spotify:track:x1"]]
+
+
+def test_add_to_playlist_retries_only_missing_tracks(monkeypatch):
+    monkeypatch.setattr("crate_digger.utils.spotify.WRITE_RETRY_BACKOFF", 0)
+    playlist = ["spotify:track:t0"]
+    posted = []
+
+    def handler(request):
+        if request.method == "GET":
+            items = [{"track": {"uri": uri}} for uri in playlist]
+            return httpx.Response(200, json={"items": items, "next": None})
+
+        uris = json.loads(request.content)
+        posted.append(uris)
+        if len(posted) == 1:
+            # the first write is applied, but its response is lost
+            playlist.extend(uris[:1])
+            return httpx.Response(502, json={"error": {"message": "bad gateway"}})
+        playlist.extend(uris)
+        return httpx.Response(201, json={"snapshot_id": "s"})
+
+    uris = ["spotify:track:t1", "spotify:track:t2"]
+    client = _mk_client(handler)
+
+    snapshot = _run(
+        client, lambda c: async_add_to_playlist(c, "spotify:playlist:p", uris)
+    )
+
+    assert posted == [uris, ["spotify:track:t2"]]
+    assert playlist == ["spotify:track:t0", "spotify:track:t1", "spotify:track:t2"]
+    assert snapshot == {"snapshot_id": "s"}
+
+
+def test_add_to_playlist_without_tracks_makes_no_request():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json={"items": [], "next": None})
+
+    client = _mk_client(handler)
+
+    assert _run(client, lambda c: async_add_to_playlist(c, "p", [])) is None
+    assert calls == []
+
+
+def test_async_backfill_labels_creates_playlists_and_journals(tmp_path):
+    def _track(uri, name):
+        return {"uri": f"spotify:track:{uri}", "name": name, "artists": [{"name": "A"}]}
+
+    albums = {
+        "al1": {
+            "uri": "spotify:album:al1",
+            "name": "One",
+            "label": "Label A",
+            "release_date": "2021-03-01",
+            "tracks": {
+                "items": [_track("t1", "Song"), _track("t2", "Song (Extended Mix)")],
+                "next": None,
+            },
+        },
+        "al2": {
+            "uri": "spotify:album:al2",
+            "name": "Two",
+            "label": "Label A Records",
+            "release_date": "2022-05-01",
+            "tracks": {"items": [_track("t9", "Other")], "next": None},
+        },
+        "al3": {
+            "uri": "spotify:album:al3",
+            "name": "Three",
+            "label": "Label A",
+            "release_date": "2022-06-01",
+            "tracks": {"items": [_track("t3", "B")], "next": "more", "total": 3},
+        },
+    }
+    requests = []
+
+    def _search(params):
+        years = params["q"].split("year:")[1].split("-")
+        first, last = int(years[0]), int(years[-1])
+        found = [
+            {k: a[k] for k in ("uri", "name", "release_date")}
+            for a in albums.values()
+            if first <= int(a["release_date"][:4]) <= last
+        ]
+        limit, offset = int(params["limit"]), int(params["offset"])
+        page = {"items": found[offset : offset + limit], "total": len(found)}
+        return {"albums": page}
+
+    def handler(request):
+        path, params = request.url.path, request.url.params
+        requests.append((request.method, path))
+        if path == "/v1/search":
+            return httpx.Response(200, json=_search(params))
+        if path == "/v1/albums/":
+            ids = params["ids"].split(",")
+            return httpx.Response(200, json={"albums": [albums[i] for i in ids]})
+        if path == "/v1/albums/al3/tracks/":
+            assert params["offset"] == "1"
+            return httpx.Response(
+                200, json={"items": [_track("t4", "C"), _track("t5", "D")]}
+            )
+        if path == "/v1/me/":
+            return httpx.Response(200, json={"id": "user"})
+        if path == "/v1/users/user/playlists":
+            body = json.loads(request.content)
+            assert body["description"] == "2021-03-01 - 2022-06-01"
+            return httpx.Response(
+                201,
+                json={
+                    "uri": "spotify:playlist:p1",
+                    "external_urls": {"spotify": "https://open.spotify.com/p1"},
+                },
+            )
+        posted.append(json.loads(request.content))
+        return httpx.Response(201, json={"snapshot_id": "s"})
+
+    posted = []
+    journal = BackfillJournal(tmp_path / "Label A.jsonl")
+    client = _mk_client(handler)
+
+    summary = _run(
+        client,
+        lambda c: async_backfill_labels(c, ["Label A"], journals={"Label A": journal}),
+    )
+
+    assert summary == {"Label A": {"releases": 3, "tracks": 4, "playlists_created": 1}}
+    assert posted == [[f"spotify:track:{t}" for t in ("t1", "t3", "t4", "t5")]]
+    # a new playlist is written without reading it back first
+    assert ("GET", "/v1/playlists/p1/items") not in requests
+    assert requests.count(("GET", "/v1/me/")) == 1
+    assert journal.get("playlist", "Label A 001")["tracks_added"] == 4
+    assert journal.get("album", "spotify:album:al2")["tracks"] == []
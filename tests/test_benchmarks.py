@@ -0,0 +1,126 @@
+from benchmarks.fake_spotify import FakeCatalog, FakeSpotifyServer
+from benchmarks.run import main, make_client
+from crate_digger.utils.spotify import (
+    backfill_labels,
+    collect_tracks_from_albums,
+    fetch_all_releases,
+    fetch_and_add,
+)
+
+
+LABELS = ["Label A", "Label B"]
+
+
+def test_fake_server_serves_the_daily_pipeline():
+    catalog = FakeCatalog(
+        LABELS, albums_per_label=10, tracks_per_album=3, new_per_label=2, decoy_ratio=0
+    )
+
+    with FakeSpotifyServer(catalog, page_size=2) as server:
+        client = make_client(server, rate=1_000)
+        result = fetch_and_add(client, LABELS, "spotify:playlist:p", n_days=7)
+        stats = server.stats()
+
+    assert list(result) == LABELS
+    assert all(len(releases) == 2 for releases in result.values())
+    # 2 labels x 2 releases x 2 tracks, extended mixes removed
+    assert len(server.playlists["p"]) == 8
+    assert stats["search"] == 2
+    assert stats["albums"] == 1
+    # Third track of every release is on a second embedded page
+    assert stats["album_tracks"] == 4
+
+
+def test_fake_server_paginates_backfill_searches():
+    catalog = FakeCatalog(["Label A"], albums_per_label=40, seed=1)
+
+    with FakeSpotifyServer(catalog) as server:
+        releases = fetch_all_releases(make_client(server, rate=1_000), "Label A")
+
+    assert sorted(r["uri"] for r in releases) == sorted(
+        f"spotify:album:{album_id}" for album_id in catalog.albums
+    )
+
+
+def test_backfill_labels_summarizes_every_label():
+    catalog = FakeCatalog(
+        LABELS, albums_per_label=12, tracks_per_album=3, decoy_ratio=0, seed=2
+    )
+
+    with FakeSpotifyServer(catalog) as server:
+        summary = backfill_labels(make_client(server, rate=1_000), LABELS, 4)
+        stats = server.stats()
+
+    # 12 albums x 2 tracks per label, extended mixes removed
+    assert summary == {
+        label: {"releases": 12, "tracks": 24, "playlists_created": 1}
+        for label in LABELS
+    }
+    assert len(server.playlists) == 2
+    # 24 albums of both labels share 2 `albums` batches
+    assert stats["albums"] == 2
+
+
+def test_collect_tracks_pages_large_albums_concurrently(monkeypatch):
+    monkeypatch.setattr("crate_digger.utils.spotify.ALBUM_TRACKS_LIMIT", 3)
+    catalog = FakeCatalog(
+        ["Label A"], albums_per_label=4, tracks_per_album=11, decoy_ratio=0
+    )
+    album_ids = sorted(catalog.albums)
+
+    with FakeSpotifyServer(catalog, page_size=2) as server:
+        tracks = collect_tracks_from_albums(
+            make_client(server, rate=1_000),
+            [f"spotify:album:{album_id}" for album_id in album_ids],
+            "Label A",
+            max_workers=4,
+        )
+        stats = server.stats()
+
+    expected = [
+        f"spotify:track:{track_id}"
+        for album_id in album_ids
+        for track_id in catalog.albums[album_id]["track_ids"]
+        if "extended" not in catalog.tracks[track_id]["name"].lower()
+    ]
+    assert [t["uri"] for t in tracks] == expected
+    # 9 tracks after the embedded page of 2, in pages of 3, for 4 albums
+    assert stats["album_tracks"] == 3 * 4
+
+
+def test_fake_server_injects_errors_and_throttling():
+    catalog = FakeCatalog(LABELS, albums_per_label=5)
+
+    with FakeSpotifyServer(catalog, error_rate=0.2, throttle_rate=0.2) as server:
+        client = make_client(server, rate=1_000)
+        for label in LABELS * 5:
+            client.search(f"label:{label} tag:new", type="album")
+        stats = server.stats()
+
+    assert stats["search"] == 10
+    assert stats.get("injected:429", 0) + stats.get("injected:503", 0) > 0
+
+
+def test_benchmark_reports_requests_and_memory(tmp_path):
+    results = main(
+        [
+            "--labels",
+            "2",
+            "--albums-per-label",
+            "10",
+            "--latency",
+            "0",
+            "--scenario",
+            "daily",
+            "backfill",
+            "--json",
+            str(tmp_path / "results.json"),
+        ]
+    )
+
+    assert [r["scenario"] for r in results] == ["daily", "backfill"]
+    assert all(
+        r["requests"] == sum(r["requests_per_endpoint"].values()) for r in results
+    )
+    assert all(r["peak_memory_kib"] > 0 for r in results)
+    assert (tmp_path / "results.json").exists()
@@ -0,0 +1,200 @@
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from crate_digger.utils.cache import (
+    CachedSpotify,
+    DiskResponseCache,
+    MemoryResponseCache,
+    ResponseCache,
+    cache_endpoint,
+    cache_key,
+)
+from crate_digger.utils.ratelimit import RateLimitedSpotify
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+TTLS = {"search:new": 10, "search": 100, "albums": 1_000}
+
+
+@pytest.mark.parametrize(
+    "url, params, expected",
+    [
+        ("search", {"q": "label:X tag:new"}, "search:new"),
+        ("search", {"q": "label:X year:2020"}, "search"),
+        ("search", {"q": "label:X year:2010-2019 a"}, "search"),
+        ("search", {"q": f"label:X year:{date.today().year}"}, "search:new"),
+        ("search", {"q": f"label:X year:2020-{date.today().year}"}, "search:new"),
+        ("albums/?ids=a,b", {}, "albums"),
+        ("albums/abc", {}, "albums"),
+        ("albums/abc/tracks", {"limit": 50}, "album_tracks"),
+        ("tracks/abc", {}, "tracks"),
+        ("tracks/?ids=a,b", {}, "tracks"),
+        ("me/", {}, None),
+        ("playlists/abc/tracks", {}, None),
+        ("search?query=label%3AX+tag%3Anew&type=album&offset=10", {}, "search:new"),
+        ("search?query=label%3AX+year%3A2020&offset=10", {}, "search"),
+        (f"search?query=label%3AX+year%3A{date.today().year}", {}, "search:new"),
+    ],
+)
+def test_cache_endpoint_classification(url, params, expected):
+    assert cache_endpoint(url, params) == expected
+
+
+def test_cache_key_ignores_param_order_and_none():
+    assert cache_key("search", {"q": "x", "limit": 10, "market": None}) == cache_key(
+        "search", {"limit": 10, "q": "x"}
+    )
+    assert cache_key("search", {"offset": 0}) != cache_key("search", {"offset": 10})
+
+
+def test_memory_cache_expires_per_endpoint_ttl():
+    clock = FakeClock()
+    cache = MemoryResponseCache(ttls=TTLS, clock=clock)
+    cache.set("search:new", "k1", {"v": 1})
+    cache.set("albums", "k2", {"v": 2})
+
+    clock.now += 50
+
+    assert cache.get("search:new", "k1") is None
+    assert cache.get("albums", "k2") == {"v": 2}
+    assert cache.stats()["endpoints"] == {
+        "search:new": {"hits": 0, "misses": 1},
+        "albums": {"hits": 1, "misses": 0},
+    }
+
+
+def test_memory_cache_skips_endpoints_without_ttl():
+    cache = MemoryResponseCache(ttls=TTLS)
+    cache.set("tracks", "k", {"v": 1})
+    assert cache.get("tracks", "k") is None
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryResponseCache(ttls=TTLS, max_entries=2)
+    cache.set("albums", "a", 1)
+    cache.set("albums", "b", 2)
+    cache.get("albums", "a")
+    cache.set("albums", "c", 3)
+
+    assert cache.get("albums", "b") is None
+    assert cache.get("albums", "a") == 1
+    assert cache.get("albums", "c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_disk_cache_persists_and_evicts_least_recently_used(tmp_path):
+    clock = FakeClock()
+    path = tmp_path / "responses.sqlite3"
+
+    cache = DiskResponseCache(path, ttls=TTLS, max_entries=2, clock=clock)
+    cache.set("albums", "a", {"uri": "a"})
+    clock.now += 1
+    cache.set("albums", "b", {"uri": "b"})
+    clock.now += 1
+    cache.get("albums", "a")
+    clock.now += 1
+    cache.set("albums", "c", {"uri": "c"})
+    cache.close()
+
+    reopened = DiskResponseCache(path, ttls=TTLS, max_entries=2, clock=clock)
+    assert reopened.get("albums", "a") == {"uri": "a"}
+    assert reopened.get("albums", "b") is None
+    assert reopened.get("albums", "c") == {"uri": "c"}
+
+    clock.now += 10_000
+    assert reopened.get("albums", "a") is None
+
+
+def test_memory_cache_evicts_to_byte_limit():
+    cache = MemoryResponseCache(ttls=TTLS, max_bytes=20)
+    cache.set("albums", "a", "x" * 6)
+    cache.set("albums", "b", "y" * 6)
+    cache.set("albums", "a", "z" * 6)
+    cache.set("albums", "c", "w" * 6)
+
+    # every body is 8 bytes of JSON; "b" is the least recently used
+    assert cache.get("albums", "b") is None
+    assert cache.get("albums", "a") == "z" * 6
+    assert cache.get("albums", "c") == "w" * 6
+    assert cache.stats()["evictions"] == 1
+
+
+def test_disk_cache_keeps_byte_count_across_reopens(tmp_path):
+    clock = FakeClock()
+    path = tmp_path / "responses.sqlite3"
+
+    cache = DiskResponseCache(path, ttls=TTLS, max_bytes=20, clock=clock)
+    cache.set("albums", "a", "ä" * 3)
+    clock.now += 1
+    cache.set("albums", "b", "x" * 3)
+    cache.close()
+
+    # "äää" is 8 bytes of JSON, "xxx" 5: a third body evicts only "a"
+    reopened = DiskResponseCache(path, ttls=TTLS, max_bytes=20, clock=clock)
+    clock.now += 1
+    reopened.set("albums", "c", "y" * 6)
+    assert reopened.get("albums", "a") is None
+    assert reopened.get("albums", "b") == "x" * 3
+    assert reopened.stats()["evictions"] == 1
+
+
+def test_response_cache_requires_storage_methods():
+    with pytest.raises(TypeError):
+        ResponseCache()
+
+
+def test_cached_spotify_replays_catalog_lookups():
+    cache = MemoryResponseCache()
+    client = CachedSpotify(auth="token", cache=cache)
+
+    with patch.object(
+        RateLimitedSpotify, "_internal_call", return_value={"albums": []}
+    ) as call:
+        client.albums(["spotify:album:abc"])
+        client.albums(["spotify:album:abc"])
+
+    assert call.call_count == 1
+    assert cache.stats()["endpoints"]["albums"] == {"hits": 1, "misses": 1}
+
+
+def test_cached_spotify_classifies_next_pages_like_the_first():
+    cache = MemoryResponseCache()
+    client = CachedSpotify(auth="token", cache=cache)
+    next_url = (
+        "https://api.spotify.com/v1/search"
+        "?query=label%3AX+tag%3Anew&type=album&offset=10&limit=10"
+    )
+    first_page = {"albums": {"items": [], "next": next_url}}
+
+    with patch.object(
+        RateLimitedSpotify, "_internal_call", side_effect=[first_page, {"albums": {}}]
+    ):
+        client.search("label:X tag:new", limit=10, type="album")
+        client.next(first_page["albums"])
+
+    assert cache.stats()["endpoints"] == {"search:new": {"hits": 0, "misses": 2}}
+
+
+def test_cached_spotify_never_caches_playlists_or_writes():
+    cache = MemoryResponseCache()
+    client = CachedSpotify(auth="token", cache=cache)
+
+    with patch.object(
+        RateLimitedSpotify, "_internal_call", return_value={"items": []}
+    ) as call:
+        client.playlist_items("abc")
+        client.playlist_items("abc")
+        client.playlist_add_items("abc", ["spotify:track:x"])
+        client.playlist_add_items("abc", ["spotify:track:x"])
+
+    assert call.call_count == 4
+    assert cache.stats()["hits"] == 0
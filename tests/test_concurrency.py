@@ -0,0 +1,37 @@
+import threading
+import time
+
+from crate_digger.utils.concurrency import imap_concurrently
+
+
+def test_imap_concurrently_keeps_order_and_bounds_in_flight():
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+    consumed = []
+
+    def _work(i):
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        # later items finish first
+        time.sleep(0.01 * (5 - i % 5))
+        with lock:
+            running -= 1
+        return i
+
+    for result in imap_concurrently(_work, range(10), max_in_flight=3):
+        consumed.append(result)
+
+    assert consumed == list(range(10))
+    assert 1 < max_running <= 3
+
+
+def test_imap_concurrently_is_lazy_when_sequential():
+    calls = []
+    results = imap_concurrently(lambda i: calls.append(i) or i, range(3))
+
+    assert calls == []
+    assert next(results) == 0
+    assert calls == [0]
@@ -12,15 +12,22 @@ def _mk_track(name: str, artist: str, uri: str, album_name: str = "Album1"):
     }
 
 
-def test_fetch_and_add_end_to_end(monkeypatch):
+def _mk_client():
+    """Mock client whose target playlist starts out empty."""
     client = MagicMock()
+    client.playlist_items.return_value = {"items": [], "next": None}
+    return client
+
+
+def test_fetch_and_add_end_to_end(monkeypatch, per_label):
+    client = _mk_client()
     release = {"uri": "album:1", "name": "Album1"}
 
     # Control the releases and tracks returned through the pipeline
     monkeypatch.setattr(
         m,
-        "fetch_new_relevant_releases",
-        lambda c, label: [release],
+        "fetch_new_relevant_releases_by_label",
+        per_label(lambda c, label: [release]),
     )
 
     tracks = [
@@ -47,10 +54,35 @@ def test_fetch_and_add_end_to_end(monkeypatch):
     assert out == {"Label": {"Album1": tracks}}
 
 
-def test_fetch_and_add_no_releases_found(monkeypatch):
-    client = MagicMock()
+def test_fetch_and_add_keeps_same_named_releases_apart(monkeypatch, per_label):
+    client = _mk_client()
+    releases = [
+        {"uri": "album:1", "name": "Remixes"},
+        {"uri": "album:2", "name": "Remixes"},
+    ]
+    monkeypatch.setattr(
+        m, "fetch_new_relevant_releases_by_label", per_label(lambda c, label: releases)
+    )
+    album_tracks = {
+        "album:1": [_mk_track("One (Dub)", "A", "u1", "Remixes")],
+        "album:2": [_mk_track("Two (Dub)", "B", "u2", "Remixes")],
+    }
+    monkeypatch.setattr(m, "fetch_album_tracks", lambda c, a: album_tracks[a["uri"]])
+
+    out = m.fetch_and_add(client, ["Label"], target_playlist="plid")
 
-    monkeypatch.setattr(m, "fetch_new_relevant_releases", lambda c, label: [])
+    client.playlist_add_items.assert_called_once_with("plid", ["u1", "u2"])
+    assert out == {
+        "Label": {"Remixes": album_tracks["album:1"] + album_tracks["album:2"]}
+    }
+
+
+def test_fetch_and_add_no_releases_found(monkeypatch, per_label):
+    client = _mk_client()
+
+    monkeypatch.setattr(
+        m, "fetch_new_relevant_releases_by_label", per_label(lambda c, label: [])
+    )
 
     out = m.fetch_and_add(client, ["Label"], target_playlist="plid")
 
@@ -59,11 +91,15 @@ def test_fetch_and_add_no_releases_found(monkeypatch):
     assert out == {}
 
 
-def test_fetch_and_add_all_extended_versions(monkeypatch):
-    client = MagicMock()
+def test_fetch_and_add_all_extended_versions(monkeypatch, per_label):
+    client = _mk_client()
     release = {"uri": "album:1", "name": "Album1"}
 
-    monkeypatch.setattr(m, "fetch_new_relevant_releases", lambda c, label: [release])
+    monkeypatch.setattr(
+        m,
+        "fetch_new_relevant_releases_by_label",
+        per_label(lambda c, label: [release]),
+    )
 
     tracks = [
         _mk_track("Track (Extended Mix)", "A", "u1"),
@@ -75,13 +111,12 @@ def test_fetch_and_add_all_extended_versions(monkeypatch):
 
     _ = m.fetch_and_add(client, ["Label"], target_playlist="plid")
 
-    # Extended versions kept when no originals exist
-    # Reverse order because of sorting by ascending name length
-    client.playlist_add_items.assert_called_once_with("plid", ["u2", "u1"])
+    # Extended versions kept when no originals exist, in release order
+    client.playlist_add_items.assert_called_once_with("plid", ["u1", "u2"])
 
 
-def test_fetch_and_add_multiple_labels(monkeypatch):
-    client = MagicMock()
+def test_fetch_and_add_multiple_labels(monkeypatch, per_label):
+    client = _mk_client()
 
     def mock_fetch_releases(c, label):
         return [{"uri": f"album:{label}", "name": f"Album-{label}"}]
@@ -89,7 +124,9 @@ def test_fetch_and_add_multiple_labels(monkeypatch):
     def mock_fetch_tracks(c, album):
         return [_mk_track("Track", "A", f"uri:{album['name']}")]
 
-    monkeypatch.setattr(m, "fetch_new_relevant_releases", mock_fetch_releases)
+    monkeypatch.setattr(
+        m, "fetch_new_relevant_releases_by_label", per_label(mock_fetch_releases)
+    )
     monkeypatch.setattr(m, "fetch_album_tracks", mock_fetch_tracks)
     client.playlist_add_items.return_value = "snap123"
 
@@ -103,8 +140,121 @@ def test_fetch_and_add_multiple_labels(monkeypatch):
     assert len(call_args[1]) == 2  # 2 tracks total
 
 
-def test_create_playlists_end_to_end(monkeypatch):
-    client = MagicMock()
+def test_fetch_and_add_concurrent_matches_sequential(monkeypatch):
+    import time
+
+    labels = [f"Label{i}" for i in range(5)]
+
+    def mock_search(c, label):
+        # Earlier labels finish last so completion order differs from input order
+        time.sleep(0.01 * (len(labels) - int(label[-1])))
+        return [{"uri": f"album:{label}", "name": f"Album-{label}"}]
+
+    def mock_albums(uris):
+        return {
+            "albums": [
+                {"uri": uri, "name": f"Album-{uri[6:]}", "label": uri[6:]}
+                for uri in uris
+            ]
+        }
+
+    def mock_fetch_tracks(c, album):
+        return [_mk_track("Track", "A", f"uri:{album['name']}")]
+
+    monkeypatch.setattr(m, "fetch_new_releases", mock_search)
+    monkeypatch.setattr(m, "filter_recent_releases", lambda r, n_days: r)
+    monkeypatch.setattr(m, "fetch_album_tracks", mock_fetch_tracks)
+
+    sequential_client = _mk_client()
+    sequential_client.albums.side_effect = mock_albums
+    concurrent_client = _mk_client()
+    concurrent_client.albums.side_effect = mock_albums
+
+    out_sequential = m.fetch_and_add(sequential_client, labels, "plid")
+    out_concurrent = m.fetch_and_add(concurrent_client, labels, "plid", max_workers=4)
+
+    assert out_concurrent == out_sequential
+    assert list(out_concurrent) == labels
+    assert (
+        concurrent_client.playlist_add_items.call_args
+        == sequential_client.playlist_add_items.call_args
+    )
+
+
+def test_fetch_and_add_with_store_skips_processed_releases(monkeypatch, tmp_path):
+    from crate_digger.utils.state import open_release_store
+
+    store = open_release_store(tmp_path / "releases.sqlite3")
+    search_results = [
+        {"uri": "album:1", "name": "Album1", "release_date": "2020-01-01"},
+        {"uri": "album:2", "name": "Album2", "release_date": "2020-01-02"},
+    ]
+
+    monkeypatch.setattr(m, "fetch_new_releases", lambda c, label: search_results)
+    monkeypatch.setattr(m, "filter_recent_releases", lambda r, n_days: r)
+    monkeypatch.setattr(
+        m,
+        "fetch_album_tracks",
+        lambda c, album: [_mk_track(album["name"], "A", f"uri:{album['name']}")],
+    )
+
+    def _albums(uris):
+        return {
+            "albums": [
+                dict(r, label="Label") for r in search_results if r["uri"] in uris
+            ]
+        }
+
+    client = _mk_client()
+    client.albums.side_effect = _albums
+
+    first = m.fetch_and_add(client, ["Label"], "plid", n_days=7, store=store)
+    assert list(first["Label"]) == ["Album1", "Album2"]
+
+    client.reset_mock()
+    second = m.fetch_and_add(client, ["Label"], "plid", n_days=7, store=store)
+
+    # Rerun finds only known releases: no albums lookups, nothing added
+    assert second == {}
+    client.albums.assert_not_called()
+    client.playlist_add_items.assert_not_called()
+
+
+def test_fetch_and_add_with_store_skips_known_fingerprints(monkeypatch, tmp_path):
+    from crate_digger.utils.state import open_release_store
+
+    store = open_release_store(tmp_path / "releases.sqlite3")
+    releases = {
+        "Label1": [{"uri": "album:1", "name": "Album1"}],
+        "Label2": [{"uri": "album:2", "name": "Album2"}],
+    }
+    tracks = {
+        "album:1": [_mk_track("Track", "A", "u1"), _mk_track("Other", "B", "u2")],
+        # Same track on a second label, plus one new track
+        "album:2": [_mk_track("Track!", "A", "u3"), _mk_track("New", "C", "u4")],
+    }
+
+    monkeypatch.setattr(
+        m,
+        "fetch_new_relevant_releases_by_label",
+        lambda c, labels, *args, **kwargs: {label: releases[label] for label in labels},
+    )
+    monkeypatch.setattr(m, "fetch_album_tracks", lambda c, album: tracks[album["uri"]])
+    monkeypatch.setattr(m, "record_processed_releases", lambda *args: None)
+
+    client = _mk_client()
+    m.fetch_and_add(client, ["Label1", "Label2"], "plid", store=store)
+    client.playlist_add_items.assert_called_once_with("plid", ["u1", "u2", "u4"])
+
+    # A re-release under a new URI a day later is not added again
+    tracks["album:2"] = [_mk_track("Other", "B", "u5"), _mk_track("Fresh", "D", "u6")]
+    client.reset_mock()
+    m.fetch_and_add(client, ["Label2"], "plid", store=store)
+    client.playlist_add_items.assert_called_once_with("plid", ["u6"])
+
+
+def test_create_playlists_end_to_end():
+    client = _mk_client()
     client.me.return_value = {"id": "user123"}
 
     created_playlists = []
@@ -119,12 +269,13 @@ def test_create_playlists_end_to_end(monkeypatch):
 
     client.user_playlist_create.side_effect = mock_create
 
-    release_dates = {"t1": "2020-01-01", "t2": "2020-01-02", "t3": "2020-01-03"}
-    monkeypatch.setattr(
-        m, "fetch_track_release_date", lambda c, uri: release_dates[uri]
-    )
+    tracks = [
+        {"uri": "t1", "release_date": "2020-01-01"},
+        {"uri": "t2", "release_date": "2020-01-02"},
+        {"uri": "t3", "release_date": "2020-01-03"},
+    ]
 
-    m.create_playlists(client, "My Label", ["t1", "t2", "t3"], step_size=2)
+    m.create_playlists(client, "My Label", tracks, step_size=2)
 
     # Created 2 playlists (2 tracks each, then 1)
     assert len(created_playlists) == 2
@@ -0,0 +1,86 @@
+from unittest.mock import patch
+
+import pytest
+
+from crate_digger.utils.journal import (
+    BackfillJournal,
+    get_journal_path,
+    open_backfill_journal,
+)
+
+
+def test_journal_reloads_latest_records(tmp_path):
+    path = tmp_path / "backfill" / "label.jsonl"
+
+    journal = BackfillJournal(path)
+    journal.record("playlist", "Label 001", uri="pl:1", tracks_added=0)
+    journal.record("playlist", "Label 001", uri="pl:1", tracks_added=50)
+    journal.record("years", "Label", years=[2020, 2021])
+    journal.close()
+
+    reloaded = BackfillJournal(path)
+
+    assert len(reloaded) == 2
+    assert reloaded.get("playlist", "Label 001")["tracks_added"] == 50
+    assert reloaded.get("years", "Label")["years"] == [2020, 2021]
+    assert reloaded.get("playlist", "Label 002") is None
+
+
+def test_journal_ignores_line_cut_short_by_crash(tmp_path):
+    path = tmp_path / "label.jsonl"
+    path.write_text(
+        '{"kind": "albums", "key": "0", "track_uris": ["t1"]}\n{"kind": "albu'
+    )
+
+    journal = BackfillJournal(path)
+    journal.record("albums", "1", track_uris=["t2"])
+    journal.close()
+
+    reloaded = BackfillJournal(path)
+
+    assert reloaded.get("albums", "0")["track_uris"] == ["t1"]
+    assert reloaded.get("albums", "1")["track_uris"] == ["t2"]
+
+
+def test_journal_path_is_per_label(tmp_path):
+    with patch(
+        "crate_digger.utils.journal.get_state_path",
+        side_effect=lambda name: tmp_path / name,
+    ):
+        path = get_journal_path("Dirtybird / Records")
+        journal = open_backfill_journal("Dirtybird / Records")
+        journal.close()
+
+    assert path == tmp_path / "backfill" / "dirtybird_records.jsonl"
+    assert path.exists()
+
+
+def test_journal_rejects_other_run_options(tmp_path):
+    with patch(
+        "crate_digger.utils.journal.get_state_path",
+        side_effect=lambda name: tmp_path / name,
+    ):
+        journal = open_backfill_journal("Label", near_duplicates="collapse")
+        journal.record("years", "Label", years=[2020])
+        journal.close()
+
+        with pytest.raises(ValueError, match="near_duplicates"):
+            open_backfill_journal("Label", near_duplicates=None)
+
+        resumed = open_backfill_journal("Label", near_duplicates="collapse")
+
+    assert resumed.get("years", "Label")["years"] == [2020]
+    resumed.close()
+
+
+def test_journal_archive_moves_it_aside(tmp_path):
+    path = tmp_path / "label.jsonl"
+    journal = BackfillJournal(path)
+    journal.record("years", "Label", years=[2020])
+
+    archived = journal.archive()
+
+    assert archived == tmp_path / "label.done.jsonl"
+    assert not path.exists()
+    assert len(BackfillJournal(path)) == 0
+    assert BackfillJournal(archived).get("years", "Label")["years"] == [2020]
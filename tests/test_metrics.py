@@ -0,0 +1,157 @@
+import json
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from benchmarks.fake_spotify import FakeCatalog, FakeSpotifyServer
+from crate_digger.utils.cache import MemoryResponseCache
+from crate_digger.utils.concurrency import map_concurrently
+from crate_digger.utils.metrics import (
+    InstrumentedSpotify,
+    RunMetrics,
+    get_run_metrics,
+    request_endpoint,
+    write_run_metrics,
+)
+from crate_digger.utils.ratelimit import RateLimiter
+from crate_digger.utils.telegram import send_message
+
+
+@pytest.mark.parametrize(
+    "method, url, expected",
+    [
+        ("GET", "search", "search"),
+        ("GET", "albums/?ids=a,b", "albums"),
+        ("GET", "albums/abc/tracks/", "album_tracks"),
+        ("GET", "tracks/abc", "tracks"),
+        ("GET", "me/", "me"),
+        ("GET", "playlists/abc/items", "playlist_items"),
+        ("POST", "playlists/abc/items", "playlist_items:POST"),
+        ("POST", "users/me/playlists", "user_playlists:POST"),
+    ],
+)
+def test_request_endpoint_names(method, url, expected):
+    assert request_endpoint(method, url) == expected
+
+
+def test_observe_fills_latency_histogram():
+    metrics = RunMetrics()
+    metrics.observe("search", 0.07)
+    metrics.observe("search", 3.0, error=True, retries=2)
+
+    search = metrics.summary()["endpoints"]["search"]
+
+    assert search["calls"] == 2
+    assert search["errors"] == 1
+    assert search["retries"] == 2
+    assert search["latency"]["buckets"]["0.05"] == 0
+    assert search["latency"]["buckets"]["0.1"] == 1
+    assert search["latency"]["buckets"]["5.0"] == 2
+    assert search["latency"]["buckets"]["+Inf"] == 2
+    assert search["latency"]["max"] == 3.0
+
+
+def test_stage_is_inherited_by_worker_threads():
+    metrics = RunMetrics()
+
+    with metrics.stage("find_releases"):
+        map_concurrently(lambda _: metrics.observe("search", 0.01), range(4), 4)
+    metrics.observe("me", 0.01)
+
+    summary = metrics.summary()
+
+    assert summary["stages"]["find_releases"]["calls"] == 4
+    assert summary["stages"]["find_releases"]["seconds"] >= 0
+    assert summary["endpoints"]["me"]["calls"] == 1
+
+
+def _mk_client(server, metrics, cache=None):
+    client = InstrumentedSpotify(
+        auth="token",
+        limiter=RateLimiter(rate=1_000, burst=1_000),
+        cache=cache,
+        metrics=metrics,
+        backoff_factor=0,
+    )
+    client.prefix = server.prefix
+    return client
+
+
+def test_instrumented_client_counts_retries_and_cache_hits():
+    metrics = RunMetrics()
+    catalog = FakeCatalog(["Label A"], albums_per_label=3)
+
+    with FakeSpotifyServer(catalog, throttle_rate=1.0) as server:
+        client = _mk_client(server, metrics, cache=MemoryResponseCache())
+        client.throttle_retries = 2
+
+        with pytest.raises(Exception):
+            client.search("label:Label A tag:new", type="album")
+
+        server.throttle_rate = 0.0
+        client.search("label:Label A tag:new", type="album")
+        client.search("label:Label A tag:new", type="album")
+
+    search = metrics.summary()["endpoints"]["search"]
+
+    assert search["calls"] == 3
+    assert search["errors"] == 1
+    assert search["throttled"] == 3
+    assert search["retries"] == 2
+    assert search["cache_hits"] == 1
+    assert search["bytes_received"] > 0
+
+
+def test_send_message_is_recorded():
+    get_run_metrics().reset()
+
+    with patch("crate_digger.utils.telegram.requests.post", return_value=Mock()):
+        send_message("hello")
+
+    telegram = get_run_metrics().summary()["endpoints"]["telegram:sendMessage"]
+    get_run_metrics().reset()
+
+    assert telegram["calls"] == 1
+    assert telegram["errors"] == 0
+    assert telegram["bytes_sent"] == 5
+
+
+def test_write_run_metrics_stores_json(tmp_path):
+    get_run_metrics().reset()
+    get_run_metrics().observe("search", 0.2)
+
+    with patch(
+        "crate_digger.utils.metrics.get_state_path",
+        side_effect=lambda name: tmp_path / name,
+    ):
+        path = write_run_metrics("daily", {"cache": {"hits": 1}})
+    get_run_metrics().reset()
+
+    summary = json.loads(path.read_text())
+
+    assert path.parent == tmp_path / "metrics"
+    assert summary["run"] == "daily"
+    assert summary["endpoints"]["search"]["calls"] == 1
+    assert summary["cache"] == {"hits": 1}
+
+
+def test_write_run_metrics_keeps_latest_files(tmp_path, monkeypatch):
+    monkeypatch.setattr("crate_digger.utils.metrics.METRICS_MAX_FILES", 2)
+    metrics_dir = tmp_path / "metrics"
+    metrics_dir.mkdir()
+    for stamp in ("20260101T000000Z", "20260102T000000Z"):
+        (metrics_dir / f"daily-{stamp}.json").write_text("{}")
+    (metrics_dir / "backfill-20250101T000000Z.json").write_text("{}")
+
+    with patch(
+        "crate_digger.utils.metrics.get_state_path",
+        side_effect=lambda name: tmp_path / name,
+    ):
+        path = write_run_metrics("daily")
+
+    assert sorted(p.name for p in metrics_dir.iterdir()) == [
+        "backfill-20250101T000000Z.json",
+        "daily-20260102T000000Z.json",
+        path.name,
+    ]
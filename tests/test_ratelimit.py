@@ -0,0 +1,154 @@
+from unittest.mock import patch
+
+import pytest
+
+from spotipy import Spotify, SpotifyException
+
+from crate_digger.utils.ratelimit import (
+    RateLimitedSpotify,
+    RateLimiter,
+    parse_retry_after,
+)
+
+
+class FakeClock:
+    """Manually advanced clock; sleeping moves time forward."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def _mk_limiter(rate=10.0, burst=2):
+    clock = FakeClock()
+    return RateLimiter(rate=rate, burst=burst, clock=clock, sleep=clock.sleep), clock
+
+
+def test_rate_limiter_allows_burst_then_spaces_requests():
+    limiter, _ = _mk_limiter(rate=10.0, burst=2)
+
+    delays = [limiter.reserve() for _ in range(4)]
+
+    assert delays == pytest.approx([0.0, 0.0, 0.1, 0.2])
+
+
+def test_rate_limiter_refills_over_time():
+    limiter, clock = _mk_limiter(rate=10.0, burst=2)
+    limiter.reserve()
+    limiter.reserve()
+
+    clock.now += 1.0
+
+    assert limiter.reserve() == pytest.approx(0.0)
+
+
+def test_rate_limiter_pause_holds_back_every_worker():
+    limiter, clock = _mk_limiter(rate=10.0, burst=2)
+
+    limiter.pause(3.0)
+    delays = [limiter.reserve() for _ in range(3)]
+
+    # Reservations after a pause are spread out again instead of bursting
+    assert delays == pytest.approx([3.0, 3.1, 3.2])
+    stats = limiter.stats()
+    assert stats["throttled_responses"] == 1
+    assert stats["throttled_seconds"] == pytest.approx(3.0)
+    assert stats["requests"] == 3
+
+
+def test_rate_limiter_overlapping_pauses_count_wall_time_once():
+    limiter, clock = _mk_limiter()
+
+    limiter.pause(2.0)
+    clock.now += 1.0
+    limiter.pause(2.0)
+
+    stats = limiter.stats()
+    assert stats["throttled_responses"] == 2
+    assert stats["throttled_seconds"] == pytest.approx(3.0)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after({"Retry-After": "7"}) == 7.0
+    assert parse_retry_after({}) == 1.0
+    assert parse_retry_after(None, default=2.0) == 2.0
+    assert parse_retry_after({"Retry-After": "soon"}) == 1.0
+
+
+def _throttled(retry_after):
+    return SpotifyException(
+        429, -1, "Too Many Requests", headers={"Retry-After": retry_after}
+    )
+
+
+def test_rate_limited_spotify_pauses_and_retries_on_429():
+    limiter, clock = _mk_limiter()
+    client = RateLimitedSpotify(auth="token", limiter=limiter)
+
+    with patch.object(
+        Spotify, "_internal_call", side_effect=[_throttled("2"), {"ok": True}]
+    ) as call:
+        assert client._get("me") == {"ok": True}
+
+    assert call.call_count == 2
+    assert clock.now == pytest.approx(102.0)
+    assert limiter.stats()["throttled_responses"] == 1
+
+
+def test_rate_limited_spotify_does_not_retry_other_errors():
+    limiter, _ = _mk_limiter()
+    client = RateLimitedSpotify(auth="token", limiter=limiter)
+
+    with patch.object(
+        Spotify, "_internal_call", side_effect=SpotifyException(404, -1, "Not Found")
+    ) as call:
+        with pytest.raises(SpotifyException):
+            client._get("albums/x")
+
+    assert call.call_count == 1
+
+
+def test_rate_limited_spotify_reraises_exhausted_server_error_retries():
+    limiter, clock = _mk_limiter()
+    client = RateLimitedSpotify(auth="token", limiter=limiter)
+    # What spotipy raises when urllib3 runs out of 5xx retries
+    max_retries = SpotifyException(
+        429, -1, "https://api.spotify.com/v1/me:\n Max Retries", reason="500"
+    )
+
+    with patch.object(Spotify, "_internal_call", side_effect=max_retries) as call:
+        with pytest.raises(SpotifyException) as exc_info:
+            client._get("me")
+
+    assert exc_info.value is max_retries
+    assert call.call_count == 1
+    assert clock.now == pytest.approx(100.0)
+    assert limiter.stats()["throttled_responses"] == 0
+
+
+def test_rate_limited_spotify_gives_up_on_huge_retry_after():
+    limiter, clock = _mk_limiter()
+    client = RateLimitedSpotify(auth="token", limiter=limiter)
+
+    with patch.object(Spotify, "_internal_call", side_effect=_throttled("86400")):
+        with pytest.raises(SpotifyException):
+            client._get("me")
+
+    assert clock.now == pytest.approx(100.0)
+
+
+def test_rate_limited_spotify_leaves_429_to_the_limiter():
+    client = RateLimitedSpotify(auth="token")
+
+    assert 429 not in client.status_forcelist
+    assert 503 in client.status_forcelist
+
+    retry = client._session.get_adapter("https://api.spotify.com").max_retries
+    assert not retry.respect_retry_after_header
+    assert "POST" not in retry.allowed_methods
+    assert "GET" in retry.allowed_methods
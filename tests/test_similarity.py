@@ -0,0 +1,59 @@
+import random
+
+from crate_digger.utils.similarity import (
+    cluster_near_duplicates,
+    jaccard,
+    minhash_permutations,
+    minhash_signature,
+)
+
+
+def test_identical_sets_have_identical_signatures():
+    permutations = minhash_permutations(16)
+
+    assert minhash_signature({"a", "b"}, permutations) == minhash_signature(
+        {"b", "a"}, permutations
+    )
+    assert minhash_signature({"a", "b"}, permutations) != minhash_signature(
+        {"c", "d"}, permutations
+    )
+
+
+def test_jaccard():
+    assert jaccard({"a", "b"}, {"b", "c"}) == 1 / 3
+    assert jaccard(set(), set()) == 0.0
+
+
+def test_cluster_near_duplicates_is_transitive_and_ordered():
+    token_sets = [
+        {"song", "a"},
+        {"other", "a"},
+        {"song", "a", "b"},
+        set(),
+        {"song", "a", "b", "vip"},
+        {"other", "a"},
+    ]
+
+    assert cluster_near_duplicates(token_sets) == [[0, 2, 4], [1, 5]]
+
+
+def test_cluster_near_duplicates_only_compares_within_blocks():
+    token_sets = [{"song"}, {"song"}, {"song"}]
+    blocks = [["a", "b"], ["c"], ["b"]]
+
+    assert cluster_near_duplicates(token_sets, blocks) == [[0, 2]]
+
+
+def test_cluster_near_duplicates_scales_to_large_catalogs():
+    rng = random.Random(0)
+    words = [f"w{i}" for i in range(5_000)]
+    token_sets = [set(rng.sample(words, 2)) for _ in range(20_000)]
+    token_sets.append(set(token_sets[123]))
+    # A few prolific artists make large buckets
+    blocks = [[f"artist{i % 5}"] for i in range(len(token_sets))]
+    blocks[-1] = blocks[123]
+
+    clusters = cluster_near_duplicates(token_sets, blocks)
+
+    assert [123, 20_000] in clusters
+    assert all(len(cluster) == 2 for cluster in clusters)
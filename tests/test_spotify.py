@@ -1,8 +1,7 @@
-import pandas as pd
+import pytest
 
 from unittest.mock import MagicMock
 
-from types import SimpleNamespace
 from typing import List, cast
 
 import crate_digger.utils.spotify as m
@@ -30,12 +29,45 @@ def _mk_track(name, artists, uri, album_name="Album"):
     }
 
 
-def test_filter_past_week_releases_filters_correctly(monkeypatch):
-    FakeDate._today = SimpleNamespace(
-        isoformat=lambda: "2026-01-21"
-    )  # minimal stub for .isoformat()
-    # We need .today() returning something with isoformat(); timedelta(days=1) will be applied to it in your code
-    # so we patch the module's date with a *real* date-like object instead:
+def test_fetch_new_releases_pages_until_last_page(caplog):
+    client = MagicMock()
+    client.search.return_value = {
+        "albums": {"items": [{"uri": "a"}], "next": "page2", "total": 3}
+    }
+    client.next.side_effect = [
+        {"albums": {"items": [{"uri": "b"}], "next": "page3", "total": 3}},
+        {"albums": {"items": [{"uri": "c"}], "next": None, "total": 3}},
+    ]
+
+    with caplog.at_level("WARNING"):
+        out = m.fetch_new_releases(client, "L")
+
+    assert [r["uri"] for r in out] == ["a", "b", "c"]
+    client.search.assert_called_once_with(
+        "label:L tag:new", limit=m.SEARCH_LIMIT, type="album"
+    )
+    assert "stopped at" not in caplog.text
+
+
+def test_fetch_new_releases_warns_at_max_offset(monkeypatch, caplog):
+    monkeypatch.setattr(m, "MAX_OFFSET", 2)
+    client = MagicMock()
+    client.search.return_value = {
+        "albums": {"items": [{"uri": "a"}], "next": "page2", "total": 5}
+    }
+    client.next.return_value = {
+        "albums": {"items": [{"uri": "b"}], "next": "page3", "total": 5}
+    }
+
+    with caplog.at_level("WARNING"):
+        out = m.fetch_new_releases(client, "L")
+
+    assert [r["uri"] for r in out] == ["a", "b"]
+    assert client.next.call_count == 1
+    assert "New release search for L stopped at 2 of 5 releases" in caplog.text
+
+
+def test_filter_recent_releases_keeps_window_excluding_today(monkeypatch):
     import datetime as _dt
 
     class _RealFakeDate(_dt.date):
@@ -48,23 +80,20 @@ def test_filter_past_week_releases_filters_correctly(monkeypatch):
     releases = cast(
         List[SpotifyAlbum],
         [
-            {
-                "release_date": "2026-01-20",
-                "uri": "a",
-            },
-            {
-                "release_date": "2026-01-13",
-                "uri": "b",
-            },
-            {
-                "release_date": "2026-01-14",
-                "uri": "c",
-            },
+            {"release_date": "2026-01-21", "uri": "today"},
+            {"release_date": "2026-01-20", "uri": "yesterday"},
+            {"release_date": "2026-01-14", "uri": "week-ago"},
+            {"release_date": "2026-01-13", "uri": "too-old"},
         ],
     )
 
-    out = m.filter_releases_by_date(releases, n_days=1)
-    assert [r["uri"] for r in out] == ["a"]
+    assert [r["uri"] for r in m.filter_recent_releases(releases, n_days=1)] == [
+        "yesterday"
+    ]
+    assert [r["uri"] for r in m.filter_recent_releases(releases, n_days=7)] == [
+        "yesterday",
+        "week-ago",
+    ]
 
 
 def test_remove_extended_versions_prefers_original_when_present():
@@ -105,11 +134,36 @@ def test_remove_extended_versions_handles_unicode():
     assert [t["uri"] for t in out] == ["u1"]
 
 
+def test_resolve_versions_prefers_original_then_radio_edit_per_artist_set():
+    tracks = [
+        _mk_track("Song (Extended Mix)", ["A", "B"], "ext"),
+        _mk_track("Song (Radio Edit)", ["B", "A"], "radio"),
+        _mk_track("Song (Extended Mix)", ["C"], "other-artist"),
+        _mk_track("Tune - Extended", ["A"], "tune-ext"),
+        _mk_track("Tune (Original Mix)", ["A"], "tune"),
+    ]
+
+    out = m.resolve_versions(tracks)
+
+    assert [t["uri"] for t in out] == ["radio", "other-artist", "tune"]
+
+
+def test_resolve_versions_uses_configured_preference():
+    tracks = [
+        _mk_track("Song", ["A"], "orig"),
+        _mk_track("Song (Extended Mix)", ["A"], "ext"),
+    ]
+
+    out = m.resolve_versions(tracks, preference=("extended", "original"))
+
+    assert [t["uri"] for t in out] == ["ext"]
+
+
 def test_remove_extended_versions_empty_list():
     assert m.remove_extended_versions([]) == []
 
 
-def test_parse_releases_drops_columns_dedupes_and_sorts():
+def test_parse_releases_dedupes_and_sorts():
     releases = [
         {
             "uri": "u2",
@@ -141,16 +195,16 @@ def test_parse_releases_drops_columns_dedupes_and_sorts():
         },
     ]
 
-    df = m.parse_releases(cast(List[SpotifyAlbum], releases))
+    parsed = m.parse_releases(iter(cast(List[SpotifyAlbum], releases)))
 
-    assert list(df["uri"]) == ["u1", "u2"]  # dedup + sorted by release_date
-    assert "artists" not in df.columns
-    assert "images" not in df.columns
-    assert "available_markets" not in df.columns
-    assert "external_urls" not in df.columns
+    # first occurrence wins, sorted by release_date, nested lists dropped
+    assert parsed == [
+        {"uri": "u1", "name": "A", "release_date": "2020-01-01"},
+        {"uri": "u2", "name": "B", "release_date": "2020-01-03"},
+    ]
 
 
-def test_filter_exact_label_releases_batches_and_filters():
+def test_filter_exact_label_releases_by_label_batches_and_filters():
     client = MagicMock()
 
     releases = cast(
@@ -191,7 +245,7 @@ def test_filter_exact_label_releases_batches_and_filters():
         },
     ]
 
-    out = m.filter_exact_label_releases(client, releases, "Good")
+    out = m.filter_exact_label_releases_by_label(client, {"Good": releases})["Good"]
     assert all(a["label"] == "Good" for a in out)
     assert len(out) == 20 + 3  # 20 from first + (20,22,24) from second
 
@@ -202,6 +256,119 @@ def test_filter_exact_label_releases_batches_and_filters():
     assert len(second_call_uris) == 5
 
 
+def test_filter_exact_label_releases_by_label_shares_batches():
+    client = MagicMock()
+
+    releases_by_label = {
+        label: cast(
+            List[SpotifyAlbum],
+            [{"uri": f"uri:{label}:{i}"} for i in range(n_candidates)],
+        )
+        for label, n_candidates in [("A", 3), ("B", 15), ("C", 5)]
+    }
+
+    def _albums(uris):
+        # Last candidate of every label is an approximate search match
+        return {
+            "albums": [
+                {
+                    "uri": uri,
+                    "label": "Other" if uri.endswith(":2") else uri.split(":")[1],
+                }
+                for uri in uris
+            ]
+        }
+
+    client.albums.side_effect = _albums
+
+    out = m.filter_exact_label_releases_by_label(client, releases_by_label)
+
+    # 23 candidates fill one full batch and one partial instead of three partials
+    assert [len(c.args[0]) for c in client.albums.call_args_list] == [20, 3]
+    assert list(out) == ["A", "B", "C"]
+    assert [a["uri"] for a in out["A"]] == ["uri:A:0", "uri:A:1"]
+    assert len(out["B"]) == 14
+    assert all(a["label"] == "C" for a in out["C"])
+
+
+def test_fetch_new_relevant_releases_by_label_skips_rejected_candidates(
+    monkeypatch, tmp_path
+):
+    from crate_digger.utils.state import open_release_store
+
+    store = open_release_store(tmp_path / "releases.sqlite3")
+    candidates = [
+        {"uri": uri, "name": uri, "release_date": "2020-01-01"}
+        for uri in ["good", "lookalike"]
+    ]
+    monkeypatch.setattr(m, "fetch_new_releases", lambda client, label: candidates)
+    monkeypatch.setattr(m, "filter_recent_releases", lambda releases, n_days: releases)
+
+    client = MagicMock()
+    client.albums.side_effect = lambda uris: {
+        "albums": [
+            {**c, "label": "Label" if c["uri"] == "good" else "Label Records"}
+            for c in candidates
+            if c["uri"] in uris
+        ]
+    }
+
+    out = m.fetch_new_relevant_releases_by_label(client, ["Label"], store=store)
+    assert [r["uri"] for r in out["Label"]] == ["good"]
+
+    # The verified release is recorded once it is processed; the rejected
+    # candidate already is, so a rerun verifies only the verified one again
+    m.fetch_new_relevant_releases_by_label(client, ["Label"], store=store)
+    assert [c.args[0] for c in client.albums.call_args_list] == [
+        ["good", "lookalike"],
+        ["good"],
+    ]
+    assert store.execute(
+        "SELECT album_uri, verified FROM processed_releases"
+    ).fetchall() == [("lookalike", 0)]
+
+
+def test_fetch_album_tracks_reuses_embedded_tracks():
+    client = MagicMock()
+    album = {
+        "uri": "album:1",
+        "name": "Album",
+        "tracks": {"items": [{"uri": "t1"}, {"uri": "t2"}], "next": None},
+    }
+
+    out = m.fetch_album_tracks(client, album)
+
+    assert [t["uri"] for t in out] == ["t1", "t2"]
+    client.album_tracks.assert_not_called()
+    client.next.assert_not_called()
+
+
+def test_fetch_album_tracks_follows_next_pages_only():
+    client = MagicMock()
+    album = {
+        "uri": "album:1",
+        "name": "Compilation",
+        "tracks": {"items": [{"uri": "t1"}], "next": "page2"},
+    }
+    client.next.return_value = {"items": [{"uri": "t2"}], "next": None}
+
+    out = m.fetch_album_tracks(client, album)
+
+    assert [t["uri"] for t in out] == ["t1", "t2"]
+    client.album_tracks.assert_not_called()
+    client.next.assert_called_once_with(album["tracks"])
+
+
+def test_fetch_album_tracks_falls_back_to_album_tracks():
+    client = MagicMock()
+    client.album_tracks.return_value = {"items": [{"uri": "t1"}], "next": None}
+
+    out = m.fetch_album_tracks(client, {"uri": "album:1", "name": "Single"})
+
+    assert [t["uri"] for t in out] == ["t1"]
+    client.album_tracks.assert_called_once_with("album:1")
+
+
 def test_extract_track_uris_extracts_uri():
     tracks = [
         _mk_track("Track 1", ["Artist"], "u1"),
@@ -212,6 +379,7 @@ def test_extract_track_uris_extracts_uri():
 
 def test_add_to_playlist_calls_playlist_add_items():
     client = MagicMock()
+    client.playlist_items.return_value = {"items": [], "next": None}
     client.playlist_add_items.return_value = "snapshot123"
 
     snap = m.add_to_playlist(client, "playlist_id", ["u1", "u2"])
@@ -219,6 +387,107 @@ def test_add_to_playlist_calls_playlist_add_items():
     client.playlist_add_items.assert_called_once_with("playlist_id", ["u1", "u2"])
 
 
+def test_add_to_playlist_writes_in_chunks_of_100():
+    client = MagicMock()
+    client.playlist_items.return_value = {"items": [], "next": None}
+
+    m.add_to_playlist(client, "playlist_id", [f"u{i}" for i in range(250)])
+
+    chunks = [c.args[1] for c in client.playlist_add_items.call_args_list]
+    assert [len(c) for c in chunks] == [100, 100, 50]
+    assert chunks[2][-1] == "u249"
+
+
+def test_add_to_playlist_skips_tracks_already_in_playlist():
+    client = MagicMock()
+    client.playlist_items.return_value = {
+        "items": [{"track": {"uri": "u1"}}, {"track": None}],
+        "next": "page2",
+    }
+    client.next.return_value = {"items": [{"track": {"uri": "u3"}}], "next": None}
+
+    m.add_to_playlist(client, "playlist_id", ["u1", "u2", "u3", "u2"])
+
+    assert client.playlist_items.call_args.kwargs["fields"] == "items(track(uri)),next"
+    client.playlist_add_items.assert_called_once_with("playlist_id", ["u2"])
+
+
+def test_add_to_playlist_nothing_new_makes_no_write():
+    client = MagicMock()
+    client.playlist_items.return_value = {
+        "items": [{"track": {"uri": "u1"}}],
+        "next": None,
+    }
+
+    assert m.add_to_playlist(client, "playlist_id", ["u1"]) is None
+    client.playlist_add_items.assert_not_called()
+
+
+def test_add_to_playlist_without_tracks_skips_playlist_read():
+    client = MagicMock()
+
+    assert m.add_to_playlist(client, "playlist_id", []) is None
+    client.playlist_items.assert_not_called()
+    client.playlist_add_items.assert_not_called()
+
+
+def test_add_to_playlist_retries_failed_chunk(monkeypatch):
+    monkeypatch.setattr(m.time, "sleep", lambda s: None)
+    client = MagicMock()
+    client.playlist_items.return_value = {"items": [], "next": None}
+    client.playlist_add_items.side_effect = [
+        m.SpotifyException(502, -1, "Bad Gateway"),
+        "snapshot123",
+    ]
+
+    snap = m.add_to_playlist(client, "playlist_id", ["u1"], skip_existing=False)
+
+    assert snap == "snapshot123"
+    assert client.playlist_add_items.call_count == 2
+    client.playlist_items.assert_called_once()
+
+
+def test_add_to_playlist_retry_sends_only_missing_tracks(monkeypatch):
+    monkeypatch.setattr(m.time, "sleep", lambda s: None)
+    client = MagicMock()
+    # The failed POST was applied for u1 before the connection dropped
+    client.playlist_items.return_value = {
+        "items": [{"track": {"uri": "u1"}}],
+        "next": None,
+    }
+    client.playlist_add_items.side_effect = [
+        m.requests.ConnectionError("reset"),
+        "snapshot123",
+    ]
+
+    snap = m.add_to_playlist(client, "playlist_id", ["u1", "u2"], skip_existing=False)
+
+    assert snap == "snapshot123"
+    assert client.playlist_add_items.call_args_list[1].args == ("playlist_id", ["u2"])
+
+
+def test_add_to_playlist_does_not_retry_rate_limited_writes(monkeypatch):
+    monkeypatch.setattr(m.time, "sleep", lambda s: None)
+    client = MagicMock()
+    client.playlist_add_items.side_effect = m.SpotifyException(429, -1, "Too many")
+
+    with pytest.raises(m.SpotifyException):
+        m.add_to_playlist(client, "playlist_id", ["u1"], skip_existing=False)
+
+    assert client.playlist_add_items.call_count == 1
+
+
+def test_add_to_playlist_does_not_retry_client_errors(monkeypatch):
+    monkeypatch.setattr(m.time, "sleep", lambda s: None)
+    client = MagicMock()
+    client.playlist_add_items.side_effect = m.SpotifyException(403, -1, "Forbidden")
+
+    with pytest.raises(m.SpotifyException):
+        m.add_to_playlist(client, "playlist_id", ["u1"], skip_existing=False)
+
+    assert client.playlist_add_items.call_count == 1
+
+
 def test_fetch_all_releases_paginates_within_year(monkeypatch):
     # limit loop to year=1990 only
     import datetime as _dt
@@ -234,7 +503,7 @@ def test_fetch_all_releases_paginates_within_year(monkeypatch):
 
     # First page returns 2 items, second page returns empty -> stop
     client.search.side_effect = [
-        {"albums": {"items": [{"uri": "a"}, {"uri": "b"}]}},
+        {"albums": {"items": [_search_album("a"), _search_album("b")]}},
         {"albums": {"items": []}},
     ]
 
@@ -251,37 +520,251 @@ def test_fetch_all_releases_paginates_within_year(monkeypatch):
     assert "year:1990" in q0
 
 
+def _search_album(uri):
+    return {"uri": uri, "name": uri, "release_date": "2020-01-01", "images": []}
+
+
+def _mk_search(catalog):
+    """Fake `client.search` over {query: [uris]} that reports totals."""
+
+    def search(q, type, offset, limit):
+        label_query, _, years = q.partition(" year:")
+        first, _, last = years.partition("-")
+        if last:
+            uris = [
+                u
+                for year in range(int(first), int(last) + 1)
+                for u in catalog.get(f"{label_query} year:{year}", [])
+            ]
+        else:
+            uris = catalog.get(q, [])
+        return {
+            "albums": {
+                "items": [_search_album(u) for u in uris[offset : offset + limit]],
+                "total": len(uris),
+            }
+        }
+
+    return search
+
+
+def test_search_shards_fetches_known_pages_concurrently_in_order():
+    catalog = {
+        "q1": [f"a{i}" for i in range(23)],
+        "q2": [],
+        "q3": [f"c{i}" for i in range(5)],
+    }
+    client = MagicMock()
+    client.search.side_effect = _mk_search(catalog)
+
+    out = m.search_shards(client, ["q1", "q2", "q3"], max_workers=4, page_size=10)
+
+    assert [[r["uri"] for r in shard["releases"]] for shard in out] == [
+        catalog["q1"],
+        [],
+        catalog["q3"],
+    ]
+    # 3 first pages + 2 more pages of q1, no trailing empty pages
+    assert client.search.call_count == 5
+
+
+def test_search_shards_caps_page_size_and_offset(monkeypatch):
+    monkeypatch.setattr(m, "MAX_OFFSET", 150)
+    catalog = {"q": [f"a{i}" for i in range(400)]}
+    client = MagicMock()
+    client.search.side_effect = _mk_search(catalog)
+
+    (out,) = m.search_shards(client, ["q"], page_size=500)
+
+    assert len(out["releases"]) == 150
+    assert out["saturated"]
+    assert {c.kwargs["limit"] for c in client.search.call_args_list} == {
+        m.SEARCH_MAX_LIMIT
+    }
+
+
+def test_fetch_all_releases_shards_years_concurrently(monkeypatch):
+    FakeDate._today = m.date(1992, 6, 1)
+    monkeypatch.setattr(m, "date", FakeDate)
+    client = MagicMock()
+    client.search.side_effect = _mk_search(
+        {
+            "label:X year:1990": ["a", "b", "c"],
+            "label:X year:1992": ["d"],
+        }
+    )
+
+    out = m.fetch_all_releases(client, "X", max_workers=3, page_size=2)
+
+    assert [r["uri"] for r in out] == ["a", "b", "c", "d"]
+
+
+def test_find_release_years_skips_empty_ranges(monkeypatch):
+    monkeypatch.setattr(m, "BACKFILL_RANGE_YEARS", 10)
+    client = MagicMock()
+    client.search.side_effect = _mk_search({"label:X year:2012": ["a"]})
+
+    years = m.find_release_years(client, "X", 1990, 2021, max_workers=2)
+
+    assert years == list(range(2010, 2020))
+    probed = {c.args[0] for c in client.search.call_args_list}
+    assert probed == {
+        "label:X year:1990-1999",
+        "label:X year:2000-2009",
+        "label:X year:2010-2019",
+        "label:X year:2020-2021",
+    }
+
+
+def test_find_release_years_does_not_probe_single_years():
+    client = MagicMock()
+
+    assert m.find_release_years(client, "X", 2021, 2021) == [2021]
+    client.search.assert_not_called()
+
+
+def test_fetch_all_releases_with_probing_matches_year_by_year(monkeypatch):
+    FakeDate._today = m.date(2025, 6, 1)
+    monkeypatch.setattr(m, "date", FakeDate)
+    catalog = {
+        "label:X year:2003": ["a", "b", "c"],
+        "label:X year:2019": ["d"],
+        "label:X year:2024": ["e", "f"],
+    }
+
+    client = MagicMock()
+    client.search.side_effect = _mk_search(catalog)
+    out = m.fetch_all_releases(client, "X", page_size=2)
+
+    assert [r["uri"] for r in out] == ["a", "b", "c", "d", "e", "f"]
+    # 4 range probes + 26 years of the 3 non-empty ranges + 1 second page
+    assert client.search.call_count == 4 + 26 + 1
+
+
+def test_search_partitions_refines_saturated_shards(monkeypatch):
+    monkeypatch.setattr(m, "MAX_OFFSET", 20)
+    monkeypatch.setattr(m, "PARTITION_TAGS", ("tag:new",))
+    monkeypatch.setattr(m, "PARTITION_TERMS", ("a", "b"))
+    monkeypatch.setattr(m, "PARTITION_MAX_DEPTH", 1)
+    year = [f"r{i}" for i in range(30)]
+    client = MagicMock()
+    client.search.side_effect = _mk_search(
+        {
+            "q": year,
+            "small": ["s"],
+            "q tag:new": year[25:],
+            "q a": year[:15],
+            "q b": year[10:25],
+        }
+    )
+
+    big, small = m.search_partitions(client, ["q", "small"], page_size=10)
+
+    assert [r["uri"] for r in big["releases"]] == year[:20] + year[25:] + year[20:25]
+    # the refinements found all 30 reported releases
+    assert not big["saturated"] and big["n_refinements"] == 3
+    assert small["releases"] == [
+        {"uri": "s", "name": "s", "release_date": "2020-01-01"}
+    ]
+    assert not small["saturated"]
+
+
+def test_search_partitions_stops_at_max_depth(monkeypatch):
+    monkeypatch.setattr(m, "MAX_OFFSET", 20)
+    monkeypatch.setattr(m, "PARTITION_TERMS", ("a",))
+    monkeypatch.setattr(m, "PARTITION_TAGS", ("tag:new",))
+    monkeypatch.setattr(m, "PARTITION_MAX_DEPTH", 1)
+    client = MagicMock()
+    client.search.side_effect = lambda q, **kwargs: {
+        "albums": {
+            "items": [_search_album(f"{q}-{kwargs['offset']}")] * 10,
+            "total": 100,
+        }
+    }
+
+    (shard,) = m.search_partitions(client, ["q"], page_size=10)
+
+    assert shard["n_refinements"] == 2
+    assert shard["saturated"]
+    queries = [c.args[0] for c in client.search.call_args_list]
+    assert sorted(set(queries)) == ["q", "q a", "q tag:new"]
+
+
+def test_refine_query_moves_on_to_the_next_dimension(monkeypatch):
+    monkeypatch.setattr(m, "PARTITION_TAGS", ("tag:new", "tag:hipster"))
+    monkeypatch.setattr(m, "PARTITION_TERMS", ("a", "b"))
+
+    assert m.refine_query("label:X year:2020") == [
+        "label:X year:2020 tag:new",
+        "label:X year:2020 tag:hipster",
+        "label:X year:2020 a",
+        "label:X year:2020 b",
+    ]
+    assert m.refine_query("label:X year:2020 tag:new") == [
+        "label:X year:2020 tag:new a",
+        "label:X year:2020 tag:new b",
+    ]
+    assert m.refine_query("label:X year:2020 a") == []
+
+
+def test_log_search_coverage_reports_saturated_shards(caplog):
+    shards = [
+        {
+            "query": "label:X year:2015",
+            "total": 1500,
+            "releases": [{"uri": str(i)} for i in range(1200)],
+            "saturated": True,
+            "n_refinements": 38,
+        },
+        {
+            "query": "label:X year:2016",
+            "total": 300,
+            "releases": [{"uri": str(i)} for i in range(300)],
+            "saturated": False,
+            "n_refinements": 0,
+        },
+    ]
+
+    with caplog.at_level("INFO"):
+        m.log_search_coverage(shards)
+
+    assert "found 1200 of 1500 releases after 38 refined queries" in caplog.text
+    assert "1500 of 1800 reported releases (83%), 1 saturated shard" in caplog.text
+
+
 def test_collect_tracks_from_albums_filters_extended():
     client = MagicMock()
 
-    # album_uris is a pd.Series in your function
-    album_uris = pd.Series([f"uri:{i}" for i in range(3)])
+    album_uris = [f"uri:{i}" for i in range(3)]
 
     client.albums.return_value = {
         "albums": [
             {
                 "label": "Good",
+                "release_date": "2020-01-01",
                 "tracks": {
                     "items": [
-                        {"name": "Song", "uri": "t1"},
-                        {"name": "Song (Extended Mix)", "uri": "t2"},
+                        {"name": "Song", "uri": "t1", "artists": []},
+                        {"name": "Song (Extended Mix)", "uri": "t2", "artists": []},
                     ]
                 },
             },
             {
                 "label": "Bad",
+                "release_date": "2020-01-02",
                 "tracks": {
                     "items": [
-                        {"name": "Nope", "uri": "x"},
+                        {"name": "Nope", "uri": "x", "artists": []},
                     ]
                 },
             },
             {
                 "label": "Good",
+                "release_date": "2020-01-03",
                 "tracks": {
                     "items": [
-                        {"name": "Banger - Extended", "uri": "t3"},
-                        {"name": "Banger", "uri": "t4"},
+                        {"name": "Banger - Extended", "uri": "t3", "artists": []},
+                        {"name": "Banger", "uri": "t4", "artists": []},
                     ]
                 },
             },
@@ -289,17 +772,142 @@ def test_collect_tracks_from_albums_filters_extended():
     }
 
     out = m.collect_tracks_from_albums(client, album_uris, label="Good")
-    assert out == ["t1", "t4"]  # only from label=Good and non-extended
+    # only from label=Good and non-extended, with their album's release date
+    assert out == [
+        {"uri": "t1", "release_date": "2020-01-01", "name": "Song", "artists": []},
+        {"uri": "t4", "release_date": "2020-01-03", "name": "Banger", "artists": []},
+    ]
+
 
+def test_collect_tracks_by_label_shares_album_batches(tmp_path, monkeypatch):
+    from crate_digger.utils.journal import BackfillJournal
 
-def test_fetch_track_release_date_reads_track_album_release_date():
+    monkeypatch.setattr(m, "FETCH_BATCH_SIZE", 3)
+    labels = {"a1": "A", "a2": "A", "a3": "A", "b1": "B", "b2": "Other"}
     client = MagicMock()
-    client.track.return_value = {"album": {"release_date": "2021-02-03"}}
-    assert m.fetch_track_release_date(client, "track:1") == "2021-02-03"
-    client.track.assert_called_once_with("track:1")
+    client.albums.side_effect = lambda uris: {
+        "albums": [
+            {
+                "label": labels[uri],
+                "release_date": "2020-01-01",
+                "tracks": {
+                    "items": [{"name": "Song", "uri": f"t-{uri}", "artists": []}]
+                },
+            }
+            for uri in uris
+        ]
+    }
+
+    journal = BackfillJournal(tmp_path / "a.jsonl")
+    journal.record(
+        "album",
+        "a1",
+        tracks=[{"uri": "t-a1", "release_date": "2019-01-01"}],
+        n_dropped=0,
+    )
+
+    out = m.collect_tracks_by_label(
+        client, {"A": ["a1", "a2", "a3"], "B": ["b1", "b2"]}, {"A": journal}
+    )
+
+    # a1 is journaled; the rest share full batches across labels
+    assert [c.args[0] for c in client.albums.call_args_list] == [
+        ["a2", "a3", "b1"],
+        ["b2"],
+    ]
+    assert [t["uri"] for t in out["A"]] == ["t-a1", "t-a2", "t-a3"]
+    assert out["A"][0]["release_date"] == "2019-01-01"
+    assert [t["uri"] for t in out["B"]] == ["t-b1"]
+    assert journal.get("album", "a3")["tracks"] == [
+        {"uri": "t-a3", "release_date": "2020-01-01", "name": "Song", "artists": []}
+    ]
+
 
+def test_collect_tracks_by_label_concurrent_batches_keep_order(monkeypatch):
+    import time
+
+    monkeypatch.setattr(m, "FETCH_BATCH_SIZE", 2)
+    album_uris = [f"a{i}" for i in range(9)]
+
+    def _albums(uris):
+        # earlier batches answer last
+        time.sleep(0.002 * (10 - int(uris[0][1:])))
+        return {
+            "albums": [
+                {
+                    "label": "L",
+                    "release_date": f"2020-01-0{uri[1:]}",
+                    "tracks": {
+                        "items": [{"name": "Song", "uri": f"t-{uri}", "artists": []}]
+                    },
+                }
+                for uri in uris
+            ]
+        }
 
-def test_create_playlists_creates_multiple_and_adds_tracks(monkeypatch):
+    client = MagicMock()
+    client.albums.side_effect = _albums
+
+    sequential = m.collect_tracks_by_label(client, {"L": album_uris})
+    concurrent = m.collect_tracks_by_label(client, {"L": album_uris}, max_workers=4)
+
+    assert concurrent == sequential
+    assert [t["uri"] for t in concurrent["L"]] == [f"t-{u}" for u in album_uris]
+
+
+def test_collect_tracks_by_label_pages_only_kept_albums():
+    def _album(uri, label):
+        return {
+            "uri": uri,
+            "label": label,
+            "release_date": "2020-01-01",
+            "tracks": {
+                "items": [{"name": f"Song {uri}", "uri": f"t-{uri}", "artists": []}],
+                "next": "more",
+                "total": 2,
+            },
+        }
+
+    client = MagicMock()
+    client.albums.return_value = {
+        "albums": [_album("a1", "L"), _album("a2", "Other"), None]
+    }
+    client.album_tracks.return_value = {
+        "items": [{"name": "Song b", "uri": "t-b", "artists": []}]
+    }
+
+    out = m.collect_tracks_by_label(client, {"L": ["a1", "a2", "a3"]})
+
+    # the other label's album and the missing one cost no track page request
+    client.album_tracks.assert_called_once_with(
+        "a1", limit=m.ALBUM_TRACKS_LIMIT, offset=1
+    )
+    assert [t["uri"] for t in out["L"]] == ["t-a1", "t-b"]
+
+
+def test_fetch_remaining_album_tracks_follows_cursor_without_total():
+    client = MagicMock()
+    client.next.side_effect = [
+        {"items": [{"uri": "t2"}], "next": "page3"},
+        {"items": [{"uri": "t3"}], "next": None},
+    ]
+    albums = [
+        {"uri": "a1", "tracks": {"items": [{"uri": "t1"}], "next": "page2"}},
+        {"uri": "a2", "tracks": {"items": [{"uri": "u1"}], "next": None}},
+    ]
+
+    m.fetch_remaining_album_tracks(client, albums, max_workers=4)
+
+    assert [t["uri"] for t in albums[0]["tracks"]["items"]] == ["t1", "t2", "t3"]
+    assert [t["uri"] for t in albums[1]["tracks"]["items"]] == ["u1"]
+    client.album_tracks.assert_not_called()
+
+
+def _released(*uris):
+    return [{"uri": u, "release_date": f"2020-01-0{u[1:]}"} for u in uris]
+
+
+def test_create_playlists_creates_multiple_and_adds_tracks():
     client = MagicMock()
     client.me.return_value = {"id": "user1"}
 
@@ -313,19 +921,7 @@ def test_create_playlists_creates_multiple_and_adds_tracks(monkeypatch):
 
     client.user_playlist_create.side_effect = _create
 
-    # avoid calling API for release dates
-    release_dates = {
-        "t1": "2020-01-01",
-        "t2": "2020-01-02",
-        "t3": "2020-01-03",
-        "t4": "2020-01-04",
-        "t5": "2020-01-05",
-    }
-    monkeypatch.setattr(
-        m, "fetch_track_release_date", lambda c, uri: release_dates[uri]
-    )
-
-    tracks = ["t1", "t2", "t3", "t4", "t5"]
+    tracks = _released("t1", "t2", "t3", "t4", "t5")
     m.create_playlists(client, "My Playlist", tracks, step_size=2)
 
     # 5 tracks with step 2 => 3 playlists: (2,2,1)
@@ -338,6 +934,10 @@ def test_create_playlists_creates_multiple_and_adds_tracks(monkeypatch):
     assert created[1]["description"] == "2020-01-03 - 2020-01-04"
     assert created[2]["description"] == "2020-01-05 - 2020-01-05"
 
+    # release dates come with the tracks and the user is looked up once
+    client.track.assert_not_called()
+    client.me.assert_called_once()
+
     # playlist_add_items called per playlist
     assert client.playlist_add_items.call_count == 3
     assert client.playlist_add_items.call_args_list[0].args == ("pl:1", ["t1", "t2"])
@@ -345,54 +945,203 @@ def test_create_playlists_creates_multiple_and_adds_tracks(monkeypatch):
     assert client.playlist_add_items.call_args_list[2].args == ("pl:3", ["t5"])
 
 
-def test_fetch_new_relevant_releases_pipeline_calls_substeps(monkeypatch):
+def test_create_playlists_resumes_from_journal(tmp_path):
+    from crate_digger.utils.journal import BackfillJournal
+
     client = MagicMock()
+    client.me.return_value = {"id": "user1"}
+    client.user_playlist_create.return_value = {
+        "external_urls": {"spotify": "http://x"},
+        "uri": "pl:3",
+    }
+    client.playlist_items.return_value = {"items": [], "next": None}
+
+    journal = BackfillJournal(tmp_path / "label.jsonl")
+    journal.record("playlist", "My Playlist 001", uri="pl:1", tracks_added=2)
+    journal.record("playlist", "My Playlist 002", uri="pl:2", tracks_added=0)
+
+    m.create_playlists(
+        client,
+        "My Playlist",
+        _released("t1", "t2", "t3", "t4", "t5"),
+        2,
+        journal=journal,
+    )
 
-    mock_fetch = MagicMock(
-        return_value=[
-            {"uri": "a", "name": "Album", "label": "L", "release_date": "2020-01-01"}
-        ]
+    # 001 is complete, 002 is topped up, only 003 is created
+    assert client.user_playlist_create.call_count == 1
+    assert [c.args for c in client.playlist_add_items.call_args_list] == [
+        ("pl:2", ["t3", "t4"]),
+        ("pl:3", ["t5"]),
+    ]
+    assert journal.get("playlist", "My Playlist 002")["tracks_added"] == 2
+    assert journal.get("playlist", "My Playlist 003") == {
+        "kind": "playlist",
+        "key": "My Playlist 003",
+        "uri": "pl:3",
+        "tracks_added": 1,
+    }
+
+
+def test_fetch_all_releases_skips_journaled_years(tmp_path, monkeypatch):
+    from crate_digger.utils.journal import BackfillJournal
+
+    catalog = {
+        "label:L year:2020": ["a", "b"],
+        "label:L year:2021": ["c"],
+    }
+
+    def search(q, type, offset, limit):
+        uris = catalog.get(q, [])[offset : offset + limit]
+        return {
+            "albums": {
+                "items": [
+                    {"uri": u, "name": u, "release_date": "2020", "images": []}
+                    for u in uris
+                ],
+                "total": len(catalog.get(q, [])),
+            }
+        }
+
+    client = MagicMock()
+    client.search.side_effect = search
+
+    journal = BackfillJournal(tmp_path / "label.jsonl")
+    journal.record("years", "L", years=[2020, 2021])
+    journal.record(
+        "search",
+        "label:L year:2020",
+        shard={
+            "query": "label:L year:2020",
+            "total": 2,
+            "releases": [
+                {"uri": "a", "name": "a", "release_date": "2020"},
+                {"uri": "b", "name": "b", "release_date": "2020"},
+            ],
+            "saturated": False,
+            "n_refinements": 0,
+        },
     )
-    mock_filter_releases_by_date = MagicMock(
+
+    releases = m.fetch_all_releases(client, "L", journal=journal)
+
+    assert [r["uri"] for r in releases] == ["a", "b", "c"]
+    assert [c.args[0] for c in client.search.call_args_list] == ["label:L year:2021"]
+    assert journal.get("search", "label:L year:2021")["shard"]["releases"] == [
+        {"uri": "c", "name": "c", "release_date": "2020"}
+    ]
+
+    client.search.reset_mock()
+    releases = m.fetch_all_releases(client, "L", journal=journal, first_year=2021)
+
+    # A later first year reuses the journaled years from 2021 on
+    assert [r["uri"] for r in releases] == ["c"]
+    client.search.assert_not_called()
+
+
+def test_refresh_label_tops_up_last_playlist_then_creates_new(monkeypatch):
+    client = MagicMock()
+    client.me.return_value = {"id": "user1"}
+    client.current_user_playlists.return_value = {
+        "items": [
+            {
+                "name": "L 002",
+                "id": "p2",
+                "uri": "pl:2",
+                "description": "2020-03-01 - 2021-05-01",
+            },
+            {"name": "Other 003", "id": "x", "uri": "pl:x", "description": ""},
+            {
+                "name": "L 001",
+                "id": "p1",
+                "uri": "pl:1",
+                "description": "2019-01-01 - 2020-03-01",
+            },
+        ],
+        "next": None,
+    }
+    client.user_playlist_create.return_value = {
+        "external_urls": {"spotify": "http://x"},
+        "uri": "pl:3",
+    }
+
+    fetch_all_releases = MagicMock(
         return_value=[
-            {"uri": "a", "name": "Album", "label": "L", "release_date": "2020-01-01"}
+            {"uri": "old", "name": "Old", "release_date": "2021-04-30"},
+            {"uri": "a", "name": "A", "release_date": "2021-05-01"},
+            {"uri": "b", "name": "B", "release_date": "2022-01-01"},
         ]
     )
-    mock_filter_exact = MagicMock(
-        return_value=[
-            {"uri": "a", "name": "Album", "label": "L", "release_date": "2020-01-01"}
-        ]
+    monkeypatch.setattr(m, "fetch_all_releases", fetch_all_releases)
+    monkeypatch.setattr(
+        m,
+        "collect_tracks_from_albums",
+        lambda c, uris, label, **kwargs: (
+            [
+                {"uri": "t1", "release_date": "2021-05-01"},
+                {"uri": "t2", "release_date": "2021-05-01"},
+                {"uri": "t3", "release_date": "2022-01-01"},
+                {"uri": "t4", "release_date": "2022-01-01"},
+            ]
+            if uris == ["a", "b"]
+            else []
+        ),
     )
+    playlist_uris = {"pl:1": {"t3"}, "pl:2": {"t0", "t1"}}
+    monkeypatch.setattr(m, "fetch_playlist_track_uris", lambda c, p: playlist_uris[p])
 
-    monkeypatch.setattr(m, "fetch_new_releases", mock_fetch)
-    monkeypatch.setattr(m, "filter_releases_by_date", mock_filter_releases_by_date)
-    monkeypatch.setattr(m, "filter_exact_label_releases", mock_filter_exact)
+    summary = m.refresh_label(client, "L", step_size=3)
 
-    out = m.fetch_new_relevant_releases(client, "L")
-    assert out == [
-        {"uri": "a", "name": "Album", "label": "L", "release_date": "2020-01-01"}
+    # only years from the last playlist's end date are searched
+    assert fetch_all_releases.call_args.kwargs["first_year"] == 2021
+    # t1 is already in L 002 and t3 in L 001, t2 fills L 002 up, t4 goes to L 003
+    assert [c.args for c in client.playlist_add_items.call_args_list] == [
+        ("pl:2", ["t2"]),
+        ("pl:3", ["t4"]),
     ]
+    client.playlist_change_details.assert_called_once_with(
+        "p2", description="2020-03-01 - 2021-05-01"
+    )
+    assert client.user_playlist_create.call_args.args[1] == "L 003"
+    assert summary == {"releases": 2, "tracks": 2, "playlists_created": 1}
 
-    mock_fetch.assert_called_once()
-    mock_filter_releases_by_date.assert_called_once()
-    mock_filter_exact.assert_called_once()
 
+@pytest.mark.parametrize("description", ["", "my favourites", "2021-05-01 -"])
+def test_refresh_label_skips_label_with_edited_description(monkeypatch, description):
+    client = MagicMock()
+    client.current_user_playlists.return_value = {
+        "items": [
+            {"name": "L 001", "id": "p1", "uri": "pl:1", "description": description}
+        ],
+        "next": None,
+    }
+    fetch_all_releases = MagicMock()
+    monkeypatch.setattr(m, "fetch_all_releases", fetch_all_releases)
 
-def test_fetch_and_add_deduplicates_tracks_before_adding(monkeypatch):
+    summary = m.refresh_label(client, "L")
+
+    assert summary == {"releases": 0, "tracks": 0, "playlists_created": 0}
+    fetch_all_releases.assert_not_called()
+    client.playlist_add_items.assert_not_called()
+
+
+def test_fetch_and_add_deduplicates_tracks_before_adding(monkeypatch, per_label):
     client = MagicMock()
 
     # 1 label with 1 relevant release
     monkeypatch.setattr(
         m,
-        "fetch_new_relevant_releases",
-        lambda c, label: [
-            {
-                "uri": "album:1",
-                "name": "Album1",
-                "label": "L",
-                "release_date": "2020-01-01",
-            }
-        ],
+        "fetch_new_relevant_releases_by_label",
+        per_label(
+            lambda c, label: [
+                {
+                    "uri": "album:1",
+                    "name": "Album1",
+                    "label": "L",
+                    "release_date": "2020-01-01",
+                }
+            ]
+        ),
     )
 
     # album_tracks includes duplicates (same name+artists)
@@ -424,7 +1173,7 @@ def test_fetch_and_add_deduplicates_tracks_before_adding(monkeypatch):
     assert "Label" in out
 
 
-def test_fetch_and_add_track_info_is_grouped_per_album(monkeypatch):
+def test_fetch_and_add_track_info_is_grouped_per_album(monkeypatch, per_label):
     """
     Expected behavior (probably): track_info_to_send[label][album_name] contains tracks per album.
     Current code sets only one album key based on the last `track` variable.
@@ -432,15 +1181,17 @@ def test_fetch_and_add_track_info_is_grouped_per_album(monkeypatch):
     client = MagicMock()
     monkeypatch.setattr(
         m,
-        "fetch_new_relevant_releases",
-        lambda c, label: [
-            {
-                "uri": "album:1",
-                "name": "Album1",
-                "label": "L",
-                "release_date": "2020-01-01",
-            }
-        ],
+        "fetch_new_relevant_releases_by_label",
+        per_label(
+            lambda c, label: [
+                {
+                    "uri": "album:1",
+                    "name": "Album1",
+                    "label": "L",
+                    "release_date": "2020-01-01",
+                }
+            ]
+        ),
     )
 
     album_tracks = [
@@ -453,3 +1204,109 @@ def test_fetch_and_add_track_info_is_grouped_per_album(monkeypatch):
 
     out = m.fetch_and_add(client, record_labels=["Label"], target_playlist="plid")
     assert out["Label"]["Album1"] == album_tracks
+
+
+def test_fetch_track_isrcs_batches_tracks_concurrently():
+    client = MagicMock()
+    uris = [f"t{i}" for i in range(120)]
+
+    def _tracks(batch_uris):
+        return {
+            "tracks": [
+                {"uri": u, "external_ids": {"isrc": f"I{u}"}} if u != "t7" else None
+                for u in batch_uris
+            ]
+        }
+
+    client.tracks.side_effect = _tracks
+
+    isrcs = m.fetch_track_isrcs(client, uris, max_workers=3)
+
+    assert [len(c.args[0]) for c in client.tracks.call_args_list] == [50, 50, 20]
+    assert len(isrcs) == 119
+    assert isrcs["t0"] == "It0"
+
+
+def test_fetch_and_add_looks_up_isrcs_in_shared_batches(monkeypatch, per_label):
+    client = MagicMock()
+    monkeypatch.setattr(
+        m,
+        "fetch_new_relevant_releases_by_label",
+        per_label(lambda c, label: [{"uri": f"album:{label}", "name": label}]),
+    )
+    album_tracks = {
+        "album:L1": [_mk_track("Track", ["A"], "u1"), _mk_track("Track", ["A"], "u2")],
+        "album:L2": [_mk_track("Track - Remaster", ["A"], "u3")],
+    }
+    monkeypatch.setattr(m, "fetch_album_tracks", lambda c, a: album_tracks[a["uri"]])
+    isrcs = {"u1": "X1", "u2": "X2", "u3": "X1"}
+    client.tracks.side_effect = lambda uris: {
+        "tracks": [{"uri": u, "external_ids": {"isrc": isrcs[u]}} for u in uris]
+    }
+    add_mock = MagicMock()
+    monkeypatch.setattr(m, "add_to_playlist", add_mock)
+
+    out = m.fetch_and_add(client, ["L1", "L2"], "plid", max_workers=2)
+
+    # One shared lookup; within L1, u2 matches u1 by name despite its new ISRC
+    client.tracks.assert_called_once_with(["u1", "u2", "u3"])
+    assert add_mock.call_args.args[2] == ["u1", "u3"]
+    assert out["L1"]["L1"][0]["external_ids"] == {"isrc": "X1"}
+
+
+def test_resolve_near_duplicates_reports_or_collapses(caplog):
+    tracks = [
+        {
+            "uri": "t1",
+            "release_date": "2020-01-01",
+            "name": "Song",
+            "artists": ["A", "B"],
+        },
+        {"uri": "t2", "release_date": "2020-02-01", "name": "Other", "artists": ["A"]},
+        {
+            "uri": "t3",
+            "release_date": "2021-01-01",
+            "name": "Song feat. B (Original Mix)",
+            "artists": ["A", "B"],
+        },
+        {
+            "uri": "t4",
+            "release_date": "2022-01-01",
+            "name": "Song (X Remix)",
+            "artists": ["A", "B"],
+        },
+        {"uri": "t5", "release_date": "2023-01-01"},
+    ]
+
+    with caplog.at_level("INFO"):
+        reported = m.resolve_near_duplicates("L", tracks)
+    assert reported == tracks
+    assert "L: 1 near-duplicate track in 1 cluster" in caplog.text
+
+    # The earliest release of a cluster is kept; remixes are distinct tracks
+    collapsed = m.resolve_near_duplicates("L", tracks, collapse=True)
+    assert [t["uri"] for t in collapsed] == ["t1", "t2", "t4", "t5"]
+
+
+def test_resolve_near_duplicates_keeps_different_titles_of_same_artists():
+    def _track(uri, name, artists):
+        return {
+            "uri": uri,
+            "release_date": "2020-01-01",
+            "name": name,
+            "artists": artists,
+        }
+
+    tracks = [
+        _track("t1", "Signs", ["Above & Beyond", "Andrew Bayer"]),
+        _track("t2", "Alone", ["Above & Beyond", "Andrew Bayer"]),
+        _track("t3", "Opal", ["Ben Böhmer", "Nils Hoffmann"]),
+        _track("t4", "Breathing", ["Ben Böhmer", "Nils Hoffmann"]),
+        _track("t5", "Opal", ["Someone Else"]),
+        _track("t6", "Opal (VIP)", ["Nils Hoffmann"]),
+    ]
+
+    collapsed = m.resolve_near_duplicates("L", tracks, collapse=True)
+
+    # Same title needs a shared artist; VIP edit of t3 is collapsed
+    assert [t["uri"] for t in collapsed] == ["t1", "t2", "t3", "t4", "t5"]
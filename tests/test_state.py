@@ -0,0 +1,113 @@
+import sqlite3
+
+from crate_digger.utils.state import (
+    filter_unprocessed_releases,
+    find_known_fingerprints,
+    hash_fingerprint,
+    mark_release_processed,
+    open_release_store,
+    record_fingerprints,
+)
+
+
+def _mk_release(uri, release_date="2026-01-20"):
+    return {"uri": uri, "name": uri, "label": "Label", "release_date": release_date}
+
+
+def test_filter_unprocessed_releases_on_empty_store(tmp_path):
+    store = open_release_store(tmp_path / "releases.sqlite3")
+    releases = [_mk_release("a"), _mk_release("b")]
+
+    assert filter_unprocessed_releases(store, releases) == releases
+    assert filter_unprocessed_releases(store, []) == []
+
+
+def test_mark_release_processed_persists_across_connections(tmp_path):
+    db_path = tmp_path / "releases.sqlite3"
+
+    store = open_release_store(db_path)
+    mark_release_processed(store, "Label", _mk_release("a"))
+    store.close()
+
+    store = open_release_store(db_path)
+    out = filter_unprocessed_releases(store, [_mk_release("a"), _mk_release("b")])
+    assert [r["uri"] for r in out] == ["b"]
+
+
+def test_mark_release_processed_is_idempotent(tmp_path):
+    store = open_release_store(tmp_path / "releases.sqlite3")
+
+    mark_release_processed(store, "Label", _mk_release("a"))
+    mark_release_processed(store, "Label", _mk_release("a"))
+
+    assert store.execute("SELECT COUNT(*) FROM processed_releases").fetchone() == (1,)
+
+
+def test_mark_release_processed_records_rejected_candidates(tmp_path):
+    store = open_release_store(tmp_path / "releases.sqlite3")
+
+    mark_release_processed(store, "Label", _mk_release("a"))
+    mark_release_processed(store, "Label", _mk_release("b"), verified=False)
+
+    out = filter_unprocessed_releases(
+        store, [_mk_release("a"), _mk_release("b"), _mk_release("c")]
+    )
+    assert [r["uri"] for r in out] == ["c"]
+    assert store.execute(
+        "SELECT album_uri, verified FROM processed_releases ORDER BY album_uri"
+    ).fetchall() == [("a", 1), ("b", 0)]
+
+
+def test_open_release_store_adds_verified_column_to_old_stores(tmp_path):
+    db_path = tmp_path / "releases.sqlite3"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE processed_releases (album_uri TEXT PRIMARY KEY,"
+            " label TEXT NOT NULL, release_date TEXT NOT NULL,"
+            " processed_at TEXT NOT NULL)"
+        )
+        conn.execute(
+            "INSERT INTO processed_releases VALUES ('a', 'Label', '2026-01-20', 'x')"
+        )
+    conn.close()
+
+    store = open_release_store(db_path)
+    mark_release_processed(store, "Label", _mk_release("b"), verified=False)
+    store.close()
+
+    store = open_release_store(db_path)
+    assert store.execute(
+        "SELECT album_uri, verified FROM processed_releases ORDER BY album_uri"
+    ).fetchall() == [("a", 1), ("b", 0)]
+
+
+def test_hash_fingerprint_is_stable_signed_64_bit():
+    fingerprint = hash_fingerprint("track\x1fartist")
+
+    assert fingerprint == hash_fingerprint("track\x1fartist")
+    assert fingerprint != hash_fingerprint("isrc:GBAAA2600001")
+    assert -(2**63) <= fingerprint < 2**63
+
+
+def test_record_fingerprints_persists_across_connections(tmp_path):
+    db_path = tmp_path / "releases.sqlite3"
+
+    store = open_release_store(db_path)
+    assert find_known_fingerprints(store, [1, 2]) == set()
+    record_fingerprints(store, [1, 2])
+    store.close()
+
+    store = open_release_store(db_path)
+    assert find_known_fingerprints(store, [2, 3]) == {2}
+    assert find_known_fingerprints(store, []) == set()
+
+
+def test_record_fingerprints_evicts_old_entries(tmp_path):
+    store = open_release_store(tmp_path / "releases.sqlite3")
+    with store:
+        store.execute("INSERT INTO track_fingerprints VALUES (1, 0)")
+
+    n_evicted = record_fingerprints(store, [2], max_age_days=30)
+
+    assert n_evicted == 1
+    assert find_known_fingerprints(store, [1, 2]) == {2}
@@ -1,5 +1,8 @@
 from crate_digger.utils.spotify import (
     normalize_title,
+    normalize_titles,
+    track_key,
+    track_fingerprints,
     base_title,
     is_extended_version,
     dedupe_tracks,
@@ -35,6 +38,47 @@ class TestNormalizeTitle:
     def test_handles_only_symbols(self):
         assert normalize_title("!!!---???") == ""
 
+    def test_memoizes_repeated_titles(self):
+        normalize_title.cache_clear()
+        normalize_title("Memo Track (Extended Mix)")
+        normalize_title("Memo Track (Extended Mix)")
+
+        info = normalize_title.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_normalizes_batches_in_order(self):
+        assert normalize_titles(["B!", "a  A", "B!"]) == ["b", "a a", "b"]
+
+
+class TestTrackKey:
+    def test_normalizes_title_and_artists(self):
+        assert track_key(_mk_track("Track (Edit)!", "The  Artist", "u1")) == (
+            "track edit",
+            ("the artist",),
+        )
+
+
+class TestTrackFingerprints:
+    def test_matches_on_normalized_title_and_artists(self):
+        a = track_fingerprints(_mk_track("Track!", "Artist", "u1"))
+        b = track_fingerprints(_mk_track("track", "ARTIST", "u2"))
+
+        assert a == b
+        assert len(a) == 1
+
+    def test_adds_isrc_fingerprint_when_known(self):
+        track = dict(
+            _mk_track("Track", "A", "u1"), external_ids={"isrc": "gbaaa2600001"}
+        )
+        remaster = dict(
+            _mk_track("Track Remastered", "A", "u2"),
+            external_ids={"isrc": "GBAAA2600001"},
+        )
+
+        assert len(track_fingerprints(track)) == 2
+        assert track_fingerprints(track)[1] == track_fingerprints(remaster)[1]
+        assert track_fingerprints(track)[0] != track_fingerprints(remaster)[0]
+
 
 class TestBaseTitle:
     def test_removes_extended_mix(self):
@@ -104,6 +148,14 @@ class TestDedupeTracksFunction:
         result = dedupe_tracks(tracks)
         assert len(result) == 1
 
+    def test_ignores_punctuation_differences(self):
+        tracks = [
+            _mk_track("Track - Edit", "Artist", "u1"),
+            _mk_track("Track (Edit)", "Artist", "u2"),
+        ]
+        result = dedupe_tracks(tracks)
+        assert [t["uri"] for t in result] == ["u1"]
+
     def test_handles_multiple_artists(self):
         tracks = [
             _mk_track("Track", "A B", "u1"),
@@ -124,6 +176,36 @@ class TestDedupeTracksFunction:
         result = dedupe_tracks(tracks)
         assert [t["uri"] for t in result] == ["u1", "u2"]
 
+    def test_dedupes_on_isrc_across_spellings(self):
+        tracks = [
+            dict(_mk_track("Track", "Artist", "u1"), external_ids={"isrc": "X1"}),
+            dict(
+                _mk_track("Track (Remix)", "Artist", "u2"), external_ids={"isrc": "x1"}
+            ),
+        ]
+        result = dedupe_tracks(tracks)
+        assert [t["uri"] for t in result] == ["u1"]
+
+    def test_dedupes_on_name_across_isrcs(self):
+        tracks = [
+            dict(_mk_track("Track", "Artist", "u1"), external_ids={"isrc": "X1"}),
+            dict(_mk_track("Track", "Artist", "u2"), external_ids={"isrc": "X2"}),
+            _mk_track("Track", "Artist", "u3"),
+            _mk_track("Other", "Artist", "u4"),
+        ]
+        result = dedupe_tracks(tracks)
+        assert [t["uri"] for t in result] == ["u1", "u4"]
+
+    def test_dedupes_track_without_isrc_against_track_with_one(self):
+        tracks = [
+            _mk_track("Track", "Artist", "u1"),
+            dict(_mk_track("Track", "Artist", "u2"), external_ids={"isrc": "X1"}),
+            dict(_mk_track("Track (Dub)", "Artist", "u3"), external_ids={"isrc": "X1"}),
+        ]
+        result = dedupe_tracks(tracks)
+        # u2 matches u1 by name, u3 matches u2 by ISRC
+        assert [t["uri"] for t in result] == ["u1"]
+
 
 class TestBatchFunction:
     def test_batches_evenly_divisible(self):